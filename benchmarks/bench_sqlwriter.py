@@ -0,0 +1,111 @@
+"""End-to-end rows/sec for the SQL writers, loading into in-memory SQLite.
+
+    PYTHONPATH=src python3 benchmarks/bench_sqlwriter.py --rows 100000
+
+SQLite has no COPY, so the COPY stream is parsed back into rows and bulk
+inserted with executemany, which is roughly what a server does with it.
+"""
+import argparse
+import re
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, "src")
+
+import dataset
+import sqlwriter
+
+COPY_UNESCAPES = {"\\": "\\", "t": "\t", "n": "\n", "r": "\r"}
+COPY_ESCAPE = re.compile(r"\\(.)")
+
+
+def build_rows(count):
+    schema = {
+        "tables": {
+            "users": {
+                "rows": count,
+                "columns": {
+                    "email": "email 12",
+                    "username": "username",
+                    "signup": "timestamp",
+                    "score": "num 1 1000 zipf",
+                },
+            }
+        }
+    }
+    columns = dataset.header("users", schema)
+    rows = [row for chunk in dataset.iter_rows("users", schema, {}) for row in chunk]
+    # One row exercising every escape, so the round-trip check covers them
+    rows.append((count + 1, "a\\nb\\\\t@x.com", "tab\there", "new\nline\r", None))
+    return columns, rows
+
+
+def fresh_connection(columns):
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE users ({})".format(", ".join(f'"{c}"' for c in columns)))
+    return conn
+
+
+def load_statements(conn, statements):
+    for statement in statements:
+        conn.execute(statement)
+
+
+def load_copy(conn, columns, lines):
+    next(lines)  # COPY header
+    placeholders = ", ".join("?" * len(columns))
+
+    def parse():
+        for line in lines:
+            if line == "\\.\n":
+                return
+            fields = line[:-1].split("\t")
+            yield [
+                None if f == "\\N" else _unescape(f) if "\\" in f else f for f in fields
+            ]
+
+    conn.executemany(f"INSERT INTO users VALUES ({placeholders})", parse())
+
+
+def _unescape(field):
+    # Single pass, so an escaped backslash followed by "n" stays "\\n"
+    return COPY_ESCAPE.sub(lambda match: COPY_UNESCAPES.get(match.group(1), match.group(1)), field)
+
+
+def run(name, columns, rows, load, exact=True):
+    conn = fresh_connection(columns)
+    started = time.perf_counter()
+    load(conn)
+    conn.commit()
+    elapsed = time.perf_counter() - started
+    loaded = [tuple(map(str, row)) for row in conn.execute("SELECT * FROM users ORDER BY rowid")]
+    assert len(loaded) == len(rows), f"{name} loaded {len(loaded)} of {len(rows)} rows"
+    if exact:
+        assert loaded == [tuple(map(str, row)) for row in rows], f"{name} changed row values"
+    print(f"{name:<28} {len(rows) / elapsed:>12,.0f} rows/sec  ({elapsed:.2f}s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--batch-size", type=int, default=sqlwriter.BATCH_SIZE)
+    args = parser.parse_args()
+
+    columns, rows = build_rows(args.rows)
+    print(f"{args.rows:,} rows, batch size {args.batch_size}")
+
+    run("single-row INSERT", columns, rows, lambda conn: load_statements(
+        conn, sqlwriter.insert_statements("users", columns, rows, "sqlite", 1)))
+    for dialect in sqlwriter.DIALECTS:
+        # MySQL backtick and PostgreSQL double quote identifiers both parse in SQLite,
+        # but SQLite keeps MySQL's doubled backslashes, so only the row count is checked
+        run(f"multi-row INSERT ({dialect})", columns, rows, lambda conn, d=dialect: load_statements(
+            conn, sqlwriter.insert_statements("users", columns, rows, d, args.batch_size)),
+            exact=dialect != "mysql")
+    run("COPY text stream", columns, rows, lambda conn: load_copy(
+        conn, columns, sqlwriter.copy_lines("users", columns, rows)))
+
+
+if __name__ == "__main__":
+    main()
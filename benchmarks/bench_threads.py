@@ -0,0 +1,60 @@
+"""Values/sec from 1 to N threads calling the same generators.
+
+    PYTHONPATH=src python3 benchmarks/bench_threads.py --count 200000
+
+Each thread draws from its own RNG, so there is no shared state to contend
+on. On a GIL build only work that releases the GIL (os.urandom, NumPy)
+overlaps; on a free-threaded build the pure-Python generators scale too.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, "src")
+
+from parallel import generate_parallel
+
+SPECS = ["uuid", "hash", "num 1 1000", "email 12", "password 16 1"]
+
+
+def thread_counts(limit):
+    counts, threads = [], 1
+    while threads < limit:
+        counts.append(threads)
+        threads *= 2
+    return counts + [limit]
+
+
+def run(spec, count, threads, chunk_size):
+    name, *args = spec.split()
+    with ThreadPoolExecutor(threads) as pool:
+        started = time.perf_counter()
+        values = generate_parallel(name, count, *args, chunk_size=chunk_size, executor=pool)
+        elapsed = time.perf_counter() - started
+    assert len(values) == count
+    return count / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--count", type=int, default=200000)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("specs", nargs="*", default=SPECS)
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"{args.count:,} values per run, GIL {'enabled' if gil else 'disabled'}")
+    counts = thread_counts(args.threads)
+    print(f"{'generator':<16}" + "".join(f"{n:>10} thr" for n in counts))
+    for spec in args.specs:
+        rates = [run(spec, args.count, threads, args.chunk_size) for threads in counts]
+        cells = "".join(f"{rate:>12,.0f}/s" if i == 0 else f"{rate / rates[0]:>13.2f}x"
+                        for i, rate in enumerate(rates))
+        print(f"{spec:<16}{cells}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,227 @@
+import socket
+from array import array
+
+import generators
+from main import generate_batch
+
+try:
+    import pyarrow as pa
+    import pyarrow.ipc
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pa = None
+
+
+def _format_uuid(raw):
+    h = raw.hex()
+    return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+
+
+# Codec name -> (bytes -> str) used for the lazy string view
+DECODERS = {
+    "ascii": lambda raw: raw.decode("ascii"),
+    "utf-8": lambda raw: raw.decode("utf-8"),
+    "hex": bytes.hex,
+    "ipv4": socket.inet_ntoa,
+    "uuid": _format_uuid,
+}
+
+# Patch version 4 / RFC 4122 variant bits into raw UUID bytes via translate()
+_UUID_VERSION = bytes((b & 0x0F) | 0x40 for b in range(256))
+_UUID_VARIANT = bytes((b & 0x3F) | 0x80 for b in range(256))
+
+
+class FixedColumn:
+    """Fixed-width values packed back to back in one contiguous buffer"""
+
+    def __init__(self, width, data=b"", codec="ascii"):
+        if len(data) % width:
+            raise ValueError(f"buffer size {len(data)} is not a multiple of width {width}")
+        self.width = width
+        self.data = bytearray(data)
+        self.codec = codec
+        self._decode = DECODERS[codec]
+
+    def __len__(self):
+        return len(self.data) // self.width
+
+    def raw(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("column index out of range")
+        start = index * self.width
+        return bytes(self.data[start : start + self.width])
+
+    def __getitem__(self, index):
+        return self._decode(self.raw(index))
+
+    def __iter__(self):
+        decode, data, width = self._decode, bytes(self.data), self.width
+        for start in range(0, len(data), width):
+            yield decode(data[start : start + width])
+
+    def append(self, value):
+        if len(value) != self.width:
+            raise ValueError(f"expected {self.width} bytes, got {len(value)}")
+        self.data += value
+
+    @property
+    def nbytes(self):
+        return len(self.data)
+
+    def memoryview(self):
+        """Zero-copy (rows, width) view of the buffer (flat when empty: no zero dimensions)"""
+        if not len(self):
+            return memoryview(self.data)
+        return memoryview(self.data).cast("B", (len(self), self.width))
+
+
+class VarColumn:
+    """Variable-width values as an int64 offsets array plus one data buffer"""
+
+    def __init__(self, offsets=None, data=b"", codec="utf-8"):
+        self.offsets = array("q", offsets if offsets is not None else [0])
+        self.data = bytearray(data)
+        self.codec = codec
+        self._decode = DECODERS[codec]
+
+    @classmethod
+    def from_strings(cls, values, codec="utf-8"):
+        encoded = [value.encode(codec) for value in values]
+        offsets = array("q", [0])
+        total = 0
+        for value in encoded:
+            total += len(value)
+            offsets.append(total)
+        return cls(offsets, b"".join(encoded), codec)
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def raw(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("column index out of range")
+        return bytes(self.data[self.offsets[index] : self.offsets[index + 1]])
+
+    def __getitem__(self, index):
+        return self._decode(self.raw(index))
+
+    def __iter__(self):
+        decode, data, offsets = self._decode, bytes(self.data), self.offsets
+        for i in range(len(self)):
+            yield decode(data[offsets[i] : offsets[i + 1]])
+
+    def append(self, value):
+        self.data += value
+        self.offsets.append(len(self.data))
+
+    @property
+    def nbytes(self):
+        return len(self.data) + self.offsets.itemsize * len(self.offsets)
+
+    def memoryview(self):
+        """Zero-copy views of the offsets and data buffers"""
+        return memoryview(self.offsets), memoryview(self.data)
+
+
+def column(name, count, arg1=None, arg2=None, arg3=None):
+    """Generate `count` values of a registry generator straight into a column"""
+    random_bytes = generators.random_bytes
+
+    if name == "uuid":
+        data = bytearray(random_bytes(16 * count))
+        data[6::16] = bytes(data[6::16]).translate(_UUID_VERSION)
+        data[8::16] = bytes(data[8::16]).translate(_UUID_VARIANT)
+        return FixedColumn(16, data, "uuid")
+    if name == "hash":
+        return FixedColumn(32, random_bytes(32 * count), "hex")
+    if name == "apikey" and int(arg1 or 32) > 0 and int(arg1 or 32) % 2 == 0:
+        width = int(arg1 or 32) // 2
+        return FixedColumn(width, random_bytes(width * count), "hex")
+    if name == "ipv4" and not arg1:
+        return FixedColumn(4, random_bytes(4 * count), "ipv4")
+
+    values = generate_batch(name, count, arg1, arg2, arg3)
+    widths = set(map(len, values))
+    # All-empty values (length 0) have no fixed width to pack them at
+    if len(widths) == 1 and 0 not in widths and all(value.isascii() for value in values):
+        return FixedColumn(widths.pop(), "".join(values).encode("ascii"), "ascii")
+    return VarColumn.from_strings(values)
+
+
+class Table:
+    """Named columns of equal length with tuple row access"""
+
+    def __init__(self, columns):
+        lengths = {len(col) for col in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError("columns must all have the same length")
+        self.columns = dict(columns)
+
+    def __len__(self):
+        return len(next(iter(self.columns.values()))) if self.columns else 0
+
+    def __getitem__(self, index):
+        if isinstance(index, str):
+            return self.columns[index]
+        return tuple(col[index] for col in self.columns.values())
+
+    def __iter__(self):
+        return zip(*self.columns.values())
+
+    @property
+    def nbytes(self):
+        return sum(col.nbytes for col in self.columns.values())
+
+
+def generate_table(spec, count):
+    """Build a Table from {"column": "generator arg1 arg2 arg3"} specs"""
+    columns = {}
+    for name, generator in spec.items():
+        generator, *args = generator.split()
+        columns[name] = column(generator, count, *args[:3])
+    return Table(columns)
+
+
+def to_npy(col, path):
+    """Write a FixedColumn as a .npy array of fixed-size byte strings (no NumPy needed)"""
+    if not isinstance(col, FixedColumn):
+        raise ValueError(".npy export needs a fixed-width column")
+    descr = f"|S{col.width}" if col.codec == "ascii" else f"|V{col.width}"
+    header = repr({"descr": descr, "fortran_order": False, "shape": (len(col),)})
+    # Pad so the data starts on a 64-byte boundary, as the format requires
+    padding = 64 - (10 + len(header) + 1) % 64
+    header = (header + " " * padding + "\n").encode("latin1")
+    with open(path, "wb") as handle:
+        handle.write(b"\x93NUMPY\x01\x00" + len(header).to_bytes(2, "little") + header)
+        handle.write(col.memoryview())
+
+
+def to_arrow(col):
+    """Wrap a column's buffers as a pyarrow Array without copying"""
+    if pa is None:
+        raise ImportError("Arrow export requires pyarrow")
+    if isinstance(col, FixedColumn) and col.codec != "ascii":
+        # Packed binary (UUIDs, hashes, addresses) stays compact as fixed_size_binary
+        return pa.Array.from_buffers(pa.binary(col.width), len(col), [None, pa.py_buffer(col.data)])
+    if isinstance(col, FixedColumn):
+        # Fixed-width text becomes a string array over the same data buffer
+        offsets = array("q", range(0, col.nbytes + 1, col.width))
+    else:
+        offsets = col.offsets
+    return pa.Array.from_buffers(
+        pa.large_string(), len(col), [None, pa.py_buffer(offsets), pa.py_buffer(col.data)]
+    )
+
+
+def write_arrow(table, path):
+    """Write a Table as an Arrow IPC file (readable by pyarrow, polars, DuckDB...)"""
+    if pa is None:
+        raise ImportError("Arrow export requires pyarrow")
+    batch = pa.record_batch(
+        [to_arrow(col) for col in table.columns.values()], names=list(table.columns)
+    )
+    with pa.OSFile(path, "wb") as sink, pa.ipc.new_file(sink, batch.schema) as writer:
+        writer.write_batch(batch)
@@ -0,0 +1,277 @@
+"""Schema-driven relational fixtures built from the GENERATORS registry.
+
+A schema names tables, their row counts and columns. Every table gets a
+counter-based integer key (1..rows), so child tables reference parents by
+key range alone and no parent rows are ever kept in memory:
+
+    {
+        "tables": {
+            "users": {"rows": 1000, "columns": {"email": "email 12"}},
+            "orders": {
+                "parent": "users",
+                "per_parent": [1, 20],
+                "columns": {
+                    "total": "num 1 500 lognormal",
+                    "coupon_owner": {"ref": "users", "dist": "zipf"}
+                }
+            }
+        }
+    }
+
+Columns are either a "generator arg1 arg2 arg3" string (same semantics as
+the Alfred arguments), {"generator": name, "kwargs": {...}} to pass keyword
+arguments such as weight tables, or {"ref": table} for a random key of an
+already generated table. A table may reference itself (e.g. a manager
+column): a root table draws from all of its keys, a child table from the
+keys generated so far.
+"""
+import argparse
+import csv
+import inspect
+import json
+import os
+import sys
+from functools import partial
+
+import distributions
+import sqlwriter
+from generators import current_rng
+from main import BATCH_GENERATORS, GENERATORS, NETWORK, generate_batch, generator_kwargs
+
+CHUNK_SIZE = 10000
+
+
+def load_schema(path):
+    with open(path, encoding="utf-8") as handle:
+        return json.load(handle)
+
+
+def _dependencies(name, table):
+    deps = set()
+    if "parent" in table:
+        deps.add(table["parent"])
+    for spec in table.get("columns", {}).values():
+        if isinstance(spec, dict) and "ref" in spec:
+            deps.add(spec["ref"])
+    # Self-references are resolved while the table is generated
+    deps.discard(name)
+    return deps
+
+
+def table_order(schema):
+    """Tables in dependency order (parents and referenced tables first)"""
+    tables = schema["tables"]
+    pending = {name: _dependencies(name, table) for name, table in tables.items()}
+
+    for name, deps in pending.items():
+        unknown = deps - tables.keys()
+        if unknown:
+            raise ValueError(f"table '{name}' references unknown tables: {sorted(unknown)}")
+
+    order = []
+    while pending:
+        ready = sorted(name for name, deps in pending.items() if not deps)
+        if not ready:
+            raise ValueError(f"circular table references: {sorted(pending)}")
+        for name in ready:
+            del pending[name]
+            order.append(name)
+        for deps in pending.values():
+            deps.difference_update(ready)
+    return order
+
+
+def _check_column(spec):
+    if isinstance(spec, str):
+        name, *args = spec.split() or [""]
+        if name not in GENERATORS:
+            raise ValueError(f"unknown generator '{name}'")
+        kwargs = generator_kwargs(name, *args[:3])
+    elif isinstance(spec, dict) and "ref" in spec:
+        distributions.parse_distribution(spec.get("dist"))
+        return
+    elif isinstance(spec, dict) and "generator" in spec:
+        name, kwargs = spec["generator"], spec.get("kwargs", {})
+        if name not in GENERATORS:
+            raise ValueError(f"unknown generator '{name}'")
+        if not isinstance(kwargs, dict):
+            raise ValueError("kwargs must be an object")
+        inspect.signature(GENERATORS[name]).bind(**kwargs)
+    else:
+        raise ValueError("expected a generator string, 'generator' or 'ref'")
+
+    if kwargs.get("dist"):
+        distributions.parse_distribution(kwargs["dist"])
+    if name in NETWORK and kwargs.get("network"):
+        # Parsing the network is the part that can fail; one address is cheap
+        GENERATORS[name](**kwargs)
+
+
+def validate_schema(schema):
+    """Check a schema without generating it (raises ValueError); returns the table order"""
+    order = table_order(schema)
+    for name, table in schema["tables"].items():
+        if "parent" not in table and not isinstance(table.get("rows"), int):
+            raise ValueError(f"table '{name}' needs an integer 'rows' or a 'parent'")
+        per_parent = table.get("per_parent", 1)
+        if isinstance(per_parent, int):
+            per_parent = [per_parent, per_parent]
+        if not (isinstance(per_parent, list) and 2 <= len(per_parent) <= 3
+                and all(isinstance(n, int) for n in per_parent[:2])):
+            raise ValueError(f"table '{name}': per_parent must be N or [low, high, dist]")
+        if len(per_parent) > 2:
+            distributions.parse_distribution(per_parent[2])
+
+        for column, spec in table.get("columns", {}).items():
+            try:
+                _check_column(spec)
+            except (ValueError, TypeError) as error:
+                raise ValueError(f"{name}.{column}: {error}")
+    return order
+
+
+def _column_values(spec, count, row_counts):
+    if isinstance(spec, str):
+        name, *args = spec.split()
+        if name not in GENERATORS:
+            raise ValueError(f"unknown generator '{name}'")
+        return generate_batch(name, count, *args[:3])
+
+    if "ref" in spec:
+        return distributions.sample_many(spec.get("dist"), 1, row_counts[spec["ref"]], count, current_rng())
+
+    name = spec["generator"]
+    kwargs = spec.get("kwargs", {})
+    if name in BATCH_GENERATORS:
+        return BATCH_GENERATORS[name](count, **kwargs)
+    generator = GENERATORS[name]
+    return [generator(**kwargs) for _ in range(count)]
+
+
+def _parent_keys(parent_rows, per_parent, chunk_size):
+    """Yield chunks of parent keys, one entry per child row"""
+    if isinstance(per_parent, int):
+        per_parent = [per_parent, per_parent]
+    low, high = per_parent[0], per_parent[1]
+    dist = per_parent[2] if len(per_parent) > 2 else None
+
+    keys = []
+    parent = 1
+    while parent <= parent_rows:
+        batch = min(chunk_size, parent_rows - parent + 1)
+        counts = distributions.sample_many(dist, low, high, batch, current_rng())
+        for key, count in enumerate(counts, parent):
+            keys.extend([key] * count)
+        parent += batch
+        while len(keys) >= chunk_size:
+            yield keys[:chunk_size]
+            del keys[:chunk_size]
+    if keys:
+        yield keys
+
+
+def header(name, schema):
+    """Column names for a table: key, optional foreign key, then data columns"""
+    table = schema["tables"][name]
+    columns = [table.get("key", "id")]
+    if "parent" in table:
+        columns.append(table.get("foreign_key", f"{table['parent']}_id"))
+    return columns + list(table.get("columns", {}))
+
+
+def iter_rows(name, schema, row_counts, chunk_size=CHUNK_SIZE):
+    """Yield lists of row tuples for one table; its row count is final once exhausted"""
+    table = schema["tables"][name]
+    specs = list(table.get("columns", {}).values())
+
+    if "parent" in table:
+        parent_rows = row_counts[table["parent"]]
+        key_chunks = _parent_keys(parent_rows, table.get("per_parent", 1), chunk_size)
+        chunks = ((len(keys), keys) for keys in key_chunks)
+    else:
+        rows = table["rows"]
+        chunks = ((min(chunk_size, rows - start), None) for start in range(0, rows, chunk_size))
+
+    next_key = 1
+    for count, parent_keys in chunks:
+        # Keys a self-reference may point at: all of them when the size is known
+        row_counts[name] = table["rows"] if parent_keys is None else next_key + count - 1
+        columns = [range(next_key, next_key + count)]
+        if parent_keys is not None:
+            columns.append(parent_keys)
+        columns.extend(_column_values(spec, count, row_counts) for spec in specs)
+        next_key += count
+        yield list(zip(*columns))
+
+    row_counts[name] = next_key - 1
+
+
+def generate(schema, chunk_size=CHUNK_SIZE):
+    """Yield (table, header, chunks) in dependency order.
+
+    Each table's chunks must be consumed before moving to the next table,
+    since child tables need the parent's final row count.
+    """
+    row_counts = {}
+    for name in table_order(schema):
+        yield name, header(name, schema), iter_rows(name, schema, row_counts, chunk_size)
+
+
+def write_csv(handle, name, columns, chunks):
+    writer = csv.writer(handle)
+    writer.writerow(columns)
+    rows = 0
+    for chunk in chunks:
+        writer.writerows(chunk)
+        rows += len(chunk)
+    return rows
+
+
+def write_jsonl(handle, name, columns, chunks):
+    dumps = json.dumps
+    rows = 0
+    for chunk in chunks:
+        handle.write("".join(dumps(dict(zip(columns, row))) + "\n" for row in chunk))
+        rows += len(chunk)
+    return rows
+
+
+# Output format -> (file extension, writer(handle, table, columns, chunks) -> rows)
+WRITERS = {
+    "csv": ("csv", write_csv),
+    "jsonl": ("jsonl", write_jsonl),
+    "sqlite": ("sql", partial(sqlwriter.write_inserts, dialect="sqlite")),
+    "postgresql": ("sql", partial(sqlwriter.write_inserts, dialect="postgresql")),
+    "mysql": ("sql", partial(sqlwriter.write_inserts, dialect="mysql")),
+    "copy": ("sql", sqlwriter.write_copy),
+}
+
+
+def write_dataset(schema, directory, fmt="csv", chunk_size=CHUNK_SIZE):
+    """Stream every table to `directory/<table>.<ext>`; returns rows per table"""
+    extension, writer = WRITERS[fmt]
+    validate_schema(schema)
+    os.makedirs(directory, exist_ok=True)
+    written = {}
+    for name, columns, chunks in generate(schema, chunk_size):
+        path = os.path.join(directory, f"{name}.{extension}")
+        with open(path, "w", newline="", encoding="utf-8") as handle:
+            written[name] = writer(handle, name, columns, chunks)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate linked tables from a JSON schema")
+    parser.add_argument("schema", help="path to the JSON schema")
+    parser.add_argument("directory", help="output directory, one file per table")
+    parser.add_argument("--format", choices=sorted(WRITERS), default="csv")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    written = write_dataset(load_schema(args.schema), args.directory, args.format, args.chunk_size)
+    for name, rows in written.items():
+        print(f"{name}: {rows} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,23 +1,128 @@
 from uuid import uuid4
 from string import ascii_lowercase, ascii_uppercase, digits, punctuation
-from random import choice, randint, uniform
 from datetime import datetime, timedelta
 from base64 import b64encode
+from array import array
+from contextlib import contextmanager
+from functools import lru_cache
+import os
+import random
+import threading
 import time
 
+from network import format_ipv4, format_ipv6, format_mac, ip_space, mac_space
+from weighted import alias_table, EMAIL_DOMAINS, COUNTRY_CODES
+import distributions
+import text
+
 LETTER_VALUES = dict(zip(ascii_uppercase, filter(lambda i: i % 11, range(10, 39))))
 
+# Generators draw from current_rng(): a random.Random private to the calling
+# thread, so concurrent callers never share (or contend on) RNG state.
+# use_rng() swaps in another instance (e.g. a seeded one) for the current thread
+_rng_override = threading.local()
+_thread_rng = threading.local()
+
+
+def current_rng():
+    return getattr(_rng_override, "rng", None) or getattr(_thread_rng, "rng", None) or reseed()
+
+
+def reseed():
+    """Give the current thread a freshly seeded RNG"""
+    rng = _thread_rng.rng = random.Random(os.urandom(32))
+    return rng
+
+
+# A forked child would otherwise replay its parent's RNG stream
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=reseed)
+
+
+@contextmanager
+def use_rng(rng):
+    """Route generator randomness through `rng` inside the block (this thread only)"""
+    previous = getattr(_rng_override, "rng", None)
+    _rng_override.rng = rng
+    try:
+        yield rng
+    finally:
+        _rng_override.rng = previous
+
+
+def random_bytes(count):
+    """`count` random bytes from the current RNG (seedable, unlike os.urandom)"""
+    if count <= 0:
+        return b""
+    return current_rng().getrandbits(8 * count).to_bytes(count, "little")
+
+
+# Characters that are easily confused with each other when read or typed
+AMBIGUOUS_CHARS = "Il1|O0o"
+
+
+@lru_cache(maxsize=64)
+def _alphabet_table(alphabet):
+    # Map each byte b to alphabet[b % n], deleting the top 256 % n byte values
+    # so every character is equally likely (no modulo bias)
+    n = len(alphabet)
+    limit = 256 - 256 % n
+    table = bytes(ord(alphabet[b % n]) if b < limit else 0 for b in range(256))
+    return table, bytes(range(limit, 256))
+
+
+def _alphabet_bytes(alphabet, count, randbytes=os.urandom):
+    """`count` characters drawn uniformly from an ASCII alphabet, as bytes"""
+    table, delete = _alphabet_table(alphabet)
+    # Oversample by the expected rejection rate to usually need one draw
+    need = count + count * len(delete) // 256 + 16
+    result = b""
+    while len(result) < count:
+        result += randbytes(need).translate(table, delete)
+    return result[:count]
+
 
 def random_string(length=10):
-    return "".join(choice(ascii_lowercase + ascii_uppercase) for _ in range(length))
+    rng = current_rng()
+    return "".join(rng.choice(ascii_lowercase + ascii_uppercase) for _ in range(length))
+
+
+def _fixed_strings(alphabet, count, length):
+    """`count` strings of `length` characters from one table-driven draw"""
+    if length <= 0:
+        return [""] * count
+    data = _alphabet_bytes(alphabet, count * length, random_bytes).decode("ascii")
+    return [data[i : i + length] for i in range(0, count * length, length)]
+
 
+def random_string_batch(count, length=10):
+    return _fixed_strings(ascii_lowercase + ascii_uppercase, count, length)
 
-def random_email(length=10):
+
+def _weights(table, default):
+    return default if table == "default" else table
+
+
+def random_email(length=10, domains=None):
+    """Random email; `domains` is an optional weight table (dict, pairs, CSV path or "default")"""
+    if domains is not None:
+        domain = alias_table(_weights(domains, EMAIL_DOMAINS)).sample(current_rng())
+        return "".join([random_string(length).lower(), "@", domain])
     return "".join([random_string(length), "@", random_string(7), ".com"]).lower()
 
 
+def random_email_batch(count, length=10, domains=None):
+    # random_email lowercases a mixed-case string, so draw from lowercase directly
+    names = _fixed_strings(ascii_lowercase, count, length)
+    if domains is not None:
+        picked = alias_table(_weights(domains, EMAIL_DOMAINS)).sample_many(count, current_rng())
+        return [f"{name}@{domain}" for name, domain in zip(names, picked)]
+    return [f"{name}@{domain}.com" for name, domain in zip(names, _fixed_strings(ascii_lowercase, count, 7))]
+
+
 def random_imei(length=14):
-    imei = [randint(0, 9) for _ in range(length)]
+    rng = current_rng()
+    imei = [rng.randint(0, 9) for _ in range(length)]
 
     tmp = []
 
@@ -31,19 +136,55 @@ def random_imei(length=14):
     return "".join(map(str, imei))
 
 
-def random_number(length=5):
-    return "".join(str(randint(0, 9)) for _ in range(length))
+# ASCII digit -> its value, and -> digit sum of twice its value (Luhn doubling)
+_DIGIT_VALUES = bytes.maketrans(b"0123456789", bytes(range(10)))
+_LUHN_DOUBLED = bytes.maketrans(b"0123456789", bytes([0, 2, 4, 6, 8, 1, 3, 5, 7, 9]))
+
+
+def random_imei_batch(count, length=14):
+    if length <= 0:
+        # Like random_imei: just the check digit of an empty body
+        return ["0"] * count
+    body = _alphabet_bytes(digits, count * length, random_bytes)
+    results = []
+    for start in range(0, count * length, length):
+        imei = body[start : start + length]
+        total = sum(imei[0::2].translate(_DIGIT_VALUES)) + sum(imei[1::2].translate(_LUHN_DOUBLED))
+        results.append(imei.decode("ascii") + str((total * 9) % 10))
+    return results
+
+
+def random_number(length=5, start=None, end=None, dist=None):
+    """Digit string of `length`, or an integer in [start, end]; `dist` skews the draw"""
+    rng = current_rng()
+    if start is not None and end is not None:
+        return str(distributions.sample(dist, int(start), int(end), rng))
+    if dist and length > 0:
+        return str(distributions.sample(dist, 0, 10**length - 1, rng)).zfill(length)
+    return "".join(str(rng.randint(0, 9)) for _ in range(length))
+
+
+def random_number_batch(count, length=5, start=None, end=None, dist=None):
+    rng = current_rng()
+    if start is not None and end is not None:
+        values = distributions.sample_many(dist, int(start), int(end), count, rng)
+        return list(map(str, values))
+    if length <= 0:
+        return [""] * count
+    values = distributions.sample_many(dist, 0, 10**length - 1, count, rng)
+    return [str(v).zfill(length) for v in values]
 
 
 def random_unit_number(length=6):
+    rng = current_rng()
     unit_number = [
-        choice(ascii_uppercase),
-        choice(ascii_uppercase),
-        choice(ascii_uppercase),
-        choice("UJZ")
+        rng.choice(ascii_uppercase),
+        rng.choice(ascii_uppercase),
+        rng.choice(ascii_uppercase),
+        rng.choice("UJZ")
     ]
     # Add the numeric digits
-    unit_number.extend([randint(0, 9) for _ in range(length)])
+    unit_number.extend([rng.randint(0, 9) for _ in range(length)])
 
     values = list(map(lambda d: int(LETTER_VALUES.get(d, d)), unit_number))
     checksum = sum(d * 2**i for i, d in enumerate(values)) % 11
@@ -59,73 +200,227 @@ def random_uuid():
     return str(uuid4())
 
 
-def random_ipv4():
-    return ".".join(str(randint(0, 255)) for _ in range(4))
+# Random hex digit -> RFC 4122 variant digit (10xx), keeping the low two bits
+_UUID_VARIANT = {d: "89ab"[int(d, 16) & 3] for d in "0123456789abcdef"}
+
+
+def random_uuid_batch(count):
+    """`count` UUID4 strings sliced from one urandom buffer, no UUID objects"""
+    h = os.urandom(16 * count).hex()
+    variant = _UUID_VARIANT
+    return [
+        f"{h[i:i + 8]}-{h[i + 8:i + 12]}-4{h[i + 13:i + 16]}-"
+        f"{variant[h[i + 16]]}{h[i + 17:i + 20]}-{h[i + 20:i + 32]}"
+        for i in range(0, 32 * count, 32)
+    ]
+
+
+# Time-ordered IDs keep per-process state so values only ever increase
+_time_ordered_lock = threading.Lock()
+_uuid7_state = [0, 0]  # last millisecond, 12-bit counter
+_ulid_state = [0, 0]  # last millisecond, 80-bit random part
+
+CROCKFORD = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+# Every 10-bit value as two Crockford base32 characters
+_CROCKFORD_PAIRS = [a + b for a in CROCKFORD for b in CROCKFORD]
+
+
+def _now_ms():
+    return time.time_ns() // 1000000
+
 
+def random_uuid7_batch(count):
+    """UUIDv7 strings, monotonic within a millisecond via a 12-bit counter (RFC 9562)"""
+    rand_b = array("Q", os.urandom(8 * count))
+    results = []
+    with _time_ordered_lock:
+        last, counter = _uuid7_state
+        now = _now_ms()
+        for i in range(count):
+            if now > last:
+                # New millisecond: random start with headroom for increments
+                last, counter = now, int.from_bytes(os.urandom(2), "big") & 0x7FF
+            else:
+                counter += 1
+                if counter > 0xFFF:
+                    # Counter exhausted: borrow the next millisecond
+                    last, counter = last + 1, 0
+            value = (
+                (last << 80)
+                | (0x7 << 76)
+                | (counter << 64)
+                | (0x2 << 62)
+                | (rand_b[i] & 0x3FFFFFFFFFFFFFFF)
+            )
+            h = f"{value:032x}"
+            results.append(f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}")
+        _uuid7_state[:] = last, counter
+    return results
 
-def random_ipv6():
-    return ":".join(f"{randint(0, 65535):04x}" for _ in range(8))
+
+def random_uuid7():
+    return random_uuid7_batch(1)[0]
+
+
+def random_ulid_batch(count):
+    """ULIDs (Crockford base32), monotonic within a millisecond by incrementing"""
+    pairs = _CROCKFORD_PAIRS
+    results = []
+    with _time_ordered_lock:
+        last, randomness = _ulid_state
+        now = _now_ms()
+        for _ in range(count):
+            if now > last:
+                last, randomness = now, int.from_bytes(os.urandom(10), "big")
+            else:
+                randomness += 1
+                if randomness >> 80:
+                    last, randomness = last + 1, int.from_bytes(os.urandom(10), "big")
+            # 128 bits padded to 130 so they split into 13 ten-bit pairs
+            value = (last << 80) | randomness
+            results.append(
+                "".join(pairs[(value >> shift) & 0x3FF] for shift in range(120, -1, -10))
+            )
+        _ulid_state[:] = last, randomness
+    return results
+
+
+def random_ulid():
+    return random_ulid_batch(1)[0]
+
+
+def random_ipv4(network=None):
+    """Random IPv4 address, optionally within a CIDR or the private/public scope"""
+    space = ip_space(4, network)
+    return format_ipv4(space.sample(current_rng()).to_bytes(4, "big"))[0]
+
+
+def random_ipv4_batch(count, network=None):
+    return format_ipv4(ip_space(4, network).sample_bytes(count, random_bytes, current_rng()))
+
+
+def random_ipv6(network=None):
+    """Random IPv6 address, optionally within a CIDR or the private/public scope"""
+    space = ip_space(6, network)
+    return format_ipv6(space.sample(current_rng()).to_bytes(16, "big"))[0]
+
+
+def random_ipv6_batch(count, network=None):
+    return format_ipv6(ip_space(6, network).sample_bytes(count, random_bytes, current_rng()))
+
+
+def random_mac(network=None):
+    """Random unicast MAC address; `network` is an OUI prefix or local/universal"""
+    return format_mac(mac_space(network).sample(current_rng()).to_bytes(6, "big"))[0]
+
+
+def random_mac_batch(count, network=None):
+    return format_mac(mac_space(network).sample_bytes(count, random_bytes, current_rng()))
 
 
 def random_hex_color():
-    return f"#{randint(0, 0xFFFFFF):06X}"
+    rng = current_rng()
+    return f"#{rng.randint(0, 0xFFFFFF):06X}"
+
+
+def random_hex_color_batch(count):
+    h = random_bytes(3 * count).hex().upper()
+    return ["#" + h[i : i + 6] for i in range(0, 6 * count, 6)]
 
 
 def random_port():
-    return str(randint(1024, 65535))
+    rng = current_rng()
+    return str(rng.randint(1024, 65535))
 
 
 def random_isbn():
+    rng = current_rng()
     # Generate ISBN-13 with valid checksum
-    isbn = [9, 7, 8] + [randint(0, 9) for _ in range(9)]
+    isbn = [9, 7, 8] + [rng.randint(0, 9) for _ in range(9)]
     checksum = (10 - sum((i % 2 * 2 + 1) * d for i, d in enumerate(isbn)) % 10) % 10
     isbn.append(checksum)
     return "".join(map(str, isbn))
 
 
+def random_isbn_batch(count):
+    body = _alphabet_bytes(digits, count * 9, random_bytes)
+    # Prefix 978 contributes 9*1 + 7*3 + 8*1 = 38 to the weighted sum
+    results = []
+    for start in range(0, count * 9, 9):
+        body_digits = body[start : start + 9]
+        values = body_digits.translate(_DIGIT_VALUES)
+        # After the 3-digit prefix, odd body positions get weight 1, even ones 3
+        total = 38 + 3 * sum(values[0::2]) + sum(values[1::2])
+        results.append("978" + body_digits.decode("ascii") + str((10 - total % 10) % 10))
+    return results
+
+
 def random_license_plate():
+    rng = current_rng()
     # US format: ABC-1234
-    letters = "".join(choice(ascii_uppercase) for _ in range(3))
-    numbers = "".join(str(randint(0, 9)) for _ in range(4))
+    letters = "".join(rng.choice(ascii_uppercase) for _ in range(3))
+    numbers = "".join(str(rng.randint(0, 9)) for _ in range(4))
     return f"{letters}-{numbers}"
 
 
 def random_api_key(length=32):
-    return "".join(choice("0123456789abcdef") for _ in range(length))
+    rng = current_rng()
+    return "".join(rng.choice("0123456789abcdef") for _ in range(length))
+
+
+def random_api_key_batch(count, length=32):
+    if length <= 0:
+        return [""] * count
+    h = random_bytes((count * length + 1) // 2).hex()
+    return [h[i : i + length] for i in range(0, count * length, length)]
 
 
 def random_base64(length=16):
-    random_bytes = bytes(randint(0, 255) for _ in range(length))
+    rng = current_rng()
+    random_bytes = bytes(rng.randint(0, 255) for _ in range(length))
     return b64encode(random_bytes).decode('ascii')
 
 
 def random_hash():
+    rng = current_rng()
     # SHA256-like hash (64 hex characters)
-    return "".join(choice("0123456789abcdef") for _ in range(64))
+    return "".join(rng.choice("0123456789abcdef") for _ in range(64))
+
+
+def random_hash_batch(count):
+    h = random_bytes(32 * count).hex()
+    return [h[i : i + 64] for i in range(0, 64 * count, 64)]
 
 
 def random_phone_us():
-    area = randint(200, 999)
-    exchange = randint(200, 999)
-    subscriber = randint(0, 9999)
+    rng = current_rng()
+    area = rng.randint(200, 999)
+    exchange = rng.randint(200, 999)
+    subscriber = rng.randint(0, 9999)
     return f"({area}) {exchange}-{subscriber:04d}"
 
 
-def random_phone_international():
-    country = randint(1, 999)
-    area = randint(100, 999)
-    exchange = randint(100, 999)
-    subscriber = randint(1000, 9999)
+def random_phone_international(countries=None):
+    """International number; `countries` is an optional weight table of calling codes (or "default")"""
+    rng = current_rng()
+    if countries is not None:
+        country = alias_table(_weights(countries, COUNTRY_CODES)).sample(rng)
+    else:
+        country = rng.randint(1, 999)
+    area = rng.randint(100, 999)
+    exchange = rng.randint(100, 999)
+    subscriber = rng.randint(1000, 9999)
     return f"+{country}-{area}-{exchange}-{subscriber}"
 
 
 def random_date(start=None, end=None):
+    rng = current_rng()
     if start and end:
         # Parse date strings and generate random date in range
         start_date = datetime.strptime(start, "%Y-%m-%d")
         end_date = datetime.strptime(end, "%Y-%m-%d")
         delta = end_date - start_date
-        random_days = randint(0, delta.days)
+        random_days = rng.randint(0, delta.days)
         random_date = start_date + timedelta(days=random_days)
         return random_date.strftime("%Y-%m-%d")
     else:
@@ -134,22 +429,23 @@ def random_date(start=None, end=None):
         start_date = today - timedelta(days=365)
         end_date = today + timedelta(days=365)
         delta = end_date - start_date
-        random_days = randint(0, delta.days)
+        random_days = rng.randint(0, delta.days)
         random_date = start_date + timedelta(days=random_days)
         return random_date.strftime("%Y-%m-%d")
 
 
 def random_time(start=None, end=None):
+    rng = current_rng()
     if start and end:
         # Parse time strings HH:MM:SS and generate random time in range
         start_parts = list(map(int, start.split(":")))
         end_parts = list(map(int, end.split(":")))
         start_seconds = start_parts[0] * 3600 + start_parts[1] * 60 + start_parts[2]
         end_seconds = end_parts[0] * 3600 + end_parts[1] * 60 + end_parts[2]
-        random_seconds = randint(start_seconds, end_seconds)
+        random_seconds = rng.randint(start_seconds, end_seconds)
     else:
         # Generate random time in 24h range
-        random_seconds = randint(0, 86399)
+        random_seconds = rng.randint(0, 86399)
 
     hours = random_seconds // 3600
     minutes = (random_seconds % 3600) // 60
@@ -158,12 +454,13 @@ def random_time(start=None, end=None):
 
 
 def random_datetime(start=None, end=None):
+    rng = current_rng()
     if start and end:
         # Parse datetime strings and generate random datetime in range
         start_dt = datetime.strptime(start, "%Y-%m-%d %H:%M:%S")
         end_dt = datetime.strptime(end, "%Y-%m-%d %H:%M:%S")
         delta = end_dt - start_dt
-        random_seconds = randint(0, int(delta.total_seconds()))
+        random_seconds = rng.randint(0, int(delta.total_seconds()))
         random_dt = start_dt + timedelta(seconds=random_seconds)
         return random_dt.strftime("%Y-%m-%d %H:%M:%S")
     else:
@@ -173,45 +470,116 @@ def random_datetime(start=None, end=None):
         return f"{date_part} {time_part}"
 
 
-def random_timestamp(start=None, end=None):
+def _timestamp_range(start, end):
     if start and end:
         # Interpret as timestamp range
-        start_ts = int(start)
-        end_ts = int(end)
-        return str(randint(start_ts, end_ts))
-    else:
-        # Generate timestamp in last/next year range
-        now = int(time.time())
-        year_seconds = 365 * 24 * 3600
-        return str(randint(now - year_seconds, now + year_seconds))
-
-
-def random_lorem(length=50):
-    """Generate lorem ipsum text with 'length' words"""
-    lorem_words = [
-        "lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing",
-        "elit", "sed", "do", "eiusmod", "tempor", "incididunt", "ut", "labore",
-        "et", "dolore", "magna", "aliqua", "enim", "ad", "minim", "veniam",
-        "quis", "nostrud", "exercitation", "ullamco", "laboris", "nisi", "aliquip",
-        "ex", "ea", "commodo", "consequat", "duis", "aute", "irure", "in",
-        "reprehenderit", "voluptate", "velit", "esse", "cillum", "fugiat",
-        "nulla", "pariatur", "excepteur", "sint", "occaecat", "cupidatat",
-        "non", "proident", "sunt", "culpa", "qui", "officia", "deserunt",
-        "mollit", "anim", "id", "est", "laborum"
-    ]
-    selected_words = [choice(lorem_words) for _ in range(length)]
-    # Capitalize first word
-    if selected_words:
-        selected_words[0] = selected_words[0].capitalize()
-    return " ".join(selected_words) + "."
+        return int(start), int(end)
+    # Generate timestamp in last/next year range
+    now = int(time.time())
+    year_seconds = 365 * 24 * 3600
+    return now - year_seconds, now + year_seconds
+
+
+def random_timestamp(start=None, end=None, dist=None):
+    rng = current_rng()
+    start_ts, end_ts = _timestamp_range(start, end)
+    if dist:
+        return str(distributions.sample(dist, start_ts, end_ts, rng))
+    return str(rng.randint(start_ts, end_ts))
+
+
+def random_timestamp_batch(count, start=None, end=None, dist=None):
+    start_ts, end_ts = _timestamp_range(start, end)
+    values = distributions.sample_many(dist, start_ts, end_ts, count, current_rng())
+    return list(map(str, values))
+
+
+def random_lorem(length=50, words=None):
+    """Generate lorem ipsum text with 'length' words, optionally from a weight table"""
+    return text.sentence(length, table=words, rng=current_rng())
+
+
+def random_paragraph(length=5, words=None):
+    """Generate a lorem ipsum paragraph with 'length' sentences"""
+    return text.paragraph(length, table=words, rng=current_rng())
 
 
 def random_username(length=10):
-    return "".join(choice(ascii_lowercase + digits) for _ in range(length))
+    rng = current_rng()
+    return "".join(rng.choice(ascii_lowercase + digits) for _ in range(length))
+
+
+def random_username_batch(count, length=10):
+    return _fixed_strings(ascii_lowercase + digits, count, length)
 
 
-def random_password(length=16, include_special=False):
-    chars = ascii_lowercase + ascii_uppercase + digits
+def _password_pools(
+    length, include_special, min_lower, min_upper, min_digits, min_special, exclude_ambiguous, symbols
+):
+    if symbols is not None or min_special:
+        include_special = True
+    if symbols is not None and not symbols.isascii():
+        raise ValueError("password symbols must be ASCII characters")
+    classes = [
+        (ascii_lowercase, min_lower),
+        (ascii_uppercase, min_upper),
+        (digits, min_digits),
+    ]
     if include_special:
-        chars += punctuation
-    return "".join(choice(chars) for _ in range(length))
+        classes.append((punctuation if symbols is None else symbols, min_special))
+
+    explicit = sum(minimum for _, minimum in classes if minimum)
+    if explicit > length:
+        raise ValueError(f"password policy needs more than {length} characters")
+    # By default every enabled class appears at least once, when the length allows
+    implicit = 1 if explicit + sum(minimum is None for _, minimum in classes) <= length else 0
+
+    pools = []
+    for chars, minimum in classes:
+        if exclude_ambiguous:
+            chars = "".join(c for c in chars if c not in AMBIGUOUS_CHARS)
+        if not chars:
+            raise ValueError("password policy leaves a character class empty")
+        pools.append((chars, implicit if minimum is None else minimum))
+    return pools, "".join(chars for chars, _ in pools)
+
+
+def random_password_batch(
+    count,
+    length=16,
+    include_special=False,
+    min_lower=None,
+    min_upper=None,
+    min_digits=None,
+    min_special=None,
+    exclude_ambiguous=False,
+    symbols=None,
+):
+    """Passwords built to satisfy the policy: required characters, fill, shuffle"""
+    pools, alphabet = _password_pools(
+        length, include_special, min_lower, min_upper, min_digits, min_special,
+        exclude_ambiguous, symbols,
+    )
+    fill = length - sum(minimum for _, minimum in pools)
+
+    # Draw every character for the whole batch from the OS CSPRNG up front
+    required = [
+        (_alphabet_bytes(chars, count * minimum), minimum) for chars, minimum in pools if minimum
+    ]
+    rest = _alphabet_bytes(alphabet, count * fill)
+    keys = array("I", os.urandom(4 * length * count))
+
+    passwords = []
+    for i in range(count):
+        chars = [buf[i * n : (i + 1) * n] for buf, n in required]
+        chars.append(rest[i * fill : (i + 1) * fill])
+        # Shuffle by sorting on random 32-bit keys so required chars can be anywhere
+        order = keys[i * length : (i + 1) * length]
+        shuffled = sorted(zip(order, b"".join(chars)))
+        passwords.append(bytes(c for _, c in shuffled).decode("ascii"))
+    return passwords
+
+
+def random_password(length=16, include_special=False, **policy):
+    """Password of `length`; see random_password_batch for the policy options"""
+    return random_password_batch(1, length, include_special, **policy)[0]
@@ -0,0 +1,198 @@
+"""Opt-in timing and profiling for registry calls.
+
+Set RANDOMER_PROFILE (environment or workflow variable) to a comma-separated
+list of modes to enable it:
+
+    timing       call counts and latency per generator and argument plan
+    cprofile     timing plus the top functions from cProfile
+    tracemalloc  timing plus peak memory and the top allocation sites
+
+The report is written as JSON when the process exits, to the file named by
+RANDOMER_PROFILE_OUTPUT ("-" for stderr), otherwise to the workflow cache
+directory when running under Alfred, otherwise to stderr. Under Alfred every
+keystroke is a run, so reports are appended as JSON Lines to one
+profile.jsonl (as is any output path ending in .jsonl), which is rotated to
+profile.jsonl.1 once it passes MAX_LOG_BYTES.
+
+When the variable is unset nothing is wrapped, so the registry functions
+are called directly.
+"""
+import atexit
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import time
+import tracemalloc
+from collections import defaultdict
+from functools import wraps
+
+PROFILE_ENV = "RANDOMER_PROFILE"
+OUTPUT_ENV = "RANDOMER_PROFILE_OUTPUT"
+MODES = ("timing", "cprofile", "tracemalloc")
+TOP = 25
+PROFILE_LOG = "profile.jsonl"
+MAX_LOG_BYTES = 4 << 20
+
+
+def modes(value=None):
+    """Parse the RANDOMER_PROFILE value into a set of modes"""
+    value = os.environ.get(PROFILE_ENV, "") if value is None else value
+    selected = {mode.strip().lower() for mode in value.split(",") if mode.strip()}
+    if selected - {"0", "false", "off"}:
+        # Any truthy value that isn't a mode name (e.g. "1") means timing only
+        return {"timing"} | (selected & set(MODES))
+    return set()
+
+
+def _percentile(ordered, fraction):
+    """Nearest-rank percentile of an already sorted list"""
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def _summary(durations, values):
+    ordered = sorted(durations)
+    return {
+        "calls": len(ordered),
+        "values": values,
+        "total_ms": round(sum(ordered) * 1000, 3),
+        "p50_ms": round(_percentile(ordered, 0.50) * 1000, 4),
+        "p99_ms": round(_percentile(ordered, 0.99) * 1000, 4),
+    }
+
+
+class Recorder:
+    """Collects per-call durations keyed by generator and argument plan"""
+
+    def __init__(self, selected=("timing",)):
+        self.modes = set(selected)
+        self.durations = defaultdict(list)
+        self.values = defaultdict(int)
+        self.started = time.perf_counter()
+        self.profiler = cProfile.Profile() if "cprofile" in self.modes else None
+        if self.profiler is not None:
+            self.profiler.enable()
+        if "tracemalloc" in self.modes and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def record(self, name, args, duration, values=1):
+        plan = " ".join([name] + [str(arg) for arg in args if arg is not None])
+        self.durations[name, plan].append(duration)
+        self.values[name, plan] += values
+
+    def wrap(self, func, batch=False):
+        """Time `func(name, ...)`; batch functions also count their values"""
+        perf_counter, record = time.perf_counter, self.record
+
+        @wraps(func)
+        def timed(name, *args, **kwargs):
+            started = perf_counter()
+            result = func(name, *args, **kwargs)
+            duration = perf_counter() - started
+            plan_args = (args[1:] if batch else args) + tuple(kwargs.values())
+            record(name, plan_args, duration, len(result) if batch else 1)
+            return result
+
+        return timed
+
+    def report(self):
+        generators = defaultdict(list)
+        values = defaultdict(int)
+        for (name, plan), durations in self.durations.items():
+            generators[name].extend(durations)
+            values[name] += self.values[name, plan]
+
+        report = {
+            "wall_ms": round((time.perf_counter() - self.started) * 1000, 3),
+            "generators": {name: _summary(generators[name], values[name]) for name in sorted(generators)},
+            "plans": {
+                plan: _summary(durations, self.values[name, plan])
+                for (name, plan), durations in sorted(self.durations.items())
+            },
+        }
+        if self.profiler is not None:
+            self.profiler.disable()
+            report["cprofile"] = _profile_top(self.profiler)
+        if "tracemalloc" in self.modes and tracemalloc.is_tracing():
+            report["tracemalloc"] = _memory_top()
+        return report
+
+
+def _profile_top(profiler, limit=TOP):
+    stats = pstats.Stats(profiler, stream=io.StringIO())
+    stats.sort_stats("cumulative")
+    rows = []
+    for func in stats.fcn_list[:limit]:
+        _, calls, total, cumulative, _ = stats.stats[func]
+        rows.append({
+            "function": "{}:{}({})".format(*func),
+            "calls": calls,
+            "total_s": round(total, 6),
+            "cumulative_s": round(cumulative, 6),
+        })
+    return rows
+
+
+def _memory_top(limit=TOP):
+    current, peak = tracemalloc.get_traced_memory()
+    snapshot = tracemalloc.take_snapshot()
+    return {
+        "current_bytes": current,
+        "peak_bytes": peak,
+        "top": [
+            {"location": str(stat.traceback[0]), "bytes": stat.size, "count": stat.count}
+            for stat in snapshot.statistics("lineno")[:limit]
+        ],
+    }
+
+
+def output_path():
+    """Where the report goes: a file path, or None for stderr"""
+    target = os.environ.get(OUTPUT_ENV)
+    if target:
+        return None if target == "-" else target
+    cachedir = os.environ.get("alfred_workflow_cache")
+    if cachedir:
+        return os.path.join(cachedir, PROFILE_LOG)
+    return None
+
+
+def dump(recorder, path=None):
+    """Write the recorder's report as JSON to `path` or stderr; .jsonl paths are appended to"""
+    report = recorder.report()
+    if path is None:
+        print(json.dumps(report, indent=2), file=sys.stderr)
+        return
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    if not path.endswith(".jsonl"):
+        with open(path, "w", encoding="utf-8") as handle:
+            handle.write(json.dumps(report, indent=2) + "\n")
+        return
+
+    try:
+        if os.path.getsize(path) > MAX_LOG_BYTES:
+            os.replace(path, path + ".1")
+    except OSError:
+        pass
+    with open(path, "a", encoding="utf-8") as handle:
+        handle.write(json.dumps({"time": time.strftime("%Y-%m-%dT%H:%M:%S"), **report}) + "\n")
+
+
+def install(namespace, selected=None):
+    """Wrap call_generator and generate_batch in `namespace` when profiling is on.
+
+    Returns the Recorder, or None (leaving the namespace untouched) when
+    RANDOMER_PROFILE is unset.
+    """
+    selected = modes() if selected is None else set(selected)
+    if not selected:
+        return None
+    recorder = Recorder(selected)
+    namespace["call_generator"] = recorder.wrap(namespace["call_generator"])
+    namespace["generate_batch"] = recorder.wrap(namespace["generate_batch"], batch=True)
+    atexit.register(dump, recorder, output_path())
+    return recorder
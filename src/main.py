@@ -1,6 +1,12 @@
+import os
+import re
 import sys
+import tempfile
 from pyflow import Workflow
+import distributions
 import generators
+import instrument
+import plugins
 
 
 GENERATORS = {
@@ -9,9 +15,12 @@ GENERATORS = {
     "imei": generators.random_imei,
     "unit": generators.random_unit_number,
     "uuid": generators.random_uuid,
+    "uuid7": generators.random_uuid7,
+    "ulid": generators.random_ulid,
     "num": generators.random_number,
     "ipv4": generators.random_ipv4,
     "ipv6": generators.random_ipv6,
+    "mac": generators.random_mac,
     "color": generators.random_hex_color,
     "port": generators.random_port,
     "isbn": generators.random_isbn,
@@ -26,15 +35,70 @@ GENERATORS = {
     "datetime": generators.random_datetime,
     "timestamp": generators.random_timestamp,
     "lorem": generators.random_lorem,
+    "paragraph": generators.random_paragraph,
     "username": generators.random_username,
     "password": generators.random_password,
 }
 
 # Categorize generators by argument type
-LENGTH_ONLY = {"string", "email", "imei", "unit", "apikey", "base64", "username", "lorem"}
+LENGTH_ONLY = {"string", "email", "imei", "unit", "apikey", "base64", "username", "lorem", "paragraph"}
 RANGE_SUPPORT = {"num", "date", "time", "datetime", "timestamp"}
-NO_ARGS = {"uuid", "ipv4", "ipv6", "color", "port", "isbn", "plate", "hash", "phone", "phoneintl"}
+NO_ARGS = {"uuid", "uuid7", "ulid", "color", "port", "isbn", "plate", "hash", "phone", "phoneintl"}
 SPECIAL_PASSWORD = {"password"}
+# Optional CIDR, scope or MAC prefix, e.g. "ipv4 10.0.0.0/8", "ipv6 private"
+NETWORK = {"ipv4", "ipv6", "mac"}
+
+# Range generators that also accept a distribution, e.g. "num 1 1000 zipf"
+DISTRIBUTION_SUPPORT = {"num", "timestamp"}
+
+# Generators with a native batch implementation: func(count, **kwargs) -> list
+BATCH_GENERATORS = {
+    "num": generators.random_number_batch,
+    "timestamp": generators.random_timestamp_batch,
+    "password": generators.random_password_batch,
+    "uuid": generators.random_uuid_batch,
+    "uuid7": generators.random_uuid7_batch,
+    "ulid": generators.random_ulid_batch,
+    "hash": generators.random_hash_batch,
+    "apikey": generators.random_api_key_batch,
+    "color": generators.random_hex_color_batch,
+    "ipv4": generators.random_ipv4_batch,
+    "ipv6": generators.random_ipv6_batch,
+    "mac": generators.random_mac_batch,
+    "imei": generators.random_imei_batch,
+    "isbn": generators.random_isbn_batch,
+    "string": generators.random_string_batch,
+    "username": generators.random_username_batch,
+    "email": generators.random_email_batch,
+}
+
+# Amount mode, e.g. "uuid 100000" or "email 12 x5000": values go to a file
+# in the cache dir and the item only carries its path and a preview
+DEFAULT_AMOUNT = 5
+AMOUNT_CHUNK = 10000
+MAX_BYTES_ENV = "RANDOMER_MAX_BYTES"
+DEFAULT_MAX_BYTES = 32 << 20
+AMOUNT_PATTERN = re.compile(r"^x(\d+)$", re.IGNORECASE)
+
+
+def register_plugins(declarations):
+    """Add plugin generators to the registry; built-in names take precedence"""
+    categories = {"none": NO_ARGS, "length": LENGTH_ONLY, "range": RANGE_SUPPORT, "password": SPECIAL_PASSWORD}
+    registered = {}
+    for name, spec in declarations.items():
+        if name in GENERATORS:
+            continue
+        GENERATORS[name] = plugins.LazyGenerator(spec)
+        categories[spec["args"]].add(name)
+        if spec.get("batch"):
+            BATCH_GENERATORS[name] = plugins.LazyGenerator(spec, "batch")
+        registered[name] = spec
+    return registered
+
+
+# Plugin names and argument kinds come from a cached index; a plugin module
+# is only imported once one of its generators is actually called
+PLUGINS = register_plugins(plugins.discover())
 
 
 def parse_args(args):
@@ -58,53 +122,162 @@ def parse_args(args):
         return generator, args[1], args[2], args[3] if len(args) > 3 else None
 
 
-def call_generator(name, arg1=None, arg2=None):
-    """Call generator with appropriate arguments based on its type"""
+def split_amount(args):
+    """Pull an amount off the raw arguments.
+
+    A trailing 'x1000' works for any generator; generators that take no
+    arguments or a network also accept a bare number. Returns (args, amount or None).
+    """
+    args = list(args)
+    if len(args) > 1:
+        match = AMOUNT_PATTERN.match(args[-1])
+        if match:
+            return args[:-1], int(match.group(1))
+        if len(args) == 2 and args[0].lower().strip() in NO_ARGS | NETWORK and args[1].isdigit():
+            return args[:1], int(args[1])
+    return args, None
+
+
+def max_bytes():
+    """Size cap for amount mode, from the workflow variable if set"""
+    try:
+        return int(os.environ.get(MAX_BYTES_ENV) or DEFAULT_MAX_BYTES)
+    except ValueError:
+        return DEFAULT_MAX_BYTES
+
+
+def write_amount(path, name, amount, arg1=None, arg2=None, arg3=None, limit=None, chunk_size=AMOUNT_CHUNK):
+    """Stream `amount` values to `path` in batches, stopping at `limit` bytes.
+
+    Returns (values written, bytes written, first value).
+    """
+    limit = max_bytes() if limit is None else limit
+    written = size = 0
+    first = None
+    with open(path, "w", encoding="utf-8") as handle:
+        while written < amount:
+            values = generate_batch(name, min(chunk_size, amount - written), arg1, arg2, arg3)
+            if first is None:
+                first = values[0]
+            block = ("\n" if written else "") + "\n".join(values)
+            encoded = len(block.encode("utf-8"))
+            if size + encoded > limit:
+                # Keep whole values only, up to the cap
+                for value in values:
+                    extra = len(value.encode("utf-8")) + (1 if written else 0)
+                    if size + extra > limit:
+                        break
+                    handle.write(("\n" if written else "") + value)
+                    size += extra
+                    written += 1
+                break
+            handle.write(block)
+            size += encoded
+            written += len(values)
+    return written, size, first
+
+
+def amount_path(name):
+    """One output file per generator in the workflow cache dir"""
+    directory = os.environ.get("alfred_workflow_cache") or tempfile.gettempdir()
+    os.makedirs(directory, exist_ok=True)
+    return os.path.join(directory, f"amount-{name}.txt")
+
+
+def format_size(size):
+    if size < 1024:
+        return f"{size} B"
+    if size < 1 << 20:
+        return f"{size / 1024:.1f} KB"
+    return f"{size / (1 << 20):.1f} MB"
+
+
+def split_distribution(arg1=None, arg2=None, arg3=None):
+    """Pull a trailing distribution spec (e.g. 'zipf:1.2') off the positional args"""
+    args = [arg for arg in (arg1, arg2, arg3) if arg]
+    # Match on the name only, so a bad parameter ('exp:0') fails instead of being dropped
+    name = args[-1].strip().lower().partition(":")[0] if args else ""
+    dist = args.pop() if name in distributions.DISTRIBUTIONS or name in distributions.ALIASES else None
+    args += [None] * (2 - len(args))
+    return args[0], args[1], dist
+
+
+def generator_kwargs(name, arg1=None, arg2=None, arg3=None):
+    """Translate positional workflow arguments into generator keyword arguments"""
 
     if name in NO_ARGS:
-        # Generators that don't take arguments
-        return GENERATORS[name]()
+        # Generators that don't take arguments, apart from a weight table
+        # ("default" or a CSV path) for calling codes
+        if name == "phoneintl" and arg1:
+            return {"countries": arg1}
+        return {}
 
     elif name in LENGTH_ONLY:
-        # Generators that only accept length
-        length = int(arg1) if arg1 else 9
-        return GENERATORS[name](length=length)
+        # Generators that only accept length (email also takes a domain weight table)
+        kwargs = {"length": int(arg1) if arg1 else 9}
+        if name == "email" and arg2:
+            kwargs["domains"] = arg2
+        return kwargs
 
     elif name in RANGE_SUPPORT:
         # Generators that support both length and range
+        kwargs = {}
+        if name in DISTRIBUTION_SUPPORT:
+            arg1, arg2, dist = split_distribution(arg1, arg2, arg3)
+            if dist:
+                kwargs["dist"] = dist
+
         if arg1 and arg2:
             # Range mode
-            return GENERATORS[name](start=arg1, end=arg2)
-        elif arg1:
-            # Length mode for 'num', default mode for others
-            if name == "num":
-                length = int(arg1)
-                return GENERATORS[name](length=length)
-            else:
-                # For date/time, single arg doesn't make sense, use default
-                return GENERATORS[name]()
-        else:
-            # Default
-            return GENERATORS[name]()
+            kwargs.update(start=arg1, end=arg2)
+        elif arg1 and name == "num":
+            # Length mode for 'num'; for date/time a single arg doesn't make sense
+            kwargs["length"] = int(arg1)
+        return kwargs
+
+    elif name in NETWORK:
+        # Network generators: optional CIDR, scope or prefix
+        return {"network": arg1} if arg1 else {}
 
     elif name in SPECIAL_PASSWORD:
         # Password: arg1=length, arg2=include_special (0 or 1)
         length = int(arg1) if arg1 else 16
         include_special = bool(int(arg2)) if arg2 else False
-        return GENERATORS[name](length=length, include_special=include_special)
+        return {"length": length, "include_special": include_special}
 
     else:
         # Fallback
-        return GENERATORS[name]()
+        return {}
+
+
+def call_generator(name, arg1=None, arg2=None, arg3=None):
+    """Call generator with appropriate arguments based on its type"""
+    return GENERATORS[name](**generator_kwargs(name, arg1, arg2, arg3))
 
 
-def get_subtitle(name, arg1=None, arg2=None):
+def generate_batch(name, count, arg1=None, arg2=None, arg3=None):
+    """Generate `count` values, using the generator's batch implementation if any"""
+    kwargs = generator_kwargs(name, arg1, arg2, arg3)
+    if name in BATCH_GENERATORS:
+        return BATCH_GENERATORS[name](count, **kwargs)
+    generator = GENERATORS[name]
+    return [generator(**kwargs) for _ in range(count)]
+
+
+def get_subtitle(name, arg1=None, arg2=None, arg3=None):
     """Generate helpful subtitle based on generator and arguments"""
 
+    if name in DISTRIBUTION_SUPPORT:
+        arg1, arg2, dist = split_distribution(arg1, arg2, arg3)
+        if dist:
+            return f"{get_subtitle(name, arg1, arg2)} [{dist}]"
+
     if name in NO_ARGS:
-        return name
+        return f"{name} (countries={arg1})" if name == "phoneintl" and arg1 else name
     elif name in LENGTH_ONLY:
         length = arg1 if arg1 else "9"
+        if name == "email" and arg2:
+            return f"{name} (length={length}, domains={arg2})"
         return f"{name} (length={length})"
     elif name in RANGE_SUPPORT:
         if arg1 and arg2:
@@ -120,6 +293,8 @@ def get_subtitle(name, arg1=None, arg2=None):
         length = arg1 if arg1 else "16"
         special = "with special chars" if (arg2 and int(arg2)) else "no special chars"
         return f"{name} (length={length}, {special})"
+    elif name in NETWORK:
+        return f"{name} (in {arg1})" if arg1 else name
     else:
         return name
 
@@ -154,16 +329,47 @@ def filter_and_rank_generators(query):
 
 
 def main(workflow):
-    generator, arg1, arg2, arg3 = parse_args(workflow.args)
+    args, amount = split_amount(workflow.args)
+    generator, arg1, arg2, arg3 = parse_args(args)
 
     # Filter and rank generators based on query
     items = filter_and_rank_generators(generator)
 
     for name in items:
+        if name in PLUGINS and name != generator:
+            # Listing a plugin shouldn't import it; complete to its name instead
+            workflow.new_item(
+                title=name,
+                subtitle=PLUGINS[name].get("description", "plugin generator"),
+                autocomplete=f"{name} ",
+                valid=False,
+            )
+            continue
         try:
+            subtitle = get_subtitle(name, arg1, arg2, arg3)
+            if amount is not None and name != generator:
+                # Only an exact match writes the file; other matches complete to it
+                workflow.new_item(
+                    title=name,
+                    subtitle=f"{amount:,} × {subtitle}",
+                    autocomplete=" ".join([name, *args[1:], f"x{amount}"]),
+                    valid=False,
+                )
+                continue
+            if amount is not None:
+                path = amount_path(name)
+                written, size, first = write_amount(path, name, amount, arg1, arg2, arg3)
+                capped = f", capped at {written:,}" if written < amount else ""
+                workflow.new_item(
+                    title=f"{first} …" if written > 1 else first or "",
+                    subtitle=f"{amount:,} × {subtitle} ({format_size(size)}{capped})",
+                    arg=path,
+                    valid=written > 0,
+                )
+                continue
+
             # Generate 5 random values
-            values = [call_generator(name, arg1, arg2) for _ in range(5)]
-            subtitle = get_subtitle(name, arg1, arg2)
+            values = generate_batch(name, DEFAULT_AMOUNT, arg1, arg2, arg3)
 
             workflow.new_item(
                 title=values[0],
@@ -180,6 +386,10 @@ def main(workflow):
             )
 
 
+# Opt-in timing/profiling (RANDOMER_PROFILE); leaves the functions untouched otherwise
+instrument.install(globals())
+
+
 if __name__ == "__main__":
     wf = Workflow()
     wf.run(main)
@@ -0,0 +1,150 @@
+import argparse
+import csv
+import hashlib
+import hmac
+import json
+import os
+import random
+import sys
+from functools import lru_cache
+from itertools import islice
+
+import generators
+
+KEY_ENV = "RANDOMER_MASK_KEY"
+MEMO_SIZE = 1 << 16
+CHUNK_SIZE = 10000
+
+
+def _mask_email(value):
+    local, _, _ = value.partition("@")
+    return generators.random_email(length=max(len(local), 1))
+
+
+def _mask_username(value):
+    return generators.random_username(length=max(len(value), 1))
+
+
+# Generator name -> fake of the same shape as the input value
+MASKERS = {
+    "email": _mask_email,
+    "phone": lambda value: generators.random_phone_us(),
+    "username": _mask_username,
+    "ipv4": lambda value: generators.random_ipv4(),
+}
+
+
+@lru_cache(maxsize=MEMO_SIZE)
+def _masked(name, value, key):
+    # The keyed hash seeds every draw, so equal inputs give equal fakes
+    digest = hmac.new(key, f"{name}\0{value}".encode("utf-8"), hashlib.sha256).digest()
+    with generators.use_rng(random.Random(digest)):
+        return MASKERS[name](value)
+
+
+def mask_value(name, value, key):
+    """Deterministic fake for `value` using generator `name` and a secret key"""
+    if name not in MASKERS:
+        raise ValueError(f"generator '{name}' does not support masking")
+    if isinstance(key, str):
+        key = key.encode("utf-8")
+    return _masked(name, value, key)
+
+
+def parse_columns(specs):
+    """Turn ['email', 'contact=phone'] into {'email': 'email', 'contact': 'phone'}"""
+    columns = {}
+    for spec in specs:
+        column, _, name = spec.partition("=")
+        columns[column] = name or column
+        if columns[column] not in MASKERS:
+            raise ValueError(f"generator '{columns[column]}' does not support masking")
+    return columns
+
+
+def _chunks(iterable, size):
+    iterator = iter(iterable)
+    chunk = list(islice(iterator, size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(iterator, size))
+
+
+def mask_csv(source, target, columns, key, chunk_size=CHUNK_SIZE):
+    """Rewrite `columns` of a CSV stream chunk by chunk; returns rows written"""
+    reader = csv.reader(source)
+    writer = csv.writer(target)
+    header = next(reader, None)
+    if header is None:
+        return 0
+    writer.writerow(header)
+
+    missing = set(columns) - set(header)
+    if missing:
+        raise ValueError(f"columns not found in input: {sorted(missing)}")
+    plan = [(header.index(column), name) for column, name in columns.items()]
+
+    rows = 0
+    for chunk in _chunks(reader, chunk_size):
+        for row in chunk:
+            for index, name in plan:
+                if index < len(row) and row[index]:
+                    row[index] = mask_value(name, row[index], key)
+        writer.writerows(chunk)
+        rows += len(chunk)
+    return rows
+
+
+def mask_jsonl(source, target, columns, key, chunk_size=CHUNK_SIZE):
+    """Rewrite `columns` of a JSON Lines stream chunk by chunk; returns rows written"""
+    rows = 0
+    for chunk in _chunks(source, chunk_size):
+        output = []
+        for line in chunk:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            for column, name in columns.items():
+                if record.get(column):
+                    record[column] = mask_value(name, str(record[column]), key)
+            output.append(json.dumps(record) + "\n")
+        target.write("".join(output))
+        rows += len(output)
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replace real values with consistent fakes")
+    parser.add_argument("input", help="input file, or - for stdin")
+    parser.add_argument("output", help="output file, or - for stdout")
+    parser.add_argument(
+        "-c", "--column", action="append", required=True,
+        help="column to mask as NAME or NAME=GENERATOR (email, phone, username, ipv4)",
+    )
+    parser.add_argument("--format", choices=("csv", "jsonl"), help="default: from extension")
+    parser.add_argument("--key", help=f"secret key (default: ${KEY_ENV})")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args(argv)
+
+    key = args.key or os.environ.get(KEY_ENV)
+    if not key:
+        parser.error(f"a key is required: pass --key or set {KEY_ENV}")
+
+    fmt = args.format or ("jsonl" if args.input.endswith((".jsonl", ".ndjson")) else "csv")
+    mask = mask_jsonl if fmt == "jsonl" else mask_csv
+    columns = parse_columns(args.column)
+
+    source = sys.stdin if args.input == "-" else open(args.input, newline="", encoding="utf-8")
+    target = sys.stdout if args.output == "-" else open(args.output, "w", newline="", encoding="utf-8")
+    try:
+        rows = mask(source, target, columns, key, args.chunk_size)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if target is not sys.stdout:
+            target.close()
+    print(f"masked {rows} rows", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
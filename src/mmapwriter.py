@@ -0,0 +1,93 @@
+import argparse
+import mmap
+import multiprocessing
+import os
+import sys
+
+from main import generate_batch
+
+# Generators whose output length depends only on their arguments
+FIXED_WIDTH = {
+    "uuid", "uuid7", "ulid", "hash", "imei", "isbn", "color", "ipv6", "apikey",
+    "unit", "plate", "phone", "mac",
+}
+CHUNK_SIZE = 1 << 16
+
+
+def record_width(name, *args):
+    """Width in characters of one value of a fixed-width generator"""
+    if name not in FIXED_WIDTH:
+        raise ValueError(f"generator '{name}' does not produce fixed-width values")
+    return len(generate_batch(name, 1, *args)[0])
+
+
+def _fill(path, name, args, width, start, stop, chunk_size):
+    """Write records [start, stop) of a pre-sized file through mmap"""
+    record = width + 1
+    offset = start * record
+    # mmap offsets must be a multiple of the allocation granularity
+    base = offset - offset % mmap.ALLOCATIONGRANULARITY
+    with open(path, "r+b") as handle:
+        with mmap.mmap(handle.fileno(), stop * record - base, offset=base) as view:
+            position = offset - base
+            for chunk_start in range(start, stop, chunk_size):
+                count = min(chunk_size, stop - chunk_start)
+                values = generate_batch(name, count, *args)
+                block = ("\n".join(values) + "\n").encode("ascii")
+                if len(block) != count * record:
+                    raise ValueError(f"generator '{name}' produced values of varying width")
+                view[position : position + len(block)] = block
+                position += len(block)
+
+
+def write_fixed(path, name, count, *args, workers=None, chunk_size=CHUNK_SIZE):
+    """Pre-size `path` and fill it with `count` newline-terminated fixed-width records.
+
+    Record i starts at byte i * (width + 1). Worker processes fill disjoint
+    slices of the file in parallel. Returns the record width.
+    """
+    width = record_width(name, *args)
+    with open(path, "wb") as handle:
+        handle.truncate(count * (width + 1))
+    if count == 0:
+        return width
+
+    workers = max(1, min(workers or os.cpu_count() or 1, count // chunk_size + 1))
+    step = -(-count // workers)
+    slices = [
+        (path, name, args, width, start, min(start + step, count), chunk_size)
+        for start in range(0, count, step)
+    ]
+    if len(slices) == 1:
+        _fill(*slices[0])
+    else:
+        with multiprocessing.Pool(len(slices)) as pool:
+            pool.starmap(_fill, slices)
+    return width
+
+
+def read_record(path, index, width):
+    """Read record `index` directly by seeking to it"""
+    with open(path, "rb") as handle:
+        handle.seek(index * (width + 1))
+        record = handle.read(width)
+    if len(record) != width:
+        raise IndexError("record index out of range")
+    return record.decode("ascii")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Write fixed-width records through mmap")
+    parser.add_argument("generator", choices=sorted(FIXED_WIDTH))
+    parser.add_argument("count", type=int)
+    parser.add_argument("path")
+    parser.add_argument("args", nargs="*", help="generator arguments, e.g. a length")
+    parser.add_argument("--workers", type=int, help="default: one per CPU")
+    args = parser.parse_args(argv)
+
+    width = write_fixed(args.path, args.generator, args.count, *args.args, workers=args.workers)
+    print(f"{args.count} records of {width} + 1 bytes", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,166 @@
+"""Address spaces for the ipv4, ipv6 and mac generators.
+
+A space is one or more (base, mask) pairs: an address is a single integer
+draw ANDed with the mask of the random bits and ORed with the fixed ones,
+then formatted through precomputed octet/hextet tables. Specs are CIDRs
+("10.0.0.0/8", "2001:db8::/32"), "private" or "public" for IP addresses,
+and an OUI prefix ("00:1a:2b"), "local" or "universal" for MACs.
+"""
+import ipaddress
+import sys
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+
+OCTETS = tuple(str(i) for i in range(256))
+HEX_OCTETS = tuple(f"{i:02x}" for i in range(256))
+
+# Reserved IPv4 blocks excluded from "public" (RFC 6890 special-purpose registry)
+RESERVED_V4 = (
+    "0.0.0.0/8", "10.0.0.0/8", "100.64.0.0/10", "127.0.0.0/8", "169.254.0.0/16",
+    "172.16.0.0/12", "192.0.0.0/24", "192.0.2.0/24", "192.88.99.0/24", "192.168.0.0/16",
+    "198.18.0.0/15", "198.51.100.0/24", "203.0.113.0/24", "224.0.0.0/4", "240.0.0.0/4",
+)
+PRIVATE_V4 = ("10.0.0.0/8", "172.16.0.0/12", "192.168.0.0/16")
+PRIVATE_V6 = ("fc00::/7",)
+# Global unicast, minus protocol assignments and the documentation prefix
+PUBLIC_V6 = ("2000::/3",)
+RESERVED_V6 = ("2001::/23", "2001:db8::/32")
+
+# MAC first-octet flags: bit 0 multicast, bit 1 locally administered
+_MAC_MULTICAST = 1 << 40
+_MAC_LOCAL = 1 << 41
+
+
+@lru_cache(maxsize=1)
+def hextets():
+    """65536 four-digit hex strings, built on first IPv6 use"""
+    return tuple(f"{i:04x}" for i in range(65536))
+
+
+class AddressSpace:
+    """Union of (base, mask) networks, minus excluded ranges"""
+
+    def __init__(self, width, networks, excluded=()):
+        self.width = width
+        self.size = width // 8
+        self.networks = list(networks)
+        self.excluded = sorted(excluded)
+        self._starts = [start for start, _ in self.excluded]
+        # Multiple networks are picked by size, with one draw over their total
+        self.totals = []
+        total = 0
+        for _, mask in self.networks:
+            total += mask + 1
+            self.totals.append(total)
+
+    def is_excluded(self, address):
+        index = bisect_right(self._starts, address) - 1
+        return index >= 0 and address <= self.excluded[index][1]
+
+    def sample(self, rng):
+        while True:
+            if len(self.networks) == 1:
+                base, mask = self.networks[0]
+                address = rng.getrandbits(self.width) & mask | base
+            else:
+                draw = rng.randrange(self.totals[-1])
+                index = bisect_right(self.totals, draw)
+                base, _ = self.networks[index]
+                address = base | (draw - (self.totals[index - 1] if index else 0))
+            if not self.excluded or not self.is_excluded(address):
+                return address
+
+    def sample_bytes(self, count, randbytes, rng):
+        """`count` big-endian addresses packed back to back"""
+        size = self.size
+        if len(self.networks) != 1:
+            return b"".join(self.sample(rng).to_bytes(size, "big") for _ in range(count))
+
+        base, mask = self.networks[0]
+        raw = randbytes(size * count)
+        if count and mask != (1 << self.width) - 1:
+            # Mask every address at once: repeat mask and base across the buffer
+            masks = int.from_bytes(mask.to_bytes(size, "big") * count, "big")
+            bases = int.from_bytes(base.to_bytes(size, "big") * count, "big")
+            raw = (int.from_bytes(raw, "big") & masks | bases).to_bytes(size * count, "big")
+        if not self.excluded:
+            return raw
+
+        kept = [
+            raw[i : i + size] for i in range(0, len(raw), size)
+            if not self.is_excluded(int.from_bytes(raw[i : i + size], "big"))
+        ]
+        missing = count - len(kept)
+        if missing:
+            kept.append(self.sample_bytes(missing, randbytes, rng))
+        return b"".join(kept)
+
+
+def _cidr_network(cidr):
+    network = ipaddress.ip_network(cidr, strict=False)
+    return int(network.network_address), int(network.hostmask)
+
+
+def _ranges(cidrs):
+    return [
+        (int(network.network_address), int(network.broadcast_address))
+        for network in map(ipaddress.ip_network, cidrs)
+    ]
+
+
+@lru_cache(maxsize=64)
+def ip_space(version, spec=None):
+    """AddressSpace for an IP version and an optional CIDR or scope"""
+    width = 32 if version == 4 else 128
+    scope = (spec or "").lower()
+    if not scope:
+        return AddressSpace(width, [(0, (1 << width) - 1)])
+    if scope == "private":
+        return AddressSpace(width, map(_cidr_network, PRIVATE_V4 if version == 4 else PRIVATE_V6))
+    if scope == "public":
+        if version == 4:
+            return AddressSpace(width, [(0, (1 << width) - 1)], _ranges(RESERVED_V4))
+        return AddressSpace(width, map(_cidr_network, PUBLIC_V6), _ranges(RESERVED_V6))
+
+    network = ipaddress.ip_network(spec, strict=False)
+    if network.version != version:
+        raise ValueError(f"'{spec}' is not an IPv{version} network")
+    return AddressSpace(width, [(int(network.network_address), int(network.hostmask))])
+
+
+@lru_cache(maxsize=64)
+def mac_space(spec=None):
+    """AddressSpace for unicast MACs: any, "local", "universal" or an OUI prefix"""
+    scope = (spec or "").lower()
+    full = (1 << 48) - 1
+    if not scope:
+        return AddressSpace(48, [(0, full & ~_MAC_MULTICAST)])
+    if scope == "local":
+        return AddressSpace(48, [(_MAC_LOCAL, full & ~(_MAC_MULTICAST | _MAC_LOCAL))])
+    if scope == "universal":
+        return AddressSpace(48, [(0, full & ~(_MAC_MULTICAST | _MAC_LOCAL))])
+
+    digits = scope.replace(":", "").replace("-", "").replace(".", "")
+    if not digits or len(digits) > 12 or len(digits) % 2:
+        raise ValueError(f"'{spec}' is not a MAC prefix")
+    host_bits = 48 - 4 * len(digits)
+    return AddressSpace(48, [(int(digits, 16) << host_bits, (1 << host_bits) - 1)])
+
+
+def format_ipv4(raw):
+    parts = list(map(OCTETS.__getitem__, raw))
+    return [".".join(parts[i : i + 4]) for i in range(0, len(parts), 4)]
+
+
+def format_ipv6(raw):
+    words = array("H", raw)
+    if sys.byteorder == "little":
+        words.byteswap()
+    parts = list(map(hextets().__getitem__, words))
+    return [":".join(parts[i : i + 8]) for i in range(0, len(parts), 8)]
+
+
+def format_mac(raw):
+    parts = list(map(HEX_OCTETS.__getitem__, raw))
+    return [":".join(parts[i : i + 6]) for i in range(0, len(parts), 6)]
@@ -0,0 +1,43 @@
+import os
+import random
+from concurrent.futures import ThreadPoolExecutor
+
+from generators import current_rng, use_rng
+from main import generate_batch
+
+CHUNK_SIZE = 10000
+
+
+def split(count, chunk_size=CHUNK_SIZE):
+    """Chunk sizes covering `count` values"""
+    return [min(chunk_size, count - start) for start in range(0, count, chunk_size)]
+
+
+def generate_parallel(name, count, arg1=None, arg2=None, arg3=None, threads=None,
+                      chunk_size=CHUNK_SIZE, executor=None):
+    """generate_batch() split into chunks across a thread pool, in order.
+
+    Each chunk runs on its own RNG, seeded from the caller's, so chunks never
+    contend on shared state and a seeded caller gets the same values for any
+    thread count. Pass `executor` to reuse a pool across calls.
+    """
+    sizes = split(count, chunk_size)
+    if len(sizes) <= 1:
+        return generate_batch(name, count, arg1, arg2, arg3)
+
+    rng = current_rng()
+    seeds = [rng.getrandbits(64) for _ in sizes]
+
+    def chunk(size, seed):
+        with use_rng(random.Random(seed)):
+            return generate_batch(name, size, arg1, arg2, arg3)
+
+    def run(mapper):
+        return [value for values in mapper(chunk, sizes, seeds) for value in values]
+
+    if threads == 1:
+        return run(map)
+    if executor is not None:
+        return run(executor.map)
+    with ThreadPoolExecutor(min(threads or os.cpu_count() or 1, len(sizes))) as pool:
+        return run(pool.map)
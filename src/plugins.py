@@ -0,0 +1,183 @@
+"""Plugin generators from a user directory or installed packages.
+
+A plugin is a module declaring its generators in a module-level dict
+literal, so discovery can read it with `ast` without importing anything:
+
+    RANDOMER_GENERATORS = {
+        "iban": {
+            "function": "random_iban",        # called with the usual kwargs
+            "batch": "random_iban_batch",     # optional: func(count, **kwargs)
+            "args": "length",                 # none | length | range | password
+            "description": "IBAN account number",
+        },
+    }
+
+Plugins are *.py files in RANDOMER_PLUGINS (default
+~/.config/randomer/plugins), or modules named by entry points in the
+"randomer.generators" group. Under Alfred the discovered declarations are
+cached in an index file in the workflow cache dir, keyed on the mtimes of
+the plugin files and directories; elsewhere (tests, the server, the CLIs)
+they are scanned on each start and nothing is written. A plugin module is
+imported only when one of its generators is called.
+"""
+import ast
+import importlib
+import importlib.util
+import json
+import os
+import sys
+
+PLUGINS_ENV = "RANDOMER_PLUGINS"
+DEFAULT_DIRECTORY = os.path.join("~", ".config", "randomer", "plugins")
+ENTRY_POINT_GROUP = "randomer.generators"
+DECLARATION = "RANDOMER_GENERATORS"
+ARG_KINDS = ("none", "length", "range", "password")
+INDEX_VERSION = 1
+
+_modules = {}
+
+
+def plugin_directory():
+    return os.path.expanduser(os.environ.get(PLUGINS_ENV) or DEFAULT_DIRECTORY)
+
+
+def index_path():
+    """Index file in the workflow cache dir, or None outside Alfred"""
+    cachedir = os.environ.get("alfred_workflow_cache")
+    return os.path.join(cachedir, "plugins.json") if cachedir else None
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+def _plugin_files(directory):
+    try:
+        names = sorted(os.listdir(directory))
+    except OSError:
+        return []
+    return [os.path.join(directory, name) for name in names if name.endswith(".py") and not name.startswith("_")]
+
+
+def cache_key(directory):
+    """Mtimes that change whenever a plugin could have been added, edited or installed"""
+    paths = [directory] + _plugin_files(directory)
+    # Installing or removing a package touches its site-packages directory
+    paths += [path for path in sys.path if path and os.path.isdir(path)]
+    return {path: _mtime(path) for path in paths}
+
+
+def parse_declarations(source, filename="<plugin>"):
+    """Read the RANDOMER_GENERATORS dict literal from module source"""
+    for node in ast.parse(source, filename).body:
+        if (
+            isinstance(node, ast.Assign)
+            and len(node.targets) == 1
+            and isinstance(node.targets[0], ast.Name)
+            and node.targets[0].id == DECLARATION
+        ):
+            declarations = ast.literal_eval(node.value)
+            break
+    else:
+        return {}
+
+    if not isinstance(declarations, dict):
+        raise ValueError(f"{filename}: {DECLARATION} must be a dict")
+    for name, spec in declarations.items():
+        if not isinstance(spec, dict) or "function" not in spec:
+            raise ValueError(f"{filename}: generator '{name}' needs a 'function'")
+        if spec.setdefault("args", "none") not in ARG_KINDS:
+            raise ValueError(f"{filename}: generator '{name}' has unknown args '{spec['args']}'")
+    return declarations
+
+
+def _entry_points():
+    try:
+        from importlib.metadata import entry_points
+    except ImportError:  # pragma: no cover - Python < 3.8
+        return []
+    found = entry_points()
+    if hasattr(found, "select"):
+        return list(found.select(group=ENTRY_POINT_GROUP))
+    return list(found.get(ENTRY_POINT_GROUP, []))
+
+
+def scan(directory):
+    """Collect declarations from the plugin directory and entry points"""
+    generators = {}
+    sources = [(path, {"path": path}) for path in _plugin_files(directory)]
+    for entry_point in _entry_points():
+        try:
+            spec = importlib.util.find_spec(entry_point.value)
+        except (ImportError, ValueError):
+            spec = None
+        if spec is not None and spec.origin:
+            sources.append((spec.origin, {"module": entry_point.value}))
+
+    for path, location in sources:
+        try:
+            with open(path, encoding="utf-8") as handle:
+                declarations = parse_declarations(handle.read(), path)
+        except (OSError, SyntaxError, ValueError) as error:
+            print(f"randomer: skipping plugin {path}: {error}", file=sys.stderr)
+            continue
+        for name, spec in declarations.items():
+            generators.setdefault(name, dict(spec, **location))
+    return generators
+
+
+def discover(directory=None, index=None):
+    """Plugin declarations by generator name, from the index when it is current"""
+    directory = directory or plugin_directory()
+    index = index or index_path()
+    if index is None:
+        return scan(directory)
+    key = cache_key(directory)
+    try:
+        with open(index, encoding="utf-8") as handle:
+            cached = json.load(handle)
+        if cached.get("version") == INDEX_VERSION and cached.get("key") == key:
+            return cached["generators"]
+    except (OSError, ValueError):
+        pass
+
+    generators = scan(directory)
+    try:
+        os.makedirs(os.path.dirname(index), exist_ok=True)
+        with open(index, "w", encoding="utf-8") as handle:
+            json.dump({"version": INDEX_VERSION, "key": key, "generators": generators}, handle)
+    except OSError:
+        pass
+    return generators
+
+
+def load_module(spec):
+    """Import (once) the module a plugin declaration lives in"""
+    location = spec.get("path") or spec["module"]
+    if location not in _modules:
+        if "path" in spec:
+            name = "randomer_plugin_" + os.path.splitext(os.path.basename(location))[0]
+            module_spec = importlib.util.spec_from_file_location(name, location)
+            module = importlib.util.module_from_spec(module_spec)
+            module_spec.loader.exec_module(module)
+        else:
+            module = importlib.import_module(location)
+        _modules[location] = module
+    return _modules[location]
+
+
+class LazyGenerator:
+    """Registry entry that imports its plugin module on first call"""
+
+    def __init__(self, spec, attribute="function"):
+        self.spec = spec
+        self.attribute = attribute
+        self.func = None
+
+    def __call__(self, *args, **kwargs):
+        if self.func is None:
+            self.func = getattr(load_module(self.spec), self.spec[self.attribute])
+        return self.func(*args, **kwargs)
@@ -0,0 +1,286 @@
+import argparse
+import multiprocessing
+import os
+import struct
+import sys
+import time
+from multiprocessing import shared_memory
+
+from main import generate_batch
+
+# Shared header: write index, read index, producer full waits, consumer empty
+# waits, and a flag the producer sets when it dies with an error
+_HEADER = struct.Struct("<QQQQQ")
+HEADER_SIZE = 64
+# Each slot is a 2-byte length followed by up to `width` bytes of UTF-8
+_LENGTH = struct.Struct("<H")
+MAX_WIDTH = 0xFFFF - _LENGTH.size
+
+CAPACITY = 1 << 16
+BATCH_SIZE = 1024
+POLL_INTERVAL = 0.001
+
+
+def _partial(error_type, message, values):
+    error = error_type(message)
+    error.values = values
+    return error
+
+
+class RingBuffer:
+    """Single-producer, multi-consumer ring of strings in shared memory.
+
+    The producer publishes values by advancing the write index after the
+    slots are filled, so it never takes the lock. Consumers share one lock
+    that is held only to copy the available slots out and advance the read
+    index. Instances can be passed to child processes, which re-attach to
+    the same segment.
+    """
+
+    def __init__(self, capacity=CAPACITY, width=64, lock=None, shm_name=None):
+        if not 0 < width <= MAX_WIDTH:
+            raise ValueError(f"slot width must be between 1 and {MAX_WIDTH}")
+        self.capacity = capacity
+        self.width = width
+        self.slot = width + _LENGTH.size
+        self.lock = lock or multiprocessing.Lock()
+        if shm_name is None:
+            self.shm = shared_memory.SharedMemory(create=True, size=HEADER_SIZE + capacity * self.slot)
+            self.owner = True
+            _HEADER.pack_into(self.shm.buf, 0, 0, 0, 0, 0, 0)
+        else:
+            self.shm = shared_memory.SharedMemory(name=shm_name)
+            self.owner = False
+        self.buf = self.shm.buf
+
+    def __getstate__(self):
+        return {"capacity": self.capacity, "width": self.width, "lock": self.lock, "shm_name": self.shm.name}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
+
+    def _indexes(self):
+        return _HEADER.unpack_from(self.buf, 0)
+
+    def __len__(self):
+        write, read, _, _, _ = self._indexes()
+        return write - read
+
+    def put_many(self, values):
+        """Producer side: store as many of `values` as fit; returns the number stored"""
+        write, read, _, _, _ = self._indexes()
+        free = self.capacity - (write - read)
+        values = values[:free]
+        buf, slot, capacity, width = self.buf, self.slot, self.capacity, self.width
+        for offset, value in enumerate(values):
+            data = value.encode("utf-8")
+            if len(data) > width:
+                raise ValueError(f"value of {len(data)} bytes does not fit a {width} byte slot")
+            start = HEADER_SIZE + (write + offset) % capacity * slot
+            _LENGTH.pack_into(buf, start, len(data))
+            buf[start + _LENGTH.size : start + _LENGTH.size + len(data)] = data
+        # Publish only after the slots are written
+        struct.pack_into("<Q", buf, 0, write + len(values))
+        return len(values)
+
+    def put(self, values, timeout=None, stop=None):
+        """Producer side: store all `values`, waiting while the ring is full.
+
+        Returns the number stored, which is short only on timeout or once
+        the `stop` event is set.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        stored = self.put_many(values)
+        while stored < len(values):
+            if (stop is not None and stop.is_set()) or (deadline and time.monotonic() > deadline):
+                break
+            self._count_wait(2)
+            time.sleep(POLL_INTERVAL)
+            stored += self.put_many(values[stored:])
+        return stored
+
+    def mark_failed(self):
+        """Producer side: tell consumers that no more values are coming"""
+        struct.pack_into("<Q", self.buf, 32, 1)
+
+    @property
+    def failed(self):
+        return bool(self._indexes()[4])
+
+    def _count_wait(self, field):
+        # Field 2 is only written by the producer; field 3 only under the lock
+        offset = field * 8
+        struct.pack_into("<Q", self.buf, offset, struct.unpack_from("<Q", self.buf, offset)[0] + 1)
+
+    def take_many(self, count):
+        """Consumer side: take up to `count` values without waiting"""
+        buf, slot, capacity = self.buf, self.slot, self.capacity
+        with self.lock:
+            write, read, _, _, _ = self._indexes()
+            count = min(count, write - read)
+            if not count:
+                self._count_wait(3)
+                return []
+            first = read % capacity
+            head = min(count, capacity - first)
+            start = HEADER_SIZE + first * slot
+            block = bytes(buf[start : start + head * slot])
+            if head < count:
+                block += bytes(buf[HEADER_SIZE : HEADER_SIZE + (count - head) * slot])
+            struct.pack_into("<Q", buf, 8, read + count)
+
+        length, skip = _LENGTH.unpack_from, _LENGTH.size
+        values = []
+        for start in range(0, count * slot, slot):
+            size = length(block, start)[0]
+            values.append(block[start + skip : start + skip + size].decode("utf-8"))
+        return values
+
+    def take(self, count=1, timeout=None, alive=None):
+        """Consumer side: take `count` values, waiting for the producer if needed.
+
+        Raises RuntimeError instead of waiting once the producer has failed,
+        or once `alive` (e.g. the producer's Process.is_alive) returns False.
+        The values already taken are gone from the ring, so both that error
+        and TimeoutError carry them in a `values` attribute.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        values = self.take_many(count)
+        while len(values) < count:
+            if deadline and time.monotonic() > deadline:
+                raise _partial(TimeoutError, f"ring buffer supplied {len(values)} of {count} values", values)
+            if self.failed or (alive is not None and not alive()):
+                # Drain anything published before the producer stopped
+                values += self.take_many(count - len(values))
+                if len(values) < count:
+                    raise _partial(
+                        RuntimeError, f"ring buffer producer stopped after {len(values)} of {count} values", values
+                    )
+                break
+            time.sleep(POLL_INTERVAL)
+            values += self.take_many(count - len(values))
+        return values
+
+    def stats(self):
+        """Fill level and wait counters"""
+        write, read, full_waits, empty_waits, failed = self._indexes()
+        return {
+            "capacity": self.capacity,
+            "fill": write - read,
+            "fill_ratio": (write - read) / self.capacity,
+            "produced": write,
+            "consumed": read,
+            "producer_waits": full_waits,
+            "consumer_waits": empty_waits,
+            "producer_failed": bool(failed),
+        }
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink()
+
+
+def slot_width(name, *args, sample=1000):
+    """Slot width for a generator: twice its longest value in a sample"""
+    values = generate_batch(name, sample, *args)
+    return min(MAX_WIDTH, max(16, 2 * max(len(value.encode("utf-8")) for value in values)))
+
+
+def _produce(ring, name, args, stop, batch_size):
+    """Producer process: keep `ring` topped up with values of `name`"""
+    try:
+        while not stop.is_set():
+            values = generate_batch(name, batch_size, *args)
+            ring.put(values, stop=stop)
+    except BaseException:
+        ring.mark_failed()
+        raise
+
+
+class RingPool:
+    """Producer processes keeping one ring buffer per generator spec full.
+
+    `specs` maps a key to a registry spec such as "uuid" or "email 12".
+    Consumers call take(key, count), from this process or from any child
+    process the pool was passed to.
+    """
+
+    def __init__(self, specs, capacity=CAPACITY, batch_size=BATCH_SIZE):
+        self.stop_event = multiprocessing.Event()
+        self.rings = {}
+        self.processes = []
+        self.producers = {}
+        self.pid = os.getpid()
+        for key, spec in specs.items():
+            name, *args = spec.split()
+            ring = RingBuffer(capacity, slot_width(name, *args))
+            self.rings[key] = ring
+            # One writer per ring keeps the publish step lock-free
+            self.producers[key] = multiprocessing.Process(
+                target=_produce, args=(ring, name, args[:3], self.stop_event, batch_size), daemon=True
+            )
+            self.processes.append(self.producers[key])
+        for process in self.processes:
+            process.start()
+
+    def take(self, key, count=1, timeout=None):
+        # Only the process that started the producers can poll them; other
+        # consumers rely on the ring's failure flag
+        alive = self.producers[key].is_alive if os.getpid() == self.pid else None
+        return self.rings[key].take(count, timeout, alive)
+
+    def stats(self):
+        return {key: ring.stats() for key, ring in self.rings.items()}
+
+    def close(self):
+        self.stop_event.set()
+        for process in self.processes:
+            process.join()
+        for ring in self.rings.values():
+            ring.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _consume(pool, key, count, batch):
+    taken = 0
+    while taken < count:
+        taken += len(pool.take(key, min(batch, count - taken), timeout=10))
+    return taken
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve pre-generated values from shared memory")
+    parser.add_argument("specs", nargs="+", help='generator specs, e.g. uuid "email 12"')
+    parser.add_argument("--consumers", type=int, default=4)
+    parser.add_argument("--count", type=int, default=100000, help="values per consumer and spec")
+    parser.add_argument("--batch", type=int, default=100, help="values per take")
+    parser.add_argument("--capacity", type=int, default=CAPACITY)
+    args = parser.parse_args(argv)
+
+    with RingPool({spec: spec for spec in args.specs}, capacity=args.capacity) as pool:
+        started = time.perf_counter()
+        consumers = [
+            multiprocessing.Process(target=_consume, args=(pool, spec, args.count, args.batch))
+            for spec in args.specs
+            for _ in range(args.consumers)
+        ]
+        for process in consumers:
+            process.start()
+        for process in consumers:
+            process.join()
+        elapsed = time.perf_counter() - started
+        total = args.count * len(consumers)
+        print(f"{total:,} values in {elapsed:.2f}s ({total / elapsed:,.0f}/sec)", file=sys.stderr)
+        for key, stats in pool.stats().items():
+            print(f"{key}: {stats}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
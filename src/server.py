@@ -0,0 +1,357 @@
+"""Local HTTP service over the GENERATORS registry.
+
+    GET  /v1/generators                      JSON list of generator names
+    GET  /v1/<name>?count=10000&length=12    one value per line
+    GET  /v1/num?start=1&end=1000&dist=zipf  range and distribution args
+    GET  /v1/ipv4?network=10.0.0.0/8         CIDR, scope or MAC prefix
+    POST /v1/dataset                         dataset schema in, JSON Lines out
+
+Responses are streamed with chunked transfer encoding. Values are generated
+in chunks by a process pool, a couple of chunks ahead of the socket, so large
+batches never run on the event loop.
+"""
+import argparse
+import asyncio
+import json
+import sys
+import traceback
+import time
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import parse_qsl, urlsplit
+
+import dataset
+from main import (
+    GENERATORS,
+    LENGTH_ONLY,
+    NETWORK,
+    RANGE_SUPPORT,
+    SPECIAL_PASSWORD,
+    generate_batch,
+    generator_kwargs,
+)
+
+CHUNK_SIZE = 10000
+MAX_COUNT = 10 ** 8
+MAX_LENGTH = 10 ** 4
+MAX_BODY = 1 << 20
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+
+def query_args(name, params):
+    """Map query parameters onto the positional args call_generator expects"""
+    if "length" in params:
+        _length(params["length"])
+    if name in SPECIAL_PASSWORD:
+        return params.get("length"), params.get("special"), None
+    if name in RANGE_SUPPORT:
+        if "start" in params or "end" in params:
+            if not ("start" in params and "end" in params):
+                raise HTTPError(400, "start and end must be given together")
+            return params["start"], params["end"], params.get("dist")
+        return params.get("length"), params.get("dist"), None
+    if name in LENGTH_ONLY:
+        return params.get("length"), None, None
+    if name in NETWORK:
+        return params.get("network"), None, None
+    return None, None, None
+
+
+def _length(value):
+    try:
+        length = int(value)
+    except ValueError:
+        raise HTTPError(400, "length must be an integer")
+    if not 0 <= length <= MAX_LENGTH:
+        raise HTTPError(400, f"length must be between 0 and {MAX_LENGTH}")
+    return length
+
+
+def _count(params):
+    try:
+        count = int(params.get("count", 1))
+    except ValueError:
+        raise HTTPError(400, "count must be an integer")
+    if not 0 <= count <= MAX_COUNT:
+        raise HTTPError(400, f"count must be between 0 and {MAX_COUNT}")
+    return count
+
+
+def _lines(name, count, args):
+    """Worker: one chunk of values as newline-terminated UTF-8"""
+    values = generate_batch(name, count, *args)
+    return ("\n".join(values) + "\n").encode("utf-8") if values else b""
+
+
+class Server:
+    def __init__(self, workers=None, chunk_size=CHUNK_SIZE):
+        self.pool = ProcessPoolExecutor(workers)
+        self.chunk_size = chunk_size
+
+    async def handle(self, reader, writer):
+        """Serve requests on one connection until the client closes it"""
+        try:
+            while True:
+                try:
+                    request = await self._read_request(reader)
+                except HTTPError as error:
+                    await self._send_error(writer, error.status, str(error))
+                    break
+                if request is None:
+                    break
+                method, path, headers, body = request
+                keep_alive = headers.get("connection", "").lower() != "close"
+                try:
+                    await self.route(writer, method, path, body)
+                except HTTPError as error:
+                    await self._send_error(writer, error.status, str(error))
+                if not keep_alive:
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        except Exception:
+            # A bug in one request shouldn't take the server down, and the
+            # response may be half sent, so just drop the connection
+            traceback.print_exc(file=sys.stderr)
+        finally:
+            writer.close()
+
+    async def _read_request(self, reader):
+        line = await reader.readline()
+        if not line.strip():
+            return None
+        try:
+            method, target, _ = line.decode("latin1").split(" ", 2)
+        except ValueError:
+            raise HTTPError(400, "malformed request line")
+        headers = {}
+        while True:
+            line = await reader.readline()
+            if line in (b"\r\n", b"\n", b""):
+                break
+            key, _, value = line.decode("latin1").partition(":")
+            headers[key.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", 0))
+        except ValueError:
+            raise HTTPError(400, "invalid Content-Length")
+        if length < 0:
+            raise HTTPError(400, "invalid Content-Length")
+        if length > MAX_BODY:
+            raise HTTPError(413, "request body too large")
+        body = await reader.readexactly(length) if length else b""
+        return method, target, headers, body
+
+    async def route(self, writer, method, target, body):
+        url = urlsplit(target)
+        params = dict(parse_qsl(url.query))
+        parts = url.path.strip("/").split("/")
+        if len(parts) != 2 or parts[0] != "v1":
+            raise HTTPError(404, "unknown path")
+        name = parts[1]
+
+        if name == "generators":
+            payload = json.dumps(sorted(GENERATORS)).encode("utf-8")
+            await self._send(writer, 200, "application/json", payload)
+        elif name == "dataset":
+            if method != "POST":
+                raise HTTPError(405, "POST a dataset schema")
+            try:
+                schema = json.loads(body)
+                dataset.validate_schema(schema)
+            except (ValueError, KeyError, TypeError, AttributeError) as error:
+                raise HTTPError(400, f"invalid schema: {error}")
+            await self.stream_dataset(writer, schema)
+        elif name in GENERATORS:
+            if method != "GET":
+                raise HTTPError(405, "use GET")
+            count, args = _count(params), query_args(name, params)
+            try:
+                generator_kwargs(name, *args)
+            except (ValueError, TypeError) as error:
+                raise HTTPError(400, f"invalid arguments: {error}")
+            await self.stream_values(writer, name, count, args)
+        else:
+            raise HTTPError(404, f"unknown generator '{name}'")
+
+    async def stream_values(self, writer, name, count, args):
+        """Stream `count` values, generating the next chunks while sending this one"""
+        loop = asyncio.get_running_loop()
+        sizes = [min(self.chunk_size, count - start) for start in range(0, count, self.chunk_size)]
+        submit = lambda size: loop.run_in_executor(self.pool, _lines, name, size, args)
+
+        # The first chunk also validates the arguments (ranges, networks,
+        # distributions), in a worker and before the status line is sent; any
+        # failure this early comes from the arguments the client sent
+        first = b""
+        if sizes:
+            try:
+                first = await submit(sizes[0])
+            except Exception as error:
+                raise HTTPError(400, f"invalid arguments: {error}")
+
+        self._start_chunked(writer, "text/plain; charset=utf-8")
+        rest = iter(sizes[1:])
+        pending = deque(map(submit, islice(rest, 2)))
+        if first:
+            await self._write_chunk(writer, first)
+        while pending:
+            data = await pending.popleft()
+            size = next(rest, None)
+            if size:
+                pending.append(submit(size))
+            await self._write_chunk(writer, data)
+        await self._write_chunk(writer, b"")
+
+    async def stream_dataset(self, writer, schema):
+        """Stream every table as JSON Lines tagged with a "_table" field"""
+        # Dataset chunks come from a generator, which can't cross processes,
+        # so each chunk is pulled on a thread instead
+        loop = asyncio.get_running_loop()
+        dumps = json.dumps
+        self._start_chunked(writer, "application/x-ndjson")
+        for table, columns, chunks in dataset.generate(schema, self.chunk_size):
+            while True:
+                chunk = await loop.run_in_executor(None, next, chunks, None)
+                if chunk is None:
+                    break
+                data = "".join(dumps({"_table": table, **dict(zip(columns, row))}) + "\n" for row in chunk)
+                await self._write_chunk(writer, data.encode("utf-8"))
+        await self._write_chunk(writer, b"")
+
+    def _start_chunked(self, writer, content_type):
+        writer.write(
+            f"HTTP/1.1 200 OK\r\nContent-Type: {content_type}\r\n"
+            "Transfer-Encoding: chunked\r\n\r\n".encode("latin1")
+        )
+
+    async def _write_chunk(self, writer, data):
+        writer.write(f"{len(data):x}\r\n".encode("latin1") + data + b"\r\n")
+        await writer.drain()
+
+    async def _send(self, writer, status, content_type, payload):
+        writer.write(
+            f"HTTP/1.1 {status} {REASONS[status]}\r\nContent-Type: {content_type}\r\n"
+            f"Content-Length: {len(payload)}\r\n\r\n".encode("latin1") + payload
+        )
+        await writer.drain()
+
+    async def _send_error(self, writer, status, message):
+        payload = json.dumps({"error": message}).encode("utf-8")
+        await self._send(writer, status, "application/json", payload)
+
+    def close(self):
+        self.pool.shutdown()
+
+
+async def serve(host="127.0.0.1", port=8000, workers=None, chunk_size=CHUNK_SIZE, ready=None):
+    """Run the service until cancelled"""
+    server = Server(workers, chunk_size)
+    listener = await asyncio.start_server(server.handle, host, port)
+    if ready is not None:
+        ready(listener.sockets[0].getsockname()[1])
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        # Waiting for the workers blocks, so it happens off the event loop
+        await asyncio.get_running_loop().run_in_executor(None, server.close)
+
+
+async def fetch(reader, writer, method, target, body=b""):
+    """Send one keep-alive request and read the (possibly chunked) response"""
+    writer.write(
+        f"{method} {target} HTTP/1.1\r\nHost: localhost\r\n"
+        f"Content-Length: {len(body)}\r\n\r\n".encode("latin1") + body
+    )
+    status = int((await reader.readline()).split()[1])
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b""):
+            break
+        key, _, value = line.decode("latin1").partition(":")
+        headers[key.strip().lower()] = value.strip()
+
+    if headers.get("transfer-encoding") == "chunked":
+        parts = []
+        while True:
+            size = int(await reader.readline(), 16)
+            data = await reader.readexactly(size + 2)
+            if not size:
+                break
+            parts.append(data[:-2])
+        return status, b"".join(parts)
+    return status, await reader.readexactly(int(headers.get("content-length", 0)))
+
+
+async def load_test(host, port, target, requests=100, concurrency=8):
+    """Measure requests/sec and values/sec against a running server"""
+    counts = []
+
+    async def client(share):
+        reader, writer = await asyncio.open_connection(host, port)
+        try:
+            for _ in range(share):
+                status, body = await fetch(reader, writer, "GET", target)
+                if status != 200:
+                    raise RuntimeError(f"HTTP {status}: {body.decode('utf-8', 'replace')}")
+                counts.append(body.count(b"\n"))
+        finally:
+            writer.close()
+
+    started = time.perf_counter()
+    shares = [requests // concurrency + (i < requests % concurrency) for i in range(concurrency)]
+    await asyncio.gather(*(client(share) for share in shares if share))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(counts),
+        "values": sum(counts),
+        "seconds": elapsed,
+        "requests_per_sec": len(counts) / elapsed,
+        "values_per_sec": sum(counts) / elapsed,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Random data over HTTP")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    serve_parser = commands.add_parser("serve", help="run the service")
+    serve_parser.add_argument("--host", default="127.0.0.1")
+    serve_parser.add_argument("--port", type=int, default=8000)
+    serve_parser.add_argument("--workers", type=int, help="generator processes (default: one per CPU)")
+    serve_parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    bench_parser = commands.add_parser("bench", help="load-test a running service")
+    bench_parser.add_argument("target", nargs="?", default="/v1/uuid?count=1000")
+    bench_parser.add_argument("--host", default="127.0.0.1")
+    bench_parser.add_argument("--port", type=int, default=8000)
+    bench_parser.add_argument("--requests", type=int, default=200)
+    bench_parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args(argv)
+
+    if args.command == "serve":
+        ready = lambda port: print(f"serving on http://{args.host}:{port}", file=sys.stderr)
+        try:
+            asyncio.run(serve(args.host, args.port, args.workers, args.chunk_size, ready))
+        except KeyboardInterrupt:
+            pass
+    else:
+        result = asyncio.run(load_test(args.host, args.port, args.target, args.requests, args.concurrency))
+        print(
+            f"{result['requests']} requests, {result['values']:,} values in {result['seconds']:.2f}s: "
+            f"{result['requests_per_sec']:,.0f} req/s, {result['values_per_sec']:,.0f} values/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+DIALECTS = ("sqlite", "postgresql", "mysql")
+BATCH_SIZE = 500
+
+# COPY text format escapes (PostgreSQL docs, "Text Format")
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def quote_identifier(name, dialect="sqlite"):
+    if dialect == "mysql":
+        return "`" + name.replace("`", "``") + "`"
+    return '"' + name.replace('"', '""') + '"'
+
+
+def quote_value(value, dialect="sqlite"):
+    """Render a Python value as an SQL literal for `dialect`"""
+    if value is None:
+        return "NULL"
+    if isinstance(value, bool):
+        return ("0", "1")[value] if dialect == "sqlite" else ("FALSE", "TRUE")[value]
+    if isinstance(value, (int, float)):
+        return repr(value)
+    value = str(value).replace("'", "''")
+    if dialect == "mysql":
+        # MySQL treats backslash as an escape character inside string literals
+        value = value.replace("\\", "\\\\")
+    return f"'{value}'"
+
+
+def insert_statements(table, columns, rows, dialect="sqlite", batch_size=BATCH_SIZE):
+    """Yield multi-row INSERT statements of up to `batch_size` rows each"""
+    if dialect not in DIALECTS:
+        raise ValueError(f"unknown SQL dialect '{dialect}'")
+    prefix = "INSERT INTO {} ({}) VALUES\n".format(
+        quote_identifier(table, dialect),
+        ", ".join(quote_identifier(column, dialect) for column in columns),
+    )
+    quote = quote_value
+
+    batch = []
+    for row in rows:
+        batch.append("(" + ", ".join([quote(value, dialect) for value in row]) + ")")
+        if len(batch) >= batch_size:
+            yield prefix + ",\n".join(batch) + ";\n"
+            batch = []
+    if batch:
+        yield prefix + ",\n".join(batch) + ";\n"
+
+
+def copy_header(table, columns):
+    return "COPY {} ({}) FROM STDIN;\n".format(
+        quote_identifier(table, "postgresql"),
+        ", ".join(quote_identifier(column, "postgresql") for column in columns),
+    )
+
+
+def copy_rows(rows):
+    """Yield COPY text-format data lines (tab separated, \\N for NULL)"""
+    escapes = _COPY_ESCAPES
+    for row in rows:
+        yield "\t".join(
+            ["\\N" if value is None else str(value).translate(escapes) for value in row]
+        ) + "\n"
+
+
+def copy_lines(table, columns, rows):
+    """Yield a complete PostgreSQL `COPY ... FROM STDIN` text-format stream"""
+    yield copy_header(table, columns)
+    yield from copy_rows(rows)
+    yield "\\.\n"
+
+
+def write_inserts(handle, table, columns, chunks, dialect="sqlite", batch_size=BATCH_SIZE):
+    """Dataset writer: multi-row INSERTs; returns rows written"""
+    rows = 0
+    for chunk in chunks:
+        for statement in insert_statements(table, columns, chunk, dialect, batch_size):
+            handle.write(statement)
+        rows += len(chunk)
+    return rows
+
+
+def write_copy(handle, table, columns, chunks):
+    """Dataset writer: one PostgreSQL COPY block per table; returns rows written"""
+    handle.write(copy_header(table, columns))
+    rows = 0
+    for chunk in chunks:
+        handle.write("".join(copy_rows(chunk)))
+        rows += len(chunk)
+    handle.write("\\.\n")
+    return rows
@@ -0,0 +1,129 @@
+import argparse
+import random
+import re
+import sys
+from itertools import accumulate
+
+from weighted import alias_table
+
+LOREM_WORDS = (
+    "lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing",
+    "elit", "sed", "do", "eiusmod", "tempor", "incididunt", "ut", "labore",
+    "et", "dolore", "magna", "aliqua", "enim", "ad", "minim", "veniam",
+    "quis", "nostrud", "exercitation", "ullamco", "laboris", "nisi", "aliquip",
+    "ex", "ea", "commodo", "consequat", "duis", "aute", "irure", "in",
+    "reprehenderit", "voluptate", "velit", "esse", "cillum", "fugiat",
+    "nulla", "pariatur", "excepteur", "sint", "occaecat", "cupidatat",
+    "non", "proident", "sunt", "culpa", "qui", "officia", "deserunt",
+    "mollit", "anim", "id", "est", "laborum",
+)
+
+# Short words are more frequent in real text, so weight by inverse length
+LOREM_CUM_WEIGHTS = tuple(accumulate(12.0 / len(word) for word in LOREM_WORDS))
+
+SENTENCE_WORDS = (6, 14)
+PARAGRAPH_SENTENCES = (3, 7)
+CHUNK_SIZE = 1 << 16
+
+SIZE_UNITS = {"": 1, "b": 1, "k": 1 << 10, "m": 1 << 20, "g": 1 << 30}
+SIZE_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([kmg]?)i?b?\s*$", re.IGNORECASE)
+
+
+def parse_size(size):
+    """Parse a byte size such as 4096, '64KB' or '10 MB'"""
+    if isinstance(size, int):
+        return size
+    match = SIZE_PATTERN.match(str(size))
+    if not match:
+        raise ValueError(f"invalid size '{size}'")
+    number, unit = match.groups()
+    return int(float(number) * SIZE_UNITS[unit.lower()])
+
+
+def words(count, table=None, rng=random):
+    """Draw `count` words from the lorem table or a custom weight table"""
+    if table is not None:
+        return alias_table(table).sample_many(count, rng)
+    return rng.choices(LOREM_WORDS, cum_weights=LOREM_CUM_WEIGHTS, k=count)
+
+
+def _sentences(sizes, table, rng):
+    # One bulk draw for all the words, then slice it into sentences
+    pool = words(sum(sizes), table, rng)
+    start = 0
+    for size in sizes:
+        selected = pool[start : start + size]
+        start += size
+        if selected:
+            selected[0] = selected[0].capitalize()
+        yield " ".join(selected) + "."
+
+
+def sentence(length=None, table=None, rng=random):
+    """A sentence of `length` words (random length by default)"""
+    if length is None:
+        length = rng.randint(*SENTENCE_WORDS)
+    return next(_sentences([length], table, rng))
+
+
+def paragraph(length=None, table=None, rng=random):
+    """A paragraph of `length` sentences (random length by default)"""
+    if length is None:
+        length = rng.randint(*PARAGRAPH_SENTENCES)
+    sizes = [rng.randint(*SENTENCE_WORDS) for _ in range(length)]
+    return " ".join(_sentences(sizes, table, rng))
+
+
+def iter_text(size, mode="paragraph", table=None, chunk_size=CHUNK_SIZE, rng=random):
+    """Yield ASCII text chunks of at most `chunk_size` totalling exactly `size` bytes"""
+    if mode not in ("paragraph", "sentence"):
+        raise ValueError(f"unknown text mode '{mode}'")
+    unit, separator = (paragraph, "\n\n") if mode == "paragraph" else (sentence, " ")
+
+    remaining = parse_size(size)
+    # Text past a chunk boundary carries over, so only the final chunk is cut short
+    leftover = ""
+    while remaining > 0:
+        target = min(chunk_size, remaining)
+        parts, length = [leftover], len(leftover)
+        while length < target:
+            part = unit(table=table, rng=rng) + separator
+            parts.append(part)
+            length += len(part)
+        block = "".join(parts)
+        chunk, leftover = block[:target], block[target:]
+        remaining -= len(chunk)
+        yield chunk
+
+
+def write_text(writer, size, mode="paragraph", table=None, chunk_size=CHUNK_SIZE, rng=random):
+    """Stream `size` bytes of text to a text-mode writer; returns bytes written"""
+    written = 0
+    for chunk in iter_text(size, mode, table, chunk_size, rng):
+        writer.write(chunk)
+        written += len(chunk)
+    return written
+
+
+def text(size, mode="paragraph", table=None, rng=random):
+    """Return `size` bytes of text as a single string (use write_text for big blobs)"""
+    return "".join(iter_text(size, mode, table, rng=rng))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Stream lorem ipsum text of a given size")
+    parser.add_argument("size", help="target size, e.g. 4096, 64KB or 10MB")
+    parser.add_argument("--mode", choices=("paragraph", "sentence"), default="paragraph")
+    parser.add_argument("--weights", help="CSV file of word,weight rows")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    if args.output:
+        with open(args.output, "w", encoding="ascii") as handle:
+            write_text(handle, args.size, args.mode, args.weights)
+    else:
+        write_text(sys.stdout, args.size, args.mode, args.weights)
+
+
+if __name__ == "__main__":
+    main()
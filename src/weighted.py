@@ -0,0 +1,176 @@
+import csv
+import os
+import random
+import threading
+import time
+from functools import lru_cache
+
+# Weight tables already resolved, by object identity and by CSV path
+IDENTITY_CACHE_SIZE = 32
+STAT_INTERVAL = 1.0
+_identity_tables = {}
+_file_tables = {}
+_cache_lock = threading.Lock()
+
+
+class AliasTable:
+    """Vose alias table: O(n) setup, O(1) weighted sampling"""
+
+    __slots__ = ("values", "prob", "alias", "size")
+
+    def __init__(self, values, weights):
+        values = list(values)
+        weights = [float(w) for w in weights]
+
+        if not values or len(values) != len(weights):
+            raise ValueError("values and weights must be non-empty and the same length")
+        if any(w < 0 for w in weights):
+            raise ValueError("weights must be non-negative")
+
+        total = sum(weights)
+        if total <= 0:
+            raise ValueError("at least one weight must be positive")
+
+        size = len(values)
+        scaled = [w * size / total for w in weights]
+        prob = [0.0] * size
+        alias = list(range(size))
+
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            s = small.pop()
+            g = large.pop()
+            prob[s] = scaled[s]
+            alias[s] = g
+            scaled[g] = scaled[g] + scaled[s] - 1.0
+            (small if scaled[g] < 1.0 else large).append(g)
+
+        # Leftovers are 1.0 up to floating point error
+        for i in large + small:
+            prob[i] = 1.0
+
+        self.values = values
+        self.prob = prob
+        self.alias = alias
+        self.size = size
+
+    def sample(self, rng=random):
+        # A single uniform draw picks the column and the coin flip
+        x = rng.random() * self.size
+        i = int(x)
+        return self.values[i] if x - i < self.prob[i] else self.values[self.alias[i]]
+
+    def sample_many(self, count, rng=random):
+        values, prob, alias, size = self.values, self.prob, self.alias, self.size
+        draw = rng.random
+        result = []
+        append = result.append
+        for _ in range(count):
+            x = draw() * size
+            i = int(x)
+            append(values[i] if x - i < prob[i] else values[alias[i]])
+        return result
+
+
+def load_weights(path):
+    """Read a `value,weight` CSV file into a dict, skipping a header row"""
+    weights = {}
+    with open(path, newline="", encoding="utf-8") as handle:
+        for row in csv.reader(handle):
+            if not row or row[0].startswith("#"):
+                continue
+            value = row[0].strip()
+            try:
+                weight = float(row[1]) if len(row) > 1 else 1.0
+            except ValueError:
+                # Header row such as "domain,weight"
+                continue
+            weights[value] = weights.get(value, 0.0) + weight
+    return weights
+
+
+@lru_cache(maxsize=32)
+def _table_from_items(items):
+    values, weights = zip(*items)
+    return AliasTable(values, weights)
+
+
+def _table_from_file(path):
+    # Re-read the file when its mtime changes, checking at most once per STAT_INTERVAL
+    now = time.monotonic()
+    entry = _file_tables.get(path)
+    if entry is not None and now - entry[0] < STAT_INTERVAL:
+        return entry[2]
+    mtime = os.stat(path).st_mtime_ns
+    if entry is not None and entry[1] == mtime:
+        table = entry[2]
+    else:
+        table = _table_from_items(tuple(load_weights(path).items()))
+    _file_tables[path] = (now, mtime, table)
+    return table
+
+
+def alias_table(weights):
+    """Return a cached AliasTable for a dict, (value, weight) pairs or CSV path.
+
+    Dicts and pair lists are cached by identity, so sampling repeatedly from
+    the same object costs O(1) per call; don't mutate a table after using it
+    (build a new one, or pass an AliasTable directly).
+    """
+    if isinstance(weights, AliasTable):
+        return weights
+    if isinstance(weights, (str, os.PathLike)):
+        return _table_from_file(os.fspath(weights))
+
+    entry = _identity_tables.get(id(weights))
+    if entry is not None and entry[0] is weights:
+        return entry[1]
+    if isinstance(weights, dict):
+        items = tuple(weights.items())
+    else:
+        items = tuple(map(tuple, weights))
+    table = _table_from_items(items)
+    with _cache_lock:
+        if len(_identity_tables) >= IDENTITY_CACHE_SIZE:
+            _identity_tables.pop(next(iter(_identity_tables)))
+        # Holding the object keeps its id from being reused by another one
+        _identity_tables[id(weights)] = (weights, table)
+    return table
+
+
+def weighted_choice(weights, rng=random):
+    """Pick one value from a weight table (see alias_table for accepted forms)"""
+    return alias_table(weights).sample(rng)
+
+
+# Rough real-world mixes, used when a generator is asked for domains="default"
+# or countries="default"
+EMAIL_DOMAINS = {
+    "gmail.com": 42,
+    "yahoo.com": 11,
+    "outlook.com": 9,
+    "hotmail.com": 8,
+    "icloud.com": 7,
+    "aol.com": 2,
+    "proton.me": 1,
+    "example.com": 20,
+}
+
+COUNTRY_CODES = {
+    "1": 30,
+    "86": 12,
+    "91": 12,
+    "44": 6,
+    "49": 6,
+    "33": 5,
+    "81": 5,
+    "55": 5,
+    "52": 4,
+    "39": 3,
+    "34": 3,
+    "61": 2,
+    "234": 3,
+    "27": 2,
+}
@@ -0,0 +1,157 @@
+import unittest
+import os
+import socket
+import tempfile
+import uuid
+import sys
+sys.path.insert(0, 'src')
+
+from columnar import FixedColumn, VarColumn, Table, column, generate_table, to_npy, to_arrow, write_arrow
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class TestColumns(unittest.TestCase):
+    """Test fixed and variable width column storage"""
+
+    def test_fixed_column(self):
+        col = FixedColumn(3, b'abcdef')
+        col.append(b'ghi')
+        self.assertEqual(len(col), 3)
+        self.assertEqual(col[1], 'def')
+        self.assertEqual(col[-1], 'ghi')
+        self.assertEqual(list(col), ['abc', 'def', 'ghi'])
+        with self.assertRaises(ValueError):
+            col.append(b'toolong')
+        with self.assertRaises(IndexError):
+            col[3]
+
+    def test_fixed_memoryview_is_zero_copy(self):
+        col = FixedColumn(2, b'aabb')
+        view = col.memoryview()
+        self.assertEqual(view.shape, (2, 2))
+        col.data[0] = ord('z')
+        self.assertEqual(view[0, 0], ord('z'))
+
+    def test_empty_fixed_column(self):
+        col = FixedColumn(4)
+        self.assertEqual(col.memoryview().nbytes, 0)
+        self.assertEqual(list(col), [])
+
+    def test_zero_length_values(self):
+        for name in ('string', 'apikey', 'num'):
+            with self.subTest(generator=name):
+                col = column(name, 5, '0')
+                self.assertIsInstance(col, VarColumn)
+                self.assertEqual(list(col), [''] * 5)
+
+    def test_var_column(self):
+        col = VarColumn.from_strings(['a', '', 'ünï'])
+        self.assertEqual(len(col), 3)
+        self.assertEqual(list(col), ['a', '', 'ünï'])
+        col.append(b'xyz')
+        self.assertEqual(col[3], 'xyz')
+        offsets, data = col.memoryview()
+        self.assertEqual(offsets.tolist(), [0, 1, 1, 6, 9])
+
+
+class TestGeneratedColumns(unittest.TestCase):
+    """Test columns produced from the generator registry"""
+
+    def test_uuid_column_is_packed(self):
+        col = column('uuid', 200)
+        self.assertEqual(col.nbytes, 200 * 16)
+        for value in col:
+            parsed = uuid.UUID(value)
+            self.assertEqual(parsed.version, 4)
+            self.assertEqual(parsed.variant, uuid.RFC_4122)
+
+    def test_hash_and_ipv4_columns(self):
+        self.assertRegex(column('hash', 5)[0], r'^[a-f0-9]{64}$')
+        ip = column('ipv4', 5)
+        self.assertEqual(ip.nbytes, 20)
+        socket.inet_aton(ip[0])
+
+    def test_fallback_columns(self):
+        imei = column('imei', 10, '14')
+        self.assertIsInstance(imei, FixedColumn)
+        self.assertEqual(imei.width, 15)
+        self.assertIsInstance(column('lorem', 10, '3'), VarColumn)
+
+    def test_generate_table(self):
+        table = generate_table({'id': 'uuid', 'email': 'email 6', 'key': 'apikey 16'}, 50)
+        self.assertEqual(len(table), 50)
+        row = table[0]
+        self.assertEqual(len(row), 3)
+        self.assertEqual(len(row[2]), 16)
+        self.assertEqual(len(list(table)), 50)
+
+    def test_mismatched_lengths(self):
+        with self.assertRaises(ValueError):
+            Table({'a': FixedColumn(1, b'ab'), 'b': FixedColumn(1, b'a')})
+
+
+class TestExport(unittest.TestCase):
+    """Test .npy and Arrow export"""
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_npy_header(self):
+        path = os.path.join(self.directory.name, 'imei.npy')
+        col = column('imei', 10, '14')
+        to_npy(col, path)
+        with open(path, 'rb') as handle:
+            content = handle.read()
+        self.assertTrue(content.startswith(b'\x93NUMPY\x01\x00'))
+        header_len = int.from_bytes(content[8:10], 'little')
+        self.assertEqual((10 + header_len) % 64, 0)
+        self.assertIn(b"'descr': '|S15'", content[:10 + header_len])
+        self.assertEqual(content[10 + header_len:], bytes(col.data))
+
+    def test_npy_empty_column(self):
+        path = os.path.join(self.directory.name, 'empty.npy')
+        to_npy(FixedColumn(15, codec='ascii'), path)
+        with open(path, 'rb') as handle:
+            self.assertIn(b"'shape': (0,)", handle.read())
+        if numpy is not None:
+            self.assertEqual(numpy.load(path).shape, (0,))
+
+    def test_npy_rejects_var_column(self):
+        with self.assertRaises(ValueError):
+            to_npy(VarColumn.from_strings(['a']), os.path.join(self.directory.name, 'x.npy'))
+
+    @unittest.skipIf(numpy is None, 'numpy not installed')
+    def test_npy_loads_in_numpy(self):
+        path = os.path.join(self.directory.name, 'hash.npy')
+        col = column('hash', 10)
+        to_npy(col, path)
+        loaded = numpy.load(path)
+        self.assertEqual(loaded.shape, (10,))
+        self.assertEqual(loaded[3].tobytes().hex(), col[3])
+
+    @unittest.skipIf(pyarrow is None, 'pyarrow not installed')
+    def test_arrow_round_trip(self):
+        table = generate_table({'id': 'uuid', 'email': 'email 6', 'text': 'lorem 4'}, 20)
+        self.assertEqual(to_arrow(table['email']).to_pylist(), list(table['email']))
+        path = os.path.join(self.directory.name, 'table.arrow')
+        write_arrow(table, path)
+        loaded = pyarrow.ipc.open_file(path).read_all()
+        self.assertEqual(loaded.num_rows, 20)
+        self.assertEqual(loaded.column('text').to_pylist(), list(table['text']))
+        self.assertEqual(loaded.column('id')[0].as_py(), bytes(table['id'].raw(0)))
+
+
+if __name__ == '__main__':
+    unittest.main()
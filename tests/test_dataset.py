@@ -0,0 +1,177 @@
+import unittest
+import csv
+import json
+import os
+import random
+import tempfile
+import sys
+sys.path.insert(0, 'src')
+
+from dataset import table_order, header, generate, validate_schema, write_dataset
+from generators import use_rng
+
+SCHEMA = {
+    'tables': {
+        'orders': {
+            'parent': 'users',
+            'per_parent': [1, 5],
+            'columns': {
+                'total': 'num 1 500 lognormal',
+                'referrer': {'ref': 'users', 'dist': 'zipf'},
+            },
+        },
+        'items': {
+            'parent': 'orders',
+            'per_parent': 2,
+            'foreign_key': 'order_id',
+            'columns': {'sku': 'string 8'},
+        },
+        'users': {
+            'rows': 250,
+            'columns': {
+                'email': 'email 12',
+                'work_email': {
+                    'generator': 'email',
+                    'kwargs': {'length': 6, 'domains': {'corp.example': 1}},
+                },
+            },
+        },
+    }
+}
+
+
+def collect(schema, chunk_size=100):
+    tables = {}
+    for name, columns, chunks in generate(schema, chunk_size):
+        rows = []
+        for chunk in chunks:
+            assert len(chunk) <= chunk_size, 'chunk larger than chunk_size'
+            rows.extend(chunk)
+        tables[name] = [dict(zip(columns, row)) for row in rows]
+    return tables
+
+
+class TestSchema(unittest.TestCase):
+    """Test schema ordering and headers"""
+
+    def test_dependency_order(self):
+        self.assertEqual(table_order(SCHEMA), ['users', 'orders', 'items'])
+
+    def test_header(self):
+        self.assertEqual(header('orders', SCHEMA), ['id', 'users_id', 'total', 'referrer'])
+        self.assertEqual(header('items', SCHEMA), ['id', 'order_id', 'sku'])
+
+    def test_unknown_table(self):
+        with self.assertRaises(ValueError):
+            table_order({'tables': {'a': {'parent': 'missing'}}})
+
+    def test_circular_references(self):
+        schema = {'tables': {'a': {'parent': 'b'}, 'b': {'parent': 'a'}}}
+        with self.assertRaises(ValueError):
+            table_order(schema)
+
+    def test_validate_schema(self):
+        self.assertEqual(validate_schema(SCHEMA), ['users', 'orders', 'items'])
+        bad_tables = [
+            {'a': {'rows': 5, 'columns': {'x': 'nope'}}},
+            {'a': {'columns': {'x': 'uuid'}}},
+            {'a': {'rows': 5, 'columns': {'x': 'string abc'}}},
+            {'a': {'rows': 5, 'columns': {'x': 'num 1 10 exp:0'}}},
+            {'a': {'rows': 5, 'columns': {'x': {'generator': 'email', 'kwargs': {'size': 3}}}}},
+            {'a': {'rows': 5, 'columns': {'x': {'ref': 'a', 'dist': 'nope'}}}},
+            {'a': {'rows': 5}, 'b': {'parent': 'a', 'per_parent': [1]}},
+        ]
+        for tables in bad_tables:
+            with self.assertRaises(ValueError, msg=tables):
+                validate_schema({'tables': tables})
+
+
+class TestGenerate(unittest.TestCase):
+    """Test row generation and referential integrity"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.tables = collect(SCHEMA)
+
+    def test_root_row_count_and_keys(self):
+        users = self.tables['users']
+        self.assertEqual([u['id'] for u in users], list(range(1, 251)))
+        self.assertTrue(all(u['work_email'].endswith('@corp.example') for u in users))
+
+    def test_child_cardinality(self):
+        per_user = {}
+        for order in self.tables['orders']:
+            per_user[order['users_id']] = per_user.get(order['users_id'], 0) + 1
+        self.assertEqual(set(per_user), set(range(1, 251)))
+        self.assertTrue(all(1 <= n <= 5 for n in per_user.values()))
+
+    def test_references_are_valid(self):
+        order_ids = {o['id'] for o in self.tables['orders']}
+        self.assertTrue(all(1 <= o['referrer'] <= 250 for o in self.tables['orders']))
+        self.assertTrue(all(i['order_id'] in order_ids for i in self.tables['items']))
+        self.assertEqual(len(self.tables['items']), 2 * len(order_ids))
+
+    def test_keys_are_sequential(self):
+        ids = [o['id'] for o in self.tables['orders']]
+        self.assertEqual(ids, list(range(1, len(ids) + 1)))
+
+    def test_seeded_rng_is_reproducible(self):
+        # Foreign keys and per-parent counts draw from the seeded RNG too
+        schema = {'tables': {
+            'users': {'rows': 20, 'columns': {'name': 'username 6'}},
+            'orders': {'parent': 'users', 'per_parent': [0, 3], 'columns': {'referrer': {'ref': 'users'}}},
+        }}
+        with use_rng(random.Random(1)):
+            first = collect(schema)
+        with use_rng(random.Random(1)):
+            second = collect(schema)
+        self.assertEqual(first, second)
+
+
+class TestSelfReferences(unittest.TestCase):
+    """Test tables that reference their own keys"""
+
+    def test_root_table(self):
+        schema = {'tables': {'emp': {'rows': 250, 'columns': {'mgr': {'ref': 'emp'}}}}}
+        self.assertEqual(table_order(schema), ['emp'])
+        emp = collect(schema)['emp']
+        self.assertEqual(len(emp), 250)
+        self.assertTrue(all(1 <= e['mgr'] <= 250 for e in emp))
+
+    def test_child_table(self):
+        schema = {'tables': {
+            'teams': {'rows': 40},
+            'emp': {'parent': 'teams', 'per_parent': [1, 9], 'columns': {'mgr': {'ref': 'emp'}}},
+        }}
+        emp = collect(schema, chunk_size=16)['emp']
+        self.assertTrue(all(1 <= e['mgr'] <= len(emp) for e in emp))
+        # Each chunk only points at rows generated up to and including it
+        for index, e in enumerate(emp):
+            self.assertLessEqual(e['mgr'], (index // 16 + 1) * 16)
+
+
+class TestWriteDataset(unittest.TestCase):
+    """Test per-table file output"""
+
+    def test_output_formats(self):
+        schema = {'tables': {'users': {'rows': 30, 'columns': {'name': 'username'}}}}
+        with tempfile.TemporaryDirectory() as directory:
+            written = write_dataset(schema, directory, 'csv', chunk_size=7)
+            self.assertEqual(written, {'users': 30})
+            with open(os.path.join(directory, 'users.csv')) as handle:
+                rows = list(csv.reader(handle))
+            self.assertEqual(rows[0], ['id', 'name'])
+            self.assertEqual(len(rows), 31)
+
+            write_dataset(schema, directory, 'sqlite', chunk_size=7)
+            with open(os.path.join(directory, 'users.sql')) as handle:
+                self.assertEqual(handle.read().count('INSERT INTO "users"'), 5)
+
+            write_dataset(schema, directory, 'jsonl')
+            with open(os.path.join(directory, 'users.jsonl')) as handle:
+                records = [json.loads(line) for line in handle]
+            self.assertEqual(records[-1]['id'], 30)
+
+
+if __name__ == '__main__':
+    unittest.main()
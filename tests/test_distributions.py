@@ -0,0 +1,135 @@
+import unittest
+import random
+from collections import Counter
+from statistics import mean, median
+import sys
+sys.path.insert(0, 'src')
+
+import distributions
+from distributions import parse_distribution, is_distribution, sample, sample_many
+from generators import (
+    random_number,
+    random_number_batch,
+    random_timestamp,
+    random_timestamp_batch,
+)
+
+
+class TestParseDistribution(unittest.TestCase):
+    """Test distribution spec parsing"""
+
+    def test_default_is_uniform(self):
+        self.assertEqual(parse_distribution(None), ('uniform', None))
+
+    def test_parameter_and_alias(self):
+        self.assertEqual(parse_distribution('exp:30'), ('exponential', 30.0))
+        self.assertEqual(parse_distribution('Zipf:1.2'), ('zipf', 1.2))
+
+    def test_unknown_distribution(self):
+        with self.assertRaises(ValueError):
+            parse_distribution('poisson')
+        self.assertFalse(is_distribution('10'))
+        self.assertTrue(is_distribution('lognormal'))
+
+    def test_invalid_parameters(self):
+        for spec in ('exp:0', 'normal:0', 'lognormal:0', 'zipf:-1', 'exp:nan', 'normal:inf', 'exp:x'):
+            with self.subTest(spec=spec):
+                with self.assertRaises(ValueError):
+                    parse_distribution(spec)
+                self.assertFalse(is_distribution(spec))
+
+
+class TestSamplers(unittest.TestCase):
+    """Test that samplers stay in range and have the expected shape"""
+
+    def draw(self, dist, low=1, high=1000, count=20000):
+        return sample_many(dist, low, high, count, random.Random(3))
+
+    def test_all_distributions_stay_in_range(self):
+        for dist in distributions.DISTRIBUTIONS:
+            with self.subTest(dist=dist):
+                values = self.draw(dist, 10, 20, 2000)
+                self.assertGreaterEqual(min(values), 10)
+                self.assertLessEqual(max(values), 20)
+                self.assertTrue(10 <= sample(dist, 10, 20) <= 20)
+
+    def test_uniform_mean(self):
+        self.assertAlmostEqual(mean(self.draw('uniform')), 500.5, delta=10)
+
+    def test_zipf_favours_low_ranks(self):
+        counts = Counter(self.draw('zipf'))
+        self.assertGreater(counts[1], counts[2])
+        self.assertGreater(counts[2], counts[10])
+
+    def test_zipf_large_range_uses_power_law(self):
+        values = self.draw('zipf', 1, 10**9, 5000)
+        self.assertLess(median(values), 10**6)
+
+    def test_normal_is_centred(self):
+        values = self.draw('normal')
+        self.assertAlmostEqual(mean(values), 500, delta=10)
+        self.assertAlmostEqual(median(values), 500, delta=15)
+
+    def test_exponential_mean_parameter(self):
+        self.assertAlmostEqual(mean(self.draw('exponential:50')), 51, delta=3)
+
+    def test_lognormal_is_right_skewed(self):
+        values = self.draw('lognormal')
+        self.assertLess(median(values), mean(values))
+
+    @unittest.skipIf(distributions.np is None, 'NumPy not installed')
+    def test_ranges_wider_than_int64(self):
+        count = distributions.NUMPY_THRESHOLD * 2
+        for low, high in ((0, 10**20 - 1), (1, 10**30), (10**30, 10**30 + 5), (-(2**63), 2**63)):
+            for dist in ('uniform', 'zipf', 'exponential'):
+                with self.subTest(low=low, high=high, dist=dist):
+                    values = self.draw(dist, low, high, count)
+                    self.assertEqual(len(values), count)
+                    self.assertTrue(all(low <= v <= high for v in values))
+
+    def test_uniform_single_values_are_exact(self):
+        # Beyond 2**53 a float-scaled draw would leave the low bits zero
+        rng = random.Random(5)
+        values = [sample('uniform', 0, 10**20 - 1, rng) for _ in range(200)]
+        self.assertLess(sum(v % 16 == 0 for v in values), 50)
+        self.assertTrue(all(0 <= v < 10**20 for v in values))
+
+    def test_single_value_range(self):
+        self.assertEqual(set(self.draw('zipf', 7, 7, 100)), {7})
+
+
+class TestDistributionGenerators(unittest.TestCase):
+    """Test num and timestamp with ranges and distributions"""
+
+    def test_number_range(self):
+        for _ in range(50):
+            self.assertTrue(5 <= int(random_number(start='5', end='9')) <= 9)
+
+    def test_number_length_with_distribution(self):
+        result = random_number(6, dist='zipf')
+        self.assertEqual(len(result), 6)
+        self.assertTrue(result.isdigit())
+
+    def test_number_batch(self):
+        values = random_number_batch(100, start=1, end=3, dist='normal')
+        self.assertEqual(len(values), 100)
+        self.assertTrue(set(values) <= {'1', '2', '3'})
+        self.assertTrue(all(len(v) == 4 for v in random_number_batch(10, length=4)))
+
+    def test_long_number_batch(self):
+        # 20 digits span more than int64, with or without NumPy installed
+        values = random_number_batch(2000, length=20)
+        self.assertTrue(all(len(v) == 20 and v.isdigit() for v in values))
+
+    def test_timestamp_distribution(self):
+        result = int(random_timestamp('1000', '2000', dist='exp'))
+        self.assertTrue(1000 <= result <= 2000)
+
+    def test_timestamp_batch(self):
+        values = random_timestamp_batch(50, '1000', '2000', dist='zipf')
+        self.assertEqual(len(values), 50)
+        self.assertTrue(all(1000 <= int(v) <= 2000 for v in values))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,9 @@
 import unittest
+import os
+import random
 import re
+import threading
+import uuid
 from datetime import datetime
 import sys
 sys.path.insert(0, 'src')
@@ -10,6 +14,11 @@ from generators import (
     random_imei,
     random_unit_number,
     random_uuid,
+    random_uuid_batch,
+    random_uuid7,
+    random_uuid7_batch,
+    random_ulid,
+    random_ulid_batch,
     random_number,
     random_ipv4,
     random_ipv6,
@@ -29,6 +38,20 @@ from generators import (
     random_lorem,
     random_username,
     random_password,
+    random_password_batch,
+    random_imei_batch,
+    random_isbn_batch,
+    random_ipv6_batch,
+    random_hex_color_batch,
+    random_api_key_batch,
+    random_hash_batch,
+    random_string_batch,
+    random_username_batch,
+    random_email_batch,
+    current_rng,
+    reseed,
+    use_rng,
+    AMBIGUOUS_CHARS,
 )
 
 
@@ -76,6 +99,43 @@ class TestBasicGenerators(unittest.TestCase):
         self.assertEqual(len(results), len(set(results)))
 
 
+class TestUuidGenerators(unittest.TestCase):
+    """Test batch UUIDs and time-ordered identifiers"""
+
+    def test_uuid_batch_is_valid_uuid4(self):
+        for value in random_uuid_batch(500):
+            parsed = uuid.UUID(value)
+            self.assertEqual(parsed.version, 4)
+            self.assertEqual(parsed.variant, uuid.RFC_4122)
+            self.assertEqual(str(parsed), value)
+
+    def test_uuid_batch_uniqueness(self):
+        results = random_uuid_batch(1000)
+        self.assertEqual(len(set(results)), 1000)
+
+    def test_uuid7_format(self):
+        parsed = uuid.UUID(random_uuid7())
+        self.assertEqual(parsed.version, 7)
+        self.assertEqual(parsed.variant, uuid.RFC_4122)
+
+    def test_uuid7_is_monotonic(self):
+        results = random_uuid7_batch(5000) + random_uuid7_batch(5000)
+        self.assertEqual(results, sorted(results))
+        self.assertEqual(len(set(results)), len(results))
+
+    def test_uuid7_timestamp(self):
+        ms = int(random_uuid7().replace('-', '')[:12], 16)
+        self.assertAlmostEqual(ms / 1000, datetime.now().timestamp(), delta=60)
+
+    def test_ulid_format(self):
+        self.assertRegex(random_ulid(), r'^[0-7][0-9A-HJKMNP-TV-Z]{25}$')
+
+    def test_ulid_is_monotonic(self):
+        results = random_ulid_batch(5000) + [random_ulid() for _ in range(100)]
+        self.assertEqual(results, sorted(results))
+        self.assertEqual(len(set(results)), len(results))
+
+
 class TestChecksumGenerators(unittest.TestCase):
     """Test generators with checksums"""
 
@@ -126,6 +186,50 @@ class TestChecksumGenerators(unittest.TestCase):
         self.assertIn(result[3], 'UJZ')
 
 
+class TestFixedWidthBatches(unittest.TestCase):
+    """Test table-driven batch versions of fixed-width generators"""
+
+    def test_imei_batch_luhn(self):
+        for imei in random_imei_batch(500):
+            digits = [int(d) for d in imei]
+            tmp = []
+            for i, digit in enumerate(digits[:-1]):
+                if i % 2:
+                    digit = digit * 2
+                tmp.extend(divmod(digit, 10))
+            self.assertEqual(digits[-1], (sum(tmp) * 9) % 10)
+        self.assertEqual(len(random_imei_batch(1, 10)[0]), 11)
+
+    def test_isbn_batch_checksum(self):
+        for isbn in random_isbn_batch(500):
+            self.assertRegex(isbn, r'^978\d{10}$')
+            digits = [int(d) for d in isbn]
+            calculated = (10 - sum((i % 2 * 2 + 1) * d for i, d in enumerate(digits[:-1])) % 10) % 10
+            self.assertEqual(digits[-1], calculated)
+
+    def test_hex_batches(self):
+        self.assertTrue(all(re.match(r'^[a-f0-9]{64}$', h) for h in random_hash_batch(50)))
+        self.assertTrue(all(re.match(r'^[a-f0-9]{7}$', k) for k in random_api_key_batch(50, 7)))
+        self.assertTrue(all(re.match(r'^#[A-F0-9]{6}$', c) for c in random_hex_color_batch(50)))
+        for address in random_ipv6_batch(50):
+            self.assertRegex(address, r'^([a-f0-9]{4}:){7}[a-f0-9]{4}$')
+
+    def test_string_batches(self):
+        self.assertTrue(all(re.match(r'^[a-zA-Z]{12}$', v) for v in random_string_batch(200, 12)))
+        self.assertTrue(all(re.match(r'^[a-z0-9]{8}$', v) for v in random_username_batch(200, 8)))
+        for email in random_email_batch(200, 6):
+            self.assertRegex(email, r'^[a-z]{6}@[a-z]{7}\.com$')
+        weighted = random_email_batch(50, 5, domains={'example.org': 1})
+        self.assertTrue(all(email.endswith('@example.org') for email in weighted))
+
+    def test_batch_sizes(self):
+        for batch in (random_hash_batch, random_ipv6_batch, random_isbn_batch, random_imei_batch,
+                      random_string_batch, random_email_batch):
+            with self.subTest(batch=batch.__name__):
+                self.assertEqual(len(batch(1234)), 1234)
+                self.assertEqual(batch(0), [])
+
+
 class TestNetworkGenerators(unittest.TestCase):
     """Test network-related generators"""
 
@@ -216,6 +320,65 @@ class TestIdentityGenerators(unittest.TestCase):
         self.assertFalse(any(c in special_chars for c in result))
 
 
+class TestPasswordPolicies(unittest.TestCase):
+    """Test constructive password policies"""
+
+    special_chars = set('!"#$%&\'()*+,-./:;<=>?@[\\]^_`{|}~')
+
+    def test_every_class_is_guaranteed(self):
+        for result in random_password_batch(200, 4, include_special=True):
+            self.assertTrue(any(c.islower() for c in result))
+            self.assertTrue(any(c.isupper() for c in result))
+            self.assertTrue(any(c.isdigit() for c in result))
+            self.assertTrue(any(c in self.special_chars for c in result))
+
+    def test_minimum_counts(self):
+        for result in random_password_batch(50, 12, min_upper=3, min_digits=4):
+            self.assertEqual(len(result), 12)
+            self.assertGreaterEqual(sum(c.isupper() for c in result), 3)
+            self.assertGreaterEqual(sum(c.isdigit() for c in result), 4)
+
+    def test_zero_minimum_allows_missing_class(self):
+        result = random_password(8, min_lower=0, min_upper=0, min_digits=8)
+        self.assertTrue(result.isdigit())
+
+    def test_exclude_ambiguous(self):
+        for result in random_password_batch(100, 32, include_special=True, exclude_ambiguous=True):
+            self.assertFalse(set(result) & set(AMBIGUOUS_CHARS))
+
+    def test_custom_symbols(self):
+        result = random_password(30, symbols='#!', min_special=5)
+        specials = [c for c in result if c in self.special_chars]
+        self.assertGreaterEqual(len(specials), 5)
+        self.assertTrue(set(specials) <= {'#', '!'})
+
+    def test_required_chars_are_shuffled(self):
+        # Required characters should not always sit at the front
+        firsts = {p[0] for p in random_password_batch(200, 16, min_digits=1)}
+        self.assertTrue(any(c.isalpha() for c in firsts))
+
+    def test_short_passwords_without_explicit_minimums(self):
+        # Too short for one of each class: the implicit minimum is dropped
+        self.assertEqual(len(random_password(2)), 2)
+        self.assertEqual(len(random_password(3, True)), 3)
+        self.assertEqual(random_password(0), '')
+        self.assertEqual(len(random_password(2, min_digits=2)), 2)
+        self.assertTrue(random_password(2, min_digits=2).isdigit())
+
+    def test_impossible_policy(self):
+        with self.assertRaises(ValueError):
+            random_password(4, min_digits=5)
+        with self.assertRaises(ValueError):
+            random_password(8, symbols='')
+        with self.assertRaisesRegex(ValueError, 'ASCII'):
+            random_password(8, symbols='€$')
+
+    def test_batch_size(self):
+        results = random_password_batch(1000, 10)
+        self.assertEqual(len(results), 1000)
+        self.assertEqual(len(set(results)), 1000)
+
+
 class TestCommunicationGenerators(unittest.TestCase):
     """Test communication-related generators"""
 
@@ -371,5 +534,60 @@ class TestGeneratorConsistency(unittest.TestCase):
                     f"{generator.__name__} produced identical values")
 
 
+class TestThreadRng(unittest.TestCase):
+    """Test per-thread RNG instances"""
+
+    def _thread_rng(self):
+        found = []
+        thread = threading.Thread(target=lambda: found.append(current_rng()))
+        thread.start()
+        thread.join()
+        return found[0]
+
+    def test_each_thread_has_its_own_rng(self):
+        mine = current_rng()
+        self.assertIsInstance(mine, random.Random)
+        self.assertIs(current_rng(), mine)
+        self.assertIsNot(self._thread_rng(), mine)
+
+    def test_reseed(self):
+        before = current_rng()
+        reseed()
+        self.assertIsNot(current_rng(), before)
+
+    def test_override_wins(self):
+        seeded = random.Random(7)
+        with use_rng(seeded):
+            self.assertIs(current_rng(), seeded)
+        self.assertIsNot(current_rng(), seeded)
+
+    def test_threads_draw_independent_values(self):
+        results = {}
+
+        def work(index):
+            results[index] = random_hash()
+
+        threads = [threading.Thread(target=work, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(set(results.values())), 8)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), "requires os.fork")
+    def test_forked_child_is_reseeded(self):
+        read, write = os.pipe()
+        current_rng()
+        pid = os.fork()
+        if pid == 0:
+            os.write(write, repr(current_rng().random()).encode())
+            os._exit(0)
+        os.waitpid(pid, 0)
+        child = os.read(read, 64).decode()
+        os.close(read)
+        os.close(write)
+        self.assertNotEqual(child, repr(current_rng().random()))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,143 @@
+import unittest
+import atexit
+import json
+import os
+import tempfile
+import sys
+sys.path.insert(0, 'src')
+
+import instrument
+from instrument import Recorder, dump, install, modes, output_path
+
+
+def _single(name, arg1=None):
+    return f"{name}-{arg1}"
+
+
+def _batch(name, count, arg1=None):
+    return [name] * count
+
+
+class TestModes(unittest.TestCase):
+    """Test parsing of RANDOMER_PROFILE"""
+
+    def test_disabled(self):
+        self.assertEqual(modes(''), set())
+        self.assertEqual(modes('0'), set())
+        self.assertEqual(modes('off'), set())
+
+    def test_enabled(self):
+        self.assertEqual(modes('1'), {'timing'})
+        self.assertEqual(modes('cprofile, tracemalloc'), {'timing', 'cprofile', 'tracemalloc'})
+
+
+class TestRecorder(unittest.TestCase):
+    """Test timing wrappers and the report"""
+
+    def test_plans_and_generators(self):
+        recorder = Recorder()
+        single = recorder.wrap(_single)
+        batch = recorder.wrap(_batch, batch=True)
+        self.assertEqual(single('email', '12'), 'email-12')
+        single('email', arg1='8')
+        self.assertEqual(batch('uuid', 50), ['uuid'] * 50)
+
+        report = recorder.report()
+        self.assertEqual(report['generators']['email']['calls'], 2)
+        self.assertEqual(report['generators']['uuid']['values'], 50)
+        self.assertEqual(set(report['plans']), {'email 12', 'email 8', 'uuid'})
+        stats = report['plans']['uuid']
+        self.assertLessEqual(stats['p50_ms'], stats['p99_ms'])
+
+    def test_percentiles(self):
+        recorder = Recorder()
+        for ms in range(1, 101):
+            recorder.record('num', (), ms / 1000)
+        stats = recorder.report()['generators']['num']
+        self.assertEqual(stats['p50_ms'], 51)
+        self.assertEqual(stats['p99_ms'], 100)
+        self.assertEqual(stats['total_ms'], 5050)
+
+    def test_cprofile(self):
+        recorder = Recorder({'timing', 'cprofile'})
+        recorder.wrap(_batch, batch=True)('hash', 10)
+        profile = recorder.report()['cprofile']
+        self.assertTrue(any('_batch' in row['function'] for row in profile))
+
+
+class TestInstall(unittest.TestCase):
+    """Test wrapping a registry namespace"""
+
+    def test_disabled_leaves_functions_untouched(self):
+        namespace = {'call_generator': _single, 'generate_batch': _batch}
+        self.assertIsNone(install(namespace, selected=()))
+        self.assertIs(namespace['call_generator'], _single)
+        self.assertIs(namespace['generate_batch'], _batch)
+
+    def test_enabled_wraps(self):
+        namespace = {'call_generator': _single, 'generate_batch': _batch}
+        recorder = install(namespace, selected={'timing'})
+        atexit.unregister(dump)
+        namespace['generate_batch']('ipv4', 3)
+        self.assertEqual(recorder.report()['generators']['ipv4']['values'], 3)
+
+    def test_main_registry_is_unwrapped_by_default(self):
+        import main
+        if not modes():
+            self.assertEqual(main.generate_batch.__module__, 'main')
+            self.assertFalse(hasattr(main.generate_batch, '__wrapped__'))
+
+
+class TestOutput(unittest.TestCase):
+    """Test where and how the report is written"""
+
+    def setUp(self):
+        self.environ = dict(os.environ)
+
+    def tearDown(self):
+        os.environ.clear()
+        os.environ.update(self.environ)
+
+    def test_output_path(self):
+        os.environ.pop(instrument.OUTPUT_ENV, None)
+        os.environ.pop('alfred_workflow_cache', None)
+        self.assertIsNone(output_path())
+        os.environ['alfred_workflow_cache'] = '/tmp/cache'
+        self.assertEqual(output_path(), '/tmp/cache/profile.jsonl')
+        os.environ[instrument.OUTPUT_ENV] = '-'
+        self.assertIsNone(output_path())
+
+    def test_dump_json(self):
+        recorder = Recorder()
+        recorder.record('uuid', (), 0.001)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'cache', 'profile.json')
+            dump(recorder, path)
+            with open(path) as handle:
+                report = json.load(handle)
+        self.assertEqual(report['generators']['uuid']['calls'], 1)
+
+    def test_dump_appends_json_lines(self):
+        recorder = Recorder()
+        recorder.record('uuid', (), 0.001)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'profile.jsonl')
+            for _ in range(3):
+                dump(recorder, path)
+            with open(path) as handle:
+                reports = [json.loads(line) for line in handle]
+            self.assertEqual(len(reports), 3)
+            self.assertIn('time', reports[0])
+
+            # Past the size cap the log rotates to a single backup
+            with open(path, 'a') as handle:
+                handle.write(' ' * (instrument.MAX_LOG_BYTES + 1))
+            dump(recorder, path)
+            dump(recorder, path)
+            self.assertEqual(sorted(os.listdir(directory)), ['profile.jsonl', 'profile.jsonl.1'])
+            with open(path) as handle:
+                self.assertEqual(len(handle.readlines()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,17 +1,29 @@
 import unittest
+import os
 import sys
+import tempfile
+from unittest import mock
 sys.path.insert(0, 'src')
 
 from main import (
+    main,
+    split_amount,
+    write_amount,
+    format_size,
     parse_args,
     filter_and_rank_generators,
     call_generator,
+    generate_batch,
+    split_distribution,
     get_subtitle,
     GENERATORS,
+    BATCH_GENERATORS,
+    DISTRIBUTION_SUPPORT,
     LENGTH_ONLY,
     RANGE_SUPPORT,
     NO_ARGS,
     SPECIAL_PASSWORD,
+    NETWORK,
 )
 
 
@@ -102,6 +114,17 @@ class TestCallGenerator(unittest.TestCase):
         self.assertIsInstance(result, str)
         self.assertGreater(len(result), 0)
 
+    def test_call_network_generator(self):
+        self.assertTrue(call_generator('ipv4', '10.1.0.0/16').startswith('10.1.'))
+        self.assertTrue(call_generator('mac', '00:1a:2b').startswith('00:1a:2b:'))
+        self.assertEqual(len(call_generator('ipv6').split(':')), 8)
+        self.assertEqual(get_subtitle('ipv4', 'private'), 'ipv4 (in private)')
+
+    def test_call_with_default_weight_tables(self):
+        self.assertEqual(len(call_generator('email', '8', 'default').split('@')[0]), 8)
+        self.assertRegex(call_generator('phoneintl', 'default'), r'^\+\d{1,3}-')
+        self.assertEqual(get_subtitle('email', '8', 'default'), 'email (length=8, domains=default)')
+
     def test_call_length_only_generator_default(self):
         result = call_generator('string')
         self.assertEqual(len(result), 9)  # default length
@@ -119,6 +142,22 @@ class TestCallGenerator(unittest.TestCase):
         # Should be a valid date string
         self.assertIn('2024', result)
 
+    def test_call_num_with_range(self):
+        result = call_generator('num', '10', '20')
+        self.assertTrue(10 <= int(result) <= 20)
+
+    def test_call_num_with_range_and_distribution(self):
+        result = call_generator('num', '1', '1000', 'zipf')
+        self.assertTrue(1 <= int(result) <= 1000)
+
+    def test_call_num_with_length_and_distribution(self):
+        result = call_generator('num', '8', 'exp')
+        self.assertEqual(len(result), 8)
+
+    def test_call_timestamp_with_distribution_only(self):
+        result = call_generator('timestamp', 'normal')
+        self.assertTrue(result.isdigit())
+
     def test_call_password_default(self):
         result = call_generator('password')
         self.assertEqual(len(result), 16)
@@ -148,6 +187,42 @@ class TestCallGenerator(unittest.TestCase):
                 self.assertGreater(len(result), 0)
 
 
+class TestSplitDistribution(unittest.TestCase):
+    """Test trailing distribution argument handling"""
+
+    def test_no_distribution(self):
+        self.assertEqual(split_distribution('1', '10'), ('1', '10', None))
+
+    def test_trailing_distribution(self):
+        self.assertEqual(split_distribution('1', '10', 'zipf'), ('1', '10', 'zipf'))
+        self.assertEqual(split_distribution('8', 'exp:5'), ('8', None, 'exp:5'))
+        self.assertEqual(split_distribution('normal'), (None, None, 'normal'))
+
+    def test_invalid_parameter_is_not_dropped(self):
+        self.assertEqual(split_distribution('1', '100', 'exp:0'), ('1', '100', 'exp:0'))
+        with self.assertRaises(ValueError):
+            call_generator('num', '1', '100', 'exp:0')
+
+
+class TestGenerateBatch(unittest.TestCase):
+    """Test batch generation through the registry"""
+
+    def test_batch_generators_are_registered(self):
+        for name in BATCH_GENERATORS:
+            with self.subTest(generator=name):
+                self.assertIn(name, GENERATORS)
+
+    def test_generate_batch_native(self):
+        values = generate_batch('num', 20, '1', '5', 'zipf')
+        self.assertEqual(len(values), 20)
+        self.assertTrue(all(1 <= int(v) <= 5 for v in values))
+
+    def test_generate_batch_fallback(self):
+        values = generate_batch('string', 5, '12')
+        self.assertEqual(len(values), 5)
+        self.assertTrue(all(len(v) == 12 for v in values))
+
+
 class TestGetSubtitle(unittest.TestCase):
     """Test subtitle generation"""
 
@@ -163,6 +238,10 @@ class TestGetSubtitle(unittest.TestCase):
         result = get_subtitle('string', '15')
         self.assertEqual(result, 'string (length=15)')
 
+    def test_subtitle_with_distribution(self):
+        result = get_subtitle('num', '1', '100', 'zipf')
+        self.assertEqual(result, 'num (range: 1 to 100) [zipf]')
+
     def test_subtitle_range_default(self):
         result = get_subtitle('date')
         self.assertEqual(result, 'date (default)')
@@ -191,7 +270,7 @@ class TestGeneratorCategories(unittest.TestCase):
 
     def test_all_generators_categorized(self):
         """All generators should be in exactly one category"""
-        all_categories = LENGTH_ONLY | RANGE_SUPPORT | NO_ARGS | SPECIAL_PASSWORD
+        all_categories = LENGTH_ONLY | RANGE_SUPPORT | NO_ARGS | SPECIAL_PASSWORD | NETWORK
 
         for name in GENERATORS.keys():
             with self.subTest(generator=name):
@@ -200,13 +279,14 @@ class TestGeneratorCategories(unittest.TestCase):
                     name in RANGE_SUPPORT,
                     name in NO_ARGS,
                     name in SPECIAL_PASSWORD,
+                    name in NETWORK,
                 ])
                 self.assertEqual(in_categories, 1,
                     f"{name} is in {in_categories} categories, should be in exactly 1")
 
     def test_no_duplicate_categorization(self):
         """Generators should not be in multiple categories"""
-        categories = [LENGTH_ONLY, RANGE_SUPPORT, NO_ARGS, SPECIAL_PASSWORD]
+        categories = [LENGTH_ONLY, RANGE_SUPPORT, NO_ARGS, SPECIAL_PASSWORD, NETWORK]
 
         for i, cat1 in enumerate(categories):
             for cat2 in categories[i+1:]:
@@ -216,13 +296,17 @@ class TestGeneratorCategories(unittest.TestCase):
 
     def test_all_categorized_generators_exist(self):
         """All categorized generators should exist in GENERATORS"""
-        all_categories = LENGTH_ONLY | RANGE_SUPPORT | NO_ARGS | SPECIAL_PASSWORD
+        all_categories = LENGTH_ONLY | RANGE_SUPPORT | NO_ARGS | SPECIAL_PASSWORD | NETWORK
 
         for name in all_categories:
             with self.subTest(generator=name):
                 self.assertIn(name, GENERATORS,
                     f"{name} is categorized but not in GENERATORS")
 
+    def test_distribution_generators_support_ranges(self):
+        """Distributions apply to a range, so only range generators take them"""
+        self.assertTrue(DISTRIBUTION_SUPPORT <= RANGE_SUPPORT)
+
 
 class TestGeneratorConsistency(unittest.TestCase):
     """Test consistency between generators and their categories"""
@@ -309,6 +393,111 @@ class TestEdgeCases(unittest.TestCase):
                 self.assertGreater(unique, 1,
                     f"{name} produced identical results")
 
+    def test_zero_length_batches_match_single_values(self):
+        for name in ('string', 'username', 'apikey', 'imei', 'num'):
+            with self.subTest(generator=name):
+                single = call_generator(name, '0')
+                self.assertEqual(generate_batch(name, 5, '0'), [single] * 5)
+        self.assertEqual(call_generator('num', '0'), '')
+        self.assertEqual(call_generator('num', '0', 'zipf'), '')
+        self.assertTrue(all(v.startswith('@') for v in generate_batch('email', 5, '0')))
+
+    def test_zero_length_items_are_not_errors(self):
+        for name in ('string', 'username', 'email', 'apikey', 'imei', 'num'):
+            with self.subTest(generator=name):
+                workflow = FakeWorkflow([name, '0'])
+                main(workflow)
+                item, = workflow.items
+                self.assertTrue(item['valid'])
+                self.assertEqual(len(item['arg'].split('\n')), 5)
+
+
+class FakeWorkflow:
+    def __init__(self, args):
+        self.args = args
+        self.items = []
+
+    def new_item(self, **kwargs):
+        self.items.append(kwargs)
+
+
+class TestAmountMode(unittest.TestCase):
+    """Test large amounts streamed to a file"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'amount-test.txt')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_split_amount(self):
+        self.assertEqual(split_amount(['uuid', '1000']), (['uuid'], 1000))
+        self.assertEqual(split_amount(['email', '12', 'x500']), (['email', '12'], 500))
+        self.assertEqual(split_amount(['num', '1', '9', 'zipf', 'X20']), (['num', '1', '9', 'zipf'], 20))
+        # A bare number is still a length for generators that take one
+        self.assertEqual(split_amount(['email', '12']), (['email', '12'], None))
+        self.assertEqual(split_amount(['uuid']), (['uuid'], None))
+        self.assertEqual(split_amount([]), ([], None))
+
+    def test_network_amount(self):
+        self.assertEqual(split_amount(['ipv4', '500']), (['ipv4'], 500))
+        self.assertEqual(split_amount(['ipv4', '10.0.0.0/8']), (['ipv4', '10.0.0.0/8'], None))
+
+    def test_write_amount(self):
+        written, size, first = write_amount(self.path, 'uuid', 25000, chunk_size=10000)
+        with open(self.path) as handle:
+            lines = handle.read().split('\n')
+        self.assertEqual(written, 25000)
+        self.assertEqual(len(lines), 25000)
+        self.assertEqual(lines[0], first)
+        self.assertEqual(size, os.path.getsize(self.path))
+
+    def test_size_cap_keeps_whole_values(self):
+        written, size, _ = write_amount(self.path, 'hash', 1000, limit=200)
+        with open(self.path) as handle:
+            lines = handle.read().split('\n')
+        self.assertEqual(written, 3)
+        self.assertLessEqual(size, 200)
+        self.assertTrue(all(len(line) == 64 for line in lines))
+
+    def test_format_size(self):
+        self.assertEqual(format_size(512), '512 B')
+        self.assertEqual(format_size(2048), '2.0 KB')
+        self.assertEqual(format_size(3 << 20), '3.0 MB')
+
+    def test_main_item_carries_path(self):
+        workflow = FakeWorkflow(['email', '6', 'x2000'])
+        with mock.patch.dict(os.environ, {'alfred_workflow_cache': self.tmp.name}):
+            main(workflow)
+        item, = workflow.items
+        self.assertEqual(item['arg'], os.path.join(self.tmp.name, 'amount-email.txt'))
+        self.assertTrue(item['title'].endswith('…'))
+        self.assertIn('2,000', item['subtitle'])
+        with open(item['arg']) as handle:
+            self.assertEqual(len(handle.read().split('\n')), 2000)
+
+    def test_prefix_query_writes_no_files(self):
+        workflow = FakeWorkflow(['e', 'x100000'])
+        with mock.patch.dict(os.environ, {'alfred_workflow_cache': self.tmp.name}):
+            main(workflow)
+        self.assertGreater(len(workflow.items), 1)
+        self.assertEqual(os.listdir(self.tmp.name), [])
+        email = next(item for item in workflow.items if item['title'] == 'email')
+        self.assertEqual(email['autocomplete'], 'email x100000')
+        self.assertFalse(email['valid'])
+
+        # Completing to the exact name writes exactly one file
+        workflow = FakeWorkflow(email['autocomplete'].replace('100000', '100').split())
+        with mock.patch.dict(os.environ, {'alfred_workflow_cache': self.tmp.name}):
+            main(workflow)
+        self.assertEqual(os.listdir(self.tmp.name), ['amount-email.txt'])
+
+    def test_main_default_is_five_inline_values(self):
+        workflow = FakeWorkflow(['uuid'])
+        main(workflow)
+        self.assertEqual(len(workflow.items[0]['arg'].split('\n')), 5)
+
 
 if __name__ == '__main__':
     unittest.main()
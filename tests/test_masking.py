@@ -0,0 +1,91 @@
+import unittest
+import io
+import json
+import random
+import sys
+sys.path.insert(0, 'src')
+
+from masking import mask_value, parse_columns, mask_csv, mask_jsonl
+from generators import current_rng, use_rng, random_string, random_ipv4
+
+
+class TestUseRng(unittest.TestCase):
+    """Test routing generator randomness through a given RNG"""
+
+    def test_seeded_rng_is_reproducible(self):
+        with use_rng(random.Random(42)):
+            first = [random_string(), random_ipv4()]
+        with use_rng(random.Random(42)):
+            second = [random_string(), random_ipv4()]
+        self.assertEqual(first, second)
+
+    def test_previous_rng_restored(self):
+        default = current_rng()
+        outer = random.Random(1)
+        with use_rng(outer):
+            with use_rng(random.Random(2)):
+                pass
+            self.assertIs(current_rng(), outer)
+        self.assertIs(current_rng(), default)
+
+
+class TestMaskValue(unittest.TestCase):
+    """Test deterministic pseudonymization"""
+
+    def test_same_input_same_output(self):
+        first = mask_value('email', 'jane.doe@corp.example', 'secret')
+        second = mask_value('email', 'jane.doe@corp.example', 'secret')
+        self.assertEqual(first, second)
+
+    def test_key_changes_output(self):
+        first = mask_value('username', 'janedoe', 'one')
+        second = mask_value('username', 'janedoe', 'two')
+        self.assertNotEqual(first, second)
+
+    def test_shapes(self):
+        email = mask_value('email', 'jane.doe@corp.example', 'k')
+        self.assertEqual(len(email.split('@')[0]), len('jane.doe'))
+        self.assertEqual(len(mask_value('username', 'abc123', 'k')), 6)
+        self.assertRegex(mask_value('phone', '(555) 010-9999', 'k'), r'^\(\d{3}\) \d{3}-\d{4}$')
+        self.assertRegex(mask_value('ipv4', '10.1.2.3', 'k'), r'^\d+\.\d+\.\d+\.\d+$')
+
+    def test_unsupported_generator(self):
+        with self.assertRaises(ValueError):
+            mask_value('uuid', 'x', 'k')
+
+    def test_parse_columns(self):
+        self.assertEqual(parse_columns(['email', 'contact=phone']),
+                         {'email': 'email', 'contact': 'phone'})
+
+
+class TestMaskStreams(unittest.TestCase):
+    """Test CSV and JSONL column rewriting"""
+
+    def test_mask_csv(self):
+        source = io.StringIO('id,email,note\n1,a@b.com,x\n2,c@d.com,y\n3,a@b.com,z\n')
+        target = io.StringIO()
+        rows = mask_csv(source, target, {'email': 'email'}, 'k', chunk_size=2)
+        self.assertEqual(rows, 3)
+        lines = [line.split(',') for line in target.getvalue().splitlines()]
+        self.assertEqual(lines[0], ['id', 'email', 'note'])
+        self.assertEqual(lines[1][1], lines[3][1])
+        self.assertNotEqual(lines[1][1], 'a@b.com')
+        self.assertEqual([line[2] for line in lines[1:]], ['x', 'y', 'z'])
+
+    def test_mask_csv_missing_column(self):
+        with self.assertRaises(ValueError):
+            mask_csv(io.StringIO('id\n1\n'), io.StringIO(), {'email': 'email'}, 'k')
+
+    def test_mask_jsonl(self):
+        source = io.StringIO('{"user": "bob", "ip": "1.2.3.4"}\n\n{"user": "bob"}\n')
+        target = io.StringIO()
+        rows = mask_jsonl(source, target, {'user': 'username', 'ip': 'ipv4'}, 'k')
+        self.assertEqual(rows, 2)
+        records = [json.loads(line) for line in target.getvalue().splitlines()]
+        self.assertEqual(records[0]['user'], records[1]['user'])
+        self.assertEqual(len(records[0]['user']), 3)
+        self.assertNotIn('ip', records[1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+import unittest
+import os
+import re
+import tempfile
+import sys
+sys.path.insert(0, 'src')
+
+from main import generate_batch
+from mmapwriter import FIXED_WIDTH, record_width, write_fixed, read_record
+
+
+class TestRecordWidth(unittest.TestCase):
+    """Test fixed-width detection"""
+
+    def test_widths(self):
+        self.assertEqual(record_width('uuid'), 36)
+        self.assertEqual(record_width('hash'), 64)
+        self.assertEqual(record_width('apikey', '20'), 20)
+        self.assertEqual(record_width('imei', '14'), 15)
+
+    def test_all_fixed_width_generators_are_fixed(self):
+        for name in FIXED_WIDTH:
+            with self.subTest(generator=name):
+                width = record_width(name)
+                self.assertEqual({len(v) for v in generate_batch(name, 200)}, {width})
+
+    def test_variable_width_rejected(self):
+        with self.assertRaises(ValueError):
+            record_width('email')
+
+
+class TestWriteFixed(unittest.TestCase):
+    """Test mmap-filled fixed-width files"""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_single_process(self):
+        width = write_fixed(self.path, 'isbn', 1000, workers=1, chunk_size=300)
+        self.assertEqual(os.path.getsize(self.path), 1000 * (width + 1))
+        with open(self.path) as handle:
+            lines = handle.read().splitlines()
+        self.assertEqual(len(lines), 1000)
+        self.assertTrue(all(re.match(r'^978\d{10}$', line) for line in lines))
+        self.assertEqual(read_record(self.path, 999, width), lines[999])
+
+    def test_parallel_slices(self):
+        width = write_fixed(self.path, 'uuid', 5000, workers=3, chunk_size=1000)
+        with open(self.path) as handle:
+            lines = handle.read().splitlines()
+        self.assertEqual(len(lines), 5000)
+        # Each worker reseeds, so slices never repeat each other
+        self.assertEqual(len(set(lines)), 5000)
+        self.assertEqual(read_record(self.path, 2500, width), lines[2500])
+
+    def test_empty(self):
+        write_fixed(self.path, 'hash', 0)
+        self.assertEqual(os.path.getsize(self.path), 0)
+
+    def test_read_out_of_range(self):
+        width = write_fixed(self.path, 'color', 3)
+        with self.assertRaises(IndexError):
+            read_record(self.path, 3, width)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+import ipaddress
+import random
+import re
+import sys
+sys.path.insert(0, 'src')
+
+from network import AddressSpace, format_ipv4, format_ipv6, format_mac, ip_space, mac_space
+from generators import (
+    random_ipv4,
+    random_ipv4_batch,
+    random_ipv6,
+    random_ipv6_batch,
+    random_mac,
+    random_mac_batch,
+)
+
+MAC = re.compile(r'^([0-9a-f]{2}:){5}[0-9a-f]{2}$')
+
+
+class TestFormatting(unittest.TestCase):
+    """Test table-driven address formatting"""
+
+    def test_ipv4(self):
+        self.assertEqual(format_ipv4(bytes([10, 0, 255, 7, 1, 2, 3, 4])), ['10.0.255.7', '1.2.3.4'])
+
+    def test_ipv6(self):
+        raw = ipaddress.ip_address('2001:db8::1').packed
+        self.assertEqual(format_ipv6(raw), ['2001:0db8:0000:0000:0000:0000:0000:0001'])
+
+    def test_mac(self):
+        self.assertEqual(format_mac(bytes([0, 26, 43, 255, 1, 16])), ['00:1a:2b:ff:01:10'])
+
+
+class TestAddressSpaces(unittest.TestCase):
+    """Test CIDR, scope and prefix parsing and sampling"""
+
+    def test_cidr(self):
+        network = ipaddress.ip_network('10.20.0.0/14')
+        for address in random_ipv4_batch(2000, '10.20.0.0/14'):
+            self.assertIn(ipaddress.ip_address(address), network)
+        self.assertIn(ipaddress.ip_address(random_ipv4('192.168.1.0/24')), ipaddress.ip_network('192.168.1.0/24'))
+
+    def test_host_bits_ignored(self):
+        self.assertTrue(random_ipv4('10.1.2.3/16').startswith('10.1.'))
+
+    def test_single_host(self):
+        self.assertEqual(random_ipv4_batch(3, '8.8.8.8/32'), ['8.8.8.8'] * 3)
+
+    def test_ipv6_cidr(self):
+        network = ipaddress.ip_network('2001:db8::/32')
+        for address in random_ipv6_batch(1000, '2001:db8::/32') + [random_ipv6('2001:db8::/32')]:
+            self.assertIn(ipaddress.ip_address(address), network)
+
+    def test_version_mismatch(self):
+        with self.assertRaises(ValueError):
+            random_ipv4('2001:db8::/32')
+        with self.assertRaises(ValueError):
+            random_ipv6('10.0.0.0/8')
+        with self.assertRaises(ValueError):
+            random_ipv4('not-a-network')
+
+    def test_private(self):
+        addresses = random_ipv4_batch(3000, 'private') + [random_ipv4('private') for _ in range(100)]
+        self.assertTrue(all(ipaddress.ip_address(a).is_private for a in addresses))
+        # All three blocks appear, roughly in proportion to their size
+        self.assertTrue(any(a.startswith('10.') for a in addresses))
+        self.assertTrue(all(ipaddress.ip_address(a) in ipaddress.ip_network('fc00::/7')
+                            for a in random_ipv6_batch(200, 'private')))
+
+    def test_public(self):
+        addresses = random_ipv4_batch(5000, 'public') + [random_ipv4('PUBLIC') for _ in range(200)]
+        self.assertEqual(len(addresses), 5200)
+        for address in map(ipaddress.ip_address, addresses):
+            self.assertTrue(address.is_global and not address.is_multicast, address)
+        for address in map(ipaddress.ip_address, random_ipv6_batch(500, 'public')):
+            self.assertTrue(address.is_global, address)
+
+    def test_full_space_unchanged_format(self):
+        self.assertTrue(all(len(a.split('.')) == 4 for a in random_ipv4_batch(100)))
+        self.assertTrue(all(re.match(r'^([0-9a-f]{4}:){7}[0-9a-f]{4}$', a) for a in random_ipv6_batch(100)))
+
+    def test_exclusions(self):
+        space = AddressSpace(8, [(0, 255)], [(0, 127), (200, 255)])
+        rng = random.Random(1)
+        self.assertTrue(all(128 <= space.sample(rng) < 200 for _ in range(500)))
+        raw = space.sample_bytes(500, lambda n: bytes(rng.getrandbits(8) for _ in range(n)), rng)
+        self.assertEqual(len(raw), 500)
+        self.assertTrue(all(128 <= b < 200 for b in raw))
+
+    def test_spaces_are_cached(self):
+        self.assertIs(ip_space(4, '10.0.0.0/8'), ip_space(4, '10.0.0.0/8'))
+
+
+class TestMac(unittest.TestCase):
+    """Test MAC address generation"""
+
+    def test_unicast(self):
+        for mac in random_mac_batch(500) + [random_mac()]:
+            self.assertRegex(mac, MAC)
+            self.assertEqual(int(mac[:2], 16) & 1, 0)
+
+    def test_local_and_universal(self):
+        self.assertTrue(all(int(m[:2], 16) & 3 == 2 for m in random_mac_batch(200, 'local')))
+        self.assertTrue(all(int(m[:2], 16) & 3 == 0 for m in random_mac_batch(200, 'universal')))
+
+    def test_prefix(self):
+        self.assertTrue(all(m.startswith('00:1a:2b:') for m in random_mac_batch(100, '00-1A-2B')))
+        self.assertTrue(random_mac('001a2b3c').startswith('00:1a:2b:3c:'))
+
+    def test_invalid_prefix(self):
+        with self.assertRaises(ValueError):
+            mac_space('abc')
+        with self.assertRaises(ValueError):
+            mac_space('zz:zz')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+import unittest
+import random
+import re
+import sys
+from concurrent.futures import ThreadPoolExecutor
+sys.path.insert(0, 'src')
+
+from generators import use_rng
+from parallel import generate_parallel, split
+
+
+class TestSplit(unittest.TestCase):
+    """Test chunking of a batch"""
+
+    def test_split(self):
+        self.assertEqual(split(25, 10), [10, 10, 5])
+        self.assertEqual(split(10, 10), [10])
+        self.assertEqual(split(0, 10), [])
+
+
+class TestGenerateParallel(unittest.TestCase):
+    """Test thread-pool batch generation"""
+
+    def test_count_and_format(self):
+        values = generate_parallel('uuid', 2500, threads=4, chunk_size=300)
+        self.assertEqual(len(values), 2500)
+        self.assertEqual(len(set(values)), 2500)
+
+    def test_arguments(self):
+        values = generate_parallel('num', 1000, '5', '7', threads=3, chunk_size=100)
+        self.assertEqual(set(values), {'5', '6', '7'})
+        emails = generate_parallel('email', 50, '4', chunk_size=10)
+        self.assertTrue(all(re.match(r'^[a-z]{4}@', email) for email in emails))
+
+    def test_ordered_chunks_with_shared_executor(self):
+        with ThreadPoolExecutor(3) as pool:
+            values = generate_parallel('timestamp', 900, '1000', '2000', chunk_size=100, executor=pool)
+        self.assertEqual(len(values), 900)
+
+    def test_seeded_output_ignores_thread_count(self):
+        results = []
+        for threads in (1, 4):
+            with use_rng(random.Random(7)):
+                results.append(generate_parallel('num', 1000, '1', '10000', threads=threads, chunk_size=100))
+        self.assertEqual(results[0], results[1])
+
+    def test_single_chunk(self):
+        self.assertEqual(len(generate_parallel('hash', 5)), 5)
+        self.assertEqual(generate_parallel('hash', 0), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,140 @@
+import unittest
+import os
+import sys
+import tempfile
+from unittest import mock
+sys.path.insert(0, 'src')
+
+import main
+import plugins
+from plugins import LazyGenerator, discover, parse_declarations
+
+PLUGIN = '''
+import random
+
+RANDOMER_GENERATORS = {
+    "dice": {"function": "roll", "batch": "roll_batch", "args": "length", "description": "Dice rolls"},
+    "coin": {"function": "flip"},
+}
+
+IMPORTED = True
+
+
+def roll(length=9):
+    return "".join(random.choice("123456") for _ in range(length))
+
+
+def roll_batch(count, length=9):
+    return [roll(length) for _ in range(count)]
+
+
+def flip():
+    return random.choice(["heads", "tails"])
+'''
+
+
+class TestParseDeclarations(unittest.TestCase):
+    """Test reading declarations without importing"""
+
+    def test_parse(self):
+        declarations = parse_declarations(PLUGIN)
+        self.assertEqual(declarations['dice']['args'], 'length')
+        self.assertEqual(declarations['coin']['args'], 'none')
+
+    def test_no_declaration(self):
+        self.assertEqual(parse_declarations('x = 1\n'), {})
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            parse_declarations('RANDOMER_GENERATORS = {"a": {"function": "f", "args": "many"}}')
+        with self.assertRaises(ValueError):
+            parse_declarations('RANDOMER_GENERATORS = {"a": {"batch": "f"}}')
+        with self.assertRaises(ValueError):
+            parse_declarations('RANDOMER_GENERATORS = make()')
+
+
+class TestDiscover(unittest.TestCase):
+    """Test the plugin directory scan and its index"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.directory = os.path.join(self.tmp.name, 'plugins')
+        self.index = os.path.join(self.tmp.name, 'cache', 'plugins.json')
+        os.makedirs(self.directory)
+        self.path = os.path.join(self.directory, 'dice.py')
+        with open(self.path, 'w') as handle:
+            handle.write(PLUGIN)
+
+    def tearDown(self):
+        plugins._modules.pop(self.path, None)
+        self.tmp.cleanup()
+
+    def test_discover_does_not_import(self):
+        found = discover(self.directory, self.index)
+        self.assertEqual(set(found), {'dice', 'coin'})
+        self.assertEqual(found['dice']['path'], self.path)
+        self.assertNotIn(self.path, plugins._modules)
+        self.assertTrue(os.path.exists(self.index))
+
+    def test_index_is_reused(self):
+        discover(self.directory, self.index)
+        with mock.patch.object(plugins, 'scan', side_effect=AssertionError('rescanned')):
+            self.assertIn('dice', discover(self.directory, self.index))
+
+    def test_index_invalidated_by_mtime(self):
+        discover(self.directory, self.index)
+        with open(self.path, 'w') as handle:
+            handle.write('RANDOMER_GENERATORS = {"coin": {"function": "flip"}}\n')
+        os.utime(self.path, ns=(0, 0))
+        self.assertEqual(set(discover(self.directory, self.index)), {'coin'})
+
+    def test_broken_plugin_is_skipped(self):
+        with open(os.path.join(self.directory, 'broken.py'), 'w') as handle:
+            handle.write('RANDOMER_GENERATORS = {\n')
+        with mock.patch('sys.stderr'):
+            self.assertEqual(set(discover(self.directory, self.index)), {'dice', 'coin'})
+
+    def test_no_index_outside_alfred(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop('alfred_workflow_cache', None)
+            self.assertIsNone(plugins.index_path())
+            with mock.patch.object(plugins.json, 'dump', side_effect=AssertionError('index written')):
+                self.assertEqual(set(discover(self.directory)), {'dice', 'coin'})
+            os.environ['alfred_workflow_cache'] = self.tmp.name
+            self.assertEqual(plugins.index_path(), os.path.join(self.tmp.name, 'plugins.json'))
+
+    def test_missing_directory(self):
+        self.assertEqual(discover(os.path.join(self.tmp.name, 'none'), self.index), {})
+
+    def test_lazy_generator(self):
+        spec = discover(self.directory, self.index)['dice']
+        roll = LazyGenerator(spec)
+        self.assertNotIn(self.path, plugins._modules)
+        self.assertRegex(roll(length=4), r'^[1-6]{4}$')
+        self.assertTrue(plugins._modules[self.path].IMPORTED)
+        self.assertEqual(len(LazyGenerator(spec, 'batch')(3, length=2)), 3)
+
+    def test_registry(self):
+        found = discover(self.directory, self.index)
+        registered = main.register_plugins(found)
+        try:
+            self.assertEqual(set(registered), {'dice', 'coin'})
+            self.assertIn('dice', main.LENGTH_ONLY)
+            self.assertIn('coin', main.NO_ARGS)
+            self.assertRegex(main.call_generator('dice', '5'), r'^[1-6]{5}$')
+            self.assertEqual(len(main.generate_batch('dice', 4, '3')), 4)
+            self.assertIn(main.call_generator('coin'), ('heads', 'tails'))
+        finally:
+            for name in registered:
+                del main.GENERATORS[name]
+                main.BATCH_GENERATORS.pop(name, None)
+                main.LENGTH_ONLY.discard(name)
+                main.NO_ARGS.discard(name)
+
+    def test_builtin_names_win(self):
+        self.assertEqual(main.register_plugins({'email': {'function': 'f', 'args': 'none'}}), {})
+        self.assertNotIn('email', main.NO_ARGS)
+
+
+if __name__ == '__main__':
+    unittest.main()
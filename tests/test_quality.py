@@ -0,0 +1,261 @@
+"""Statistical quality and throughput of the batch generators.
+
+The default sample keeps this fast enough for every test run. For a full
+validation run set RANDOMER_QUALITY_SAMPLES (``make test-quality`` uses
+10^7), which also prints values/sec for each batch path.
+"""
+import unittest
+import math
+import os
+import string
+import sys
+import time
+from collections import Counter
+sys.path.insert(0, 'src')
+
+from generators import (
+    use_rng,
+    random_string_batch,
+    random_username_batch,
+    random_email_batch,
+    random_api_key_batch,
+    random_hash_batch,
+    random_uuid_batch,
+    random_number_batch,
+    random_imei,
+    random_imei_batch,
+    random_isbn,
+    random_isbn_batch,
+    random_ipv4_batch,
+    random_mac_batch,
+    random_password_batch,
+)
+
+SAMPLES_ENV = 'RANDOMER_QUALITY_SAMPLES'
+SAMPLES = int(os.environ.get(SAMPLES_ENV) or 20000)
+CHUNK = 100000
+# One-sided z for alpha = 1e-6: dozens of tests run per suite, so keep
+# false alarms negligible while still catching real bias at large samples
+Z_CRITICAL = 4.753
+
+THROUGHPUT = {}
+
+
+def critical_value(df, z=Z_CRITICAL):
+    """Chi-square critical value (Wilson-Hilferty approximation)"""
+    return df * (1 - 2 / (9 * df) + z * math.sqrt(2 / (9 * df))) ** 3
+
+
+def chi_square(counts, cells):
+    """Goodness of fit of `counts` against a uniform distribution over `cells`"""
+    total = sum(counts[cell] for cell in cells)
+    expected = total / len(cells)
+    return sum((counts[cell] - expected) ** 2 for cell in cells) / expected
+
+
+def generate(label, batch, *args, **kwargs):
+    """Yield chunks of SAMPLES values, recording values/sec for `label`"""
+    elapsed = 0.0
+    for start in range(0, SAMPLES, CHUNK):
+        started = time.perf_counter()
+        values = batch(min(CHUNK, SAMPLES - start), *args, **kwargs)
+        elapsed += time.perf_counter() - started
+        yield values
+    THROUGHPUT[label] = SAMPLES / elapsed if elapsed else float('inf')
+
+
+def position_counts(chunks, width):
+    """Per-position character counts for fixed-width values"""
+    counts = [Counter() for _ in range(width)]
+    for values in chunks:
+        data = ''.join(values)
+        for position in range(width):
+            counts[position].update(data[position::width])
+    return counts
+
+
+def tearDownModule():
+    if os.environ.get(SAMPLES_ENV):
+        print(f'\nbatch throughput ({SAMPLES:,} values each):', file=sys.stderr)
+        for label, rate in sorted(THROUGHPUT.items()):
+            print(f'  {label:<24} {rate:>14,.0f} values/sec', file=sys.stderr)
+
+
+class QualityTestCase(unittest.TestCase):
+
+    def assertUniform(self, counts, cells, label):
+        statistic = chi_square(counts, cells)
+        limit = critical_value(len(cells) - 1)
+        self.assertLess(statistic, limit,
+            f'{label}: chi-square {statistic:.1f} over {len(cells)} cells exceeds {limit:.1f}')
+
+    def assertPositionsUniform(self, counts, cells, positions, label):
+        for position in positions:
+            with self.subTest(position=position):
+                self.assertEqual(set(counts[position]) - set(cells), set())
+                self.assertUniform(counts[position], cells, f'{label} position {position}')
+
+
+class TestCharacterUniformity(QualityTestCase):
+    """Every character position is uniform over its alphabet"""
+
+    def test_string(self):
+        counts = position_counts(generate('string', random_string_batch, 12), 12)
+        self.assertPositionsUniform(counts, string.ascii_letters, range(12), 'string')
+
+    def test_username(self):
+        counts = position_counts(generate('username', random_username_batch, 12), 12)
+        self.assertPositionsUniform(counts, string.ascii_lowercase + string.digits, range(12), 'username')
+
+    def test_email(self):
+        # "xxxxxxxx@yyyyyyy.com": 8 local characters and a 7 character domain
+        counts = position_counts(generate('email', random_email_batch, 8), 20)
+        self.assertPositionsUniform(counts, string.ascii_lowercase, [*range(8), *range(9, 16)], 'email')
+
+    def test_api_key(self):
+        counts = position_counts(generate('apikey', random_api_key_batch, 32), 32)
+        self.assertPositionsUniform(counts, '0123456789abcdef', range(32), 'apikey')
+
+    def test_hash_adjacent_pairs(self):
+        # Pairs within a byte and across a byte boundary catch correlated nibbles
+        hexdigits = '0123456789abcdef'
+        pairs = [a + b for a in hexdigits for b in hexdigits]
+        within, across = Counter(), Counter()
+        for values in generate('hash', random_hash_batch):
+            within.update(value[0:2] for value in values)
+            across.update(value[1:3] for value in values)
+        self.assertUniform(within, pairs, 'hash pair 0-1')
+        self.assertUniform(across, pairs, 'hash pair 1-2')
+
+    def test_uuid(self):
+        counts = position_counts(generate('uuid', random_uuid_batch), 36)
+        random_positions = [p for p in range(36) if p not in (8, 13, 14, 18, 19, 23)]
+        self.assertPositionsUniform(counts, '0123456789abcdef', random_positions, 'uuid')
+        self.assertEqual(set(counts[14]), {'4'})
+        self.assertPositionsUniform(counts, '89ab', [19], 'uuid variant')
+
+
+class TestDigitUniformity(QualityTestCase):
+    """Digits, octets and checksum digits are uniform"""
+
+    def test_number(self):
+        counts = position_counts(generate('num', random_number_batch, 8), 8)
+        self.assertPositionsUniform(counts, string.digits, range(8), 'num')
+
+    def test_imei(self):
+        # Body digits and the Luhn check digit are all uniform
+        counts = position_counts(generate('imei', random_imei_batch), 15)
+        self.assertPositionsUniform(counts, string.digits, range(15), 'imei')
+
+    def test_isbn(self):
+        counts = position_counts(generate('isbn', random_isbn_batch), 13)
+        self.assertEqual([set(counts[p]) for p in range(3)], [{'9'}, {'7'}, {'8'}])
+        self.assertPositionsUniform(counts, string.digits, range(3, 13), 'isbn')
+
+    def test_ipv4_octets(self):
+        counts = [Counter() for _ in range(4)]
+        for values in generate('ipv4', random_ipv4_batch):
+            for value in values:
+                for position, octet in enumerate(value.split('.')):
+                    counts[position][octet] += 1
+        self.assertPositionsUniform(counts, [str(i) for i in range(256)], range(4), 'ipv4')
+
+    def test_mac_octets(self):
+        counts = [Counter() for _ in range(6)]
+        for values in generate('mac', random_mac_batch):
+            for value in values:
+                for position, octet in enumerate(value.split(':')):
+                    counts[position][octet] += 1
+        octets = [f'{i:02x}' for i in range(256)]
+        # The first octet always has the multicast bit clear
+        self.assertPositionsUniform(counts, [o for o in octets if not int(o, 16) & 1], [0], 'mac')
+        self.assertPositionsUniform(counts, octets, range(1, 6), 'mac')
+
+
+class TestPasswordQuality(QualityTestCase):
+    """Constructive passwords: policy met, no class or position bias"""
+
+    CLASSES = (string.ascii_lowercase, string.ascii_uppercase, string.digits, string.punctuation)
+
+    def test_classes_and_positions(self):
+        length = 16
+        chars = Counter()
+        class_by_position = [Counter() for _ in range(length)]
+        class_of = {c: index for index, chars in enumerate(self.CLASSES) for c in chars}
+        for values in generate('password', random_password_batch, length, True):
+            for value in values:
+                present = {class_of[c] for c in value}
+                self.assertEqual(present, {0, 1, 2, 3}, value)
+            data = ''.join(values)
+            chars.update(data)
+            for position in range(length):
+                class_by_position[position].update(class_of[c] for c in data[position::length])
+
+        # Within each class every character is equally likely
+        for chars_in_class in self.CLASSES:
+            with self.subTest(chars=chars_in_class[:3]):
+                self.assertUniform(chars, chars_in_class, 'password class')
+
+        # The shuffle leaves every position with the same class mix
+        pooled = sum(class_by_position, Counter())
+        total = sum(pooled.values())
+        statistic = 0.0
+        for counts in class_by_position:
+            row = sum(counts.values())
+            for cls in range(4):
+                expected = row * pooled[cls] / total
+                statistic += (counts[cls] - expected) ** 2 / expected
+        self.assertLess(statistic, critical_value((length - 1) * 3), 'password class depends on position')
+
+
+class ReplayRng:
+    """RNG whose randint() replays given digits, to rerun a single-value generator"""
+
+    def __init__(self, digits):
+        self.digits = iter(digits)
+
+    def randint(self, low, high):
+        return int(next(self.digits))
+
+
+class TestChecksums(unittest.TestCase):
+    """Batch check digits match what the single-value generators compute"""
+
+    def test_imei(self):
+        for values in generate('imei (checked)', random_imei_batch):
+            for value in values:
+                with use_rng(ReplayRng(value[:14])):
+                    self.assertEqual(random_imei(), value)
+
+    def test_imei_other_lengths(self):
+        for length in (8, 15):
+            for value in random_imei_batch(1000, length):
+                with use_rng(ReplayRng(value[:length])):
+                    self.assertEqual(random_imei(length), value)
+
+    def test_isbn(self):
+        for values in generate('isbn (checked)', random_isbn_batch):
+            for value in values:
+                with use_rng(ReplayRng(value[3:12])):
+                    self.assertEqual(random_isbn(), value)
+
+
+class TestChiSquareHelpers(unittest.TestCase):
+    """The test statistics themselves"""
+
+    def test_critical_value(self):
+        # Exact 1 - 1e-6 quantiles are 44.81 (df=9) and 377.08 (df=255);
+        # the approximation errs slightly on the conservative side
+        self.assertAlmostEqual(critical_value(9), 44.81, delta=1.5)
+        self.assertAlmostEqual(critical_value(255), 377.08, delta=0.5)
+        self.assertGreater(critical_value(9), 44.81)
+
+    def test_detects_bias(self):
+        # A modulo-biased digit (256 % 10 leaves 0-5 slightly more likely)
+        counts = Counter(str(b % 10) for b in range(256) for _ in range(4000))
+        self.assertGreater(chi_square(counts, string.digits), critical_value(9))
+        self.assertEqual(chi_square(Counter(string.digits * 100), string.digits), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+import unittest
+import multiprocessing
+import os
+import re
+import sys
+sys.path.insert(0, 'src')
+
+from ringbuffer import RingBuffer, RingPool, slot_width, _produce
+
+
+def _drain(ring, count, queue):
+    queue.put(ring.take(count, timeout=10))
+
+
+def _quiet_produce(*args):
+    # The producer's traceback is expected; keep it out of the test output
+    sys.stderr = open(os.devnull, 'w')
+    _produce(*args)
+
+
+class TestRingBuffer(unittest.TestCase):
+    """Test the shared-memory ring itself"""
+
+    def setUp(self):
+        self.ring = RingBuffer(capacity=8, width=16)
+
+    def tearDown(self):
+        self.ring.close()
+
+    def test_fifo_order(self):
+        self.assertEqual(self.ring.put_many(['a', 'bb', 'ccc']), 3)
+        self.assertEqual(self.ring.take_many(2), ['a', 'bb'])
+        self.assertEqual(self.ring.take_many(5), ['ccc'])
+        self.assertEqual(self.ring.take_many(1), [])
+
+    def test_backpressure(self):
+        values = [str(i) for i in range(12)]
+        self.assertEqual(self.ring.put_many(values), 8)
+        self.assertEqual(len(self.ring), 8)
+        self.assertEqual(self.ring.put(values[8:], timeout=0.01), 0)
+        self.assertGreater(self.ring.stats()['producer_waits'], 0)
+
+    def test_wraparound(self):
+        for start in range(0, 40, 5):
+            values = [str(i) for i in range(start, start + 5)]
+            self.ring.put_many(values)
+            self.assertEqual(self.ring.take_many(5), values)
+
+    def test_unicode_values(self):
+        self.ring.put_many(['héllo', ''])
+        self.assertEqual(self.ring.take_many(2), ['héllo', ''])
+
+    def test_value_too_wide(self):
+        with self.assertRaises(ValueError):
+            self.ring.put_many(['x' * 17])
+
+    def test_take_timeout(self):
+        with self.assertRaises(TimeoutError):
+            self.ring.take(1, timeout=0.01)
+
+    def test_timeout_keeps_partial_values(self):
+        self.ring.put_many(['a', 'b'])
+        with self.assertRaises(TimeoutError) as caught:
+            self.ring.take(3, timeout=0.01)
+        self.assertEqual(caught.exception.values, ['a', 'b'])
+
+    def test_failed_producer_stops_waiting(self):
+        self.ring.put_many(['a'])
+        self.ring.mark_failed()
+        with self.assertRaises(RuntimeError) as caught:
+            self.ring.take(3)
+        self.assertEqual(caught.exception.values, ['a'])
+        self.assertTrue(self.ring.stats()['producer_failed'])
+
+    def test_dead_producer_stops_waiting(self):
+        with self.assertRaises(RuntimeError):
+            self.ring.take(1, alive=lambda: False)
+
+    def test_stats(self):
+        self.ring.put_many(['a', 'b', 'c', 'd'])
+        self.ring.take_many(1)
+        stats = self.ring.stats()
+        self.assertEqual(stats['fill'], 3)
+        self.assertEqual(stats['fill_ratio'], 3 / 8)
+        self.assertEqual((stats['produced'], stats['consumed']), (4, 1))
+
+    def test_child_process_consumer(self):
+        self.ring.put_many(['x', 'y', 'z'])
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=_drain, args=(self.ring, 3, queue))
+        process.start()
+        self.assertEqual(queue.get(timeout=10), ['x', 'y', 'z'])
+        process.join()
+        self.assertEqual(len(self.ring), 0)
+
+
+class TestRingPool(unittest.TestCase):
+    """Test producer processes filling rings from the registry"""
+
+    def test_slot_width(self):
+        self.assertEqual(slot_width('uuid'), 72)
+        self.assertGreaterEqual(slot_width('num', '1', '9'), 16)
+
+    def test_producer_error_reaches_consumer(self):
+        # A slot too narrow for a UUID makes the producer raise
+        ring = RingBuffer(capacity=8, width=4)
+        stop = multiprocessing.Event()
+        process = multiprocessing.Process(target=_quiet_produce, args=(ring, 'uuid', [], stop, 4))
+        process.start()
+        try:
+            with self.assertRaises(RuntimeError):
+                ring.take(1, timeout=10)
+        finally:
+            stop.set()
+            process.join()
+            ring.close()
+        self.assertNotEqual(process.exitcode, 0)
+
+    def test_take_generated_values(self):
+        with RingPool({'id': 'uuid', 'mail': 'email 8'}, capacity=256, batch_size=64) as pool:
+            ids = pool.take('id', 1000, timeout=10)
+            mails = pool.take('mail', 10, timeout=10)
+            stats = pool.stats()
+        self.assertEqual(len(set(ids)), 1000)
+        self.assertTrue(all(re.match(r'^[0-9a-f-]{36}$', value) for value in ids))
+        self.assertTrue(all('@' in value for value in mails))
+        self.assertEqual(stats['id']['consumed'], 1000)
+        self.assertLessEqual(stats['id']['fill'], 256)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import unittest
+import asyncio
+import json
+import re
+import sys
+sys.path.insert(0, 'src')
+
+from server import MAX_LENGTH, HTTPError, fetch, load_test, query_args, serve
+
+
+class TestQueryArgs(unittest.TestCase):
+    """Test mapping query parameters onto generator arguments"""
+
+    def test_length(self):
+        self.assertEqual(query_args('email', {'length': '12'}), ('12', None, None))
+
+    def test_range_and_distribution(self):
+        self.assertEqual(query_args('num', {'start': '1', 'end': '9', 'dist': 'zipf'}), ('1', '9', 'zipf'))
+        self.assertEqual(query_args('num', {'length': '4'}), ('4', None, None))
+
+    def test_range_needs_both_ends(self):
+        with self.assertRaises(HTTPError):
+            query_args('num', {'start': '1'})
+
+    def test_password(self):
+        self.assertEqual(query_args('password', {'length': '8', 'special': '1'}), ('8', '1', None))
+
+    def test_no_args(self):
+        self.assertEqual(query_args('uuid', {'length': '8'}), (None, None, None))
+
+    def test_length_is_capped(self):
+        with self.assertRaises(HTTPError):
+            query_args('string', {'length': str(MAX_LENGTH + 1)})
+        with self.assertRaises(HTTPError):
+            query_args('password', {'length': 'x'})
+
+
+class TestServer(unittest.IsolatedAsyncioTestCase):
+    """Test the HTTP endpoints against a live server"""
+
+    async def asyncSetUp(self):
+        ready = asyncio.get_running_loop().create_future()
+        self.task = asyncio.create_task(serve(port=0, workers=2, chunk_size=1000, ready=ready.set_result))
+        self.port = await ready
+        self.reader, self.writer = await asyncio.open_connection('127.0.0.1', self.port)
+
+    async def asyncTearDown(self):
+        self.writer.close()
+        self.task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await asyncio.wait_for(self.task, 30)
+
+    async def get(self, target):
+        return await fetch(self.reader, self.writer, 'GET', target)
+
+    async def test_values_stream_in_chunks(self):
+        status, body = await self.get('/v1/uuid?count=2500')
+        lines = body.decode().splitlines()
+        self.assertEqual(status, 200)
+        self.assertEqual(len(lines), 2500)
+        self.assertEqual(len(set(lines)), 2500)
+
+    async def test_arguments(self):
+        status, body = await self.get('/v1/num?start=5&end=7&count=200')
+        self.assertEqual(set(body.decode().split()), {'5', '6', '7'})
+        status, body = await self.get('/v1/email?length=4&count=10')
+        self.assertTrue(all(re.match(r'^[a-z]{4}@', line) for line in body.decode().splitlines()))
+
+    async def test_keep_alive(self):
+        for _ in range(3):
+            status, body = await self.get('/v1/hash')
+            self.assertEqual(status, 200)
+            self.assertEqual(len(body), 65)
+
+    async def test_generator_list(self):
+        status, body = await self.get('/v1/generators')
+        self.assertIn('email', json.loads(body))
+
+    async def test_errors(self):
+        self.assertEqual((await self.get('/v1/nope'))[0], 404)
+        self.assertEqual((await self.get('/v1/email?count=x'))[0], 400)
+        self.assertEqual((await self.get('/v1/num?start=9&end=1'))[0], 400)
+        self.assertEqual((await self.get('/v1/dataset'))[0], 405)
+        self.assertEqual((await self.get('/v1/string?length=30000000'))[0], 400)
+        self.assertEqual((await self.get('/v1/ipv4?network=nope&count=5000'))[0], 400)
+        self.assertEqual((await self.get('/v1/num?start=1&end=100&dist=exp:0'))[0], 400)
+        self.assertEqual((await self.get('/v1/num?start=1&end=100&dist=normal:5:-1'))[0], 400)
+
+    async def test_bad_content_length(self):
+        self.writer.write(b'POST /v1/dataset HTTP/1.1\r\nContent-Length: abc\r\n\r\n')
+        status = int((await self.reader.readline()).split()[1])
+        self.assertEqual(status, 400)
+
+    async def test_chunk_counts(self):
+        for count in (0, 1, 1000, 1001, 4500):
+            status, body = await self.get(f'/v1/color?count={count}')
+            self.assertEqual((status, body.count(b'\n')), (200, count))
+
+    async def test_dataset(self):
+        schema = {'tables': {
+            'users': {'rows': 3, 'columns': {'name': 'username 5'}},
+            'orders': {'parent': 'users', 'per_parent': 2, 'columns': {}},
+        }}
+        status, body = await fetch(self.reader, self.writer, 'POST', '/v1/dataset', json.dumps(schema).encode())
+        records = [json.loads(line) for line in body.decode().splitlines()]
+        self.assertEqual(status, 200)
+        self.assertEqual([r['_table'] for r in records], ['users'] * 3 + ['orders'] * 6)
+        self.assertEqual(records[-1], {'_table': 'orders', 'id': 6, 'users_id': 3})
+
+    async def test_invalid_dataset(self):
+        for tables in (
+            {'users': {'rows': 3, 'columns': {'name': 'nope'}}},
+            {'users': {'columns': {'name': 'uuid'}}},
+            {'users': {'rows': 3, 'columns': {'name': 'string abc'}}},
+        ):
+            body = json.dumps({'tables': tables}).encode()
+            status, _ = await fetch(self.reader, self.writer, 'POST', '/v1/dataset', body)
+            self.assertEqual(status, 400)
+
+    async def test_load_test(self):
+        result = await load_test('127.0.0.1', self.port, '/v1/color?count=50', requests=10, concurrency=3)
+        self.assertEqual(result['requests'], 10)
+        self.assertEqual(result['values'], 500)
+
+
+if __name__ == '__main__':
+    unittest.main()
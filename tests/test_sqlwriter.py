@@ -0,0 +1,84 @@
+import unittest
+import io
+import sqlite3
+import sys
+sys.path.insert(0, 'src')
+
+from sqlwriter import (
+    quote_identifier,
+    quote_value,
+    insert_statements,
+    copy_lines,
+    write_inserts,
+    write_copy,
+)
+
+ROWS = [(1, "O'Brien", None), (2, 'back\\slash', 3.5), (3, 'tab\there', True)]
+
+
+class TestQuoting(unittest.TestCase):
+    """Test literal and identifier quoting per dialect"""
+
+    def test_identifiers(self):
+        self.assertEqual(quote_identifier('order', 'postgresql'), '"order"')
+        self.assertEqual(quote_identifier('we"ird'), '"we""ird"')
+        self.assertEqual(quote_identifier('order', 'mysql'), '`order`')
+
+    def test_values(self):
+        self.assertEqual(quote_value(None), 'NULL')
+        self.assertEqual(quote_value(42), '42')
+        self.assertEqual(quote_value("it's"), "'it''s'")
+        self.assertEqual(quote_value(True), '1')
+        self.assertEqual(quote_value(True, 'postgresql'), 'TRUE')
+
+    def test_mysql_escapes_backslash(self):
+        self.assertEqual(quote_value('a\\b', 'mysql'), "'a\\\\b'")
+        self.assertEqual(quote_value('a\\b', 'postgresql'), "'a\\b'")
+
+
+class TestInsertStatements(unittest.TestCase):
+    """Test multi-row INSERT generation"""
+
+    def test_batching(self):
+        statements = list(insert_statements('t', ['a'], [(i,) for i in range(5)], batch_size=2))
+        self.assertEqual(len(statements), 3)
+        self.assertEqual(statements[-1], 'INSERT INTO "t" ("a") VALUES\n(4);\n')
+
+    def test_unknown_dialect(self):
+        with self.assertRaises(ValueError):
+            list(insert_statements('t', ['a'], [(1,)], 'oracle'))
+
+    def test_sqlite_round_trip(self):
+        conn = sqlite3.connect(':memory:')
+        conn.execute('CREATE TABLE t (id, name, score)')
+        for statement in insert_statements('t', ['id', 'name', 'score'], ROWS, batch_size=2):
+            conn.execute(statement)
+        loaded = conn.execute('SELECT * FROM t ORDER BY id').fetchall()
+        self.assertEqual(loaded, [(1, "O'Brien", None), (2, 'back\\slash', 3.5), (3, 'tab\there', 1)])
+
+    def test_write_inserts(self):
+        handle = io.StringIO()
+        rows = write_inserts(handle, 't', ['id', 'name', 'score'], [ROWS[:2], ROWS[2:]], 'mysql')
+        self.assertEqual(rows, 3)
+        self.assertEqual(handle.getvalue().count('INSERT INTO `t`'), 2)
+
+
+class TestCopy(unittest.TestCase):
+    """Test PostgreSQL COPY text format output"""
+
+    def test_copy_lines(self):
+        lines = list(copy_lines('t', ['id', 'name', 'score'], ROWS))
+        self.assertEqual(lines[0], 'COPY "t" ("id", "name", "score") FROM STDIN;\n')
+        self.assertEqual(lines[1], "1\tO'Brien\t\\N\n")
+        self.assertEqual(lines[2], '2\tback\\\\slash\t3.5\n')
+        self.assertEqual(lines[3], '3\ttab\\there\tTrue\n')
+        self.assertEqual(lines[-1], '\\.\n')
+
+    def test_write_copy(self):
+        handle = io.StringIO()
+        self.assertEqual(write_copy(handle, 't', ['id'], [[(1,), (2,)], [(3,)]]), 3)
+        self.assertEqual(handle.getvalue(), 'COPY "t" ("id") FROM STDIN;\n1\n2\n3\n\\.\n')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+import unittest
+import io
+import random
+import sys
+sys.path.insert(0, 'src')
+
+from text import (
+    LOREM_WORDS,
+    parse_size,
+    words,
+    sentence,
+    paragraph,
+    iter_text,
+    write_text,
+    text,
+)
+from generators import random_lorem, random_paragraph
+
+
+class TestParseSize(unittest.TestCase):
+    """Test byte size parsing"""
+
+    def test_sizes(self):
+        self.assertEqual(parse_size(100), 100)
+        self.assertEqual(parse_size('100'), 100)
+        self.assertEqual(parse_size('64KB'), 64 * 1024)
+        self.assertEqual(parse_size('10 MB'), 10 * 1024 * 1024)
+        self.assertEqual(parse_size('1.5k'), 1536)
+
+    def test_invalid_size(self):
+        with self.assertRaises(ValueError):
+            parse_size('lots')
+
+
+class TestTextUnits(unittest.TestCase):
+    """Test words, sentences and paragraphs"""
+
+    def test_words_come_from_table(self):
+        self.assertTrue(set(words(500)) <= set(LOREM_WORDS))
+
+    def test_short_words_are_more_frequent(self):
+        sample = words(20000, rng=random.Random(5))
+        self.assertGreater(sample.count('et'), sample.count('reprehenderit'))
+
+    def test_sentence_length(self):
+        result = sentence(8)
+        self.assertEqual(len(result.split()), 8)
+        self.assertTrue(result[0].isupper())
+        self.assertTrue(result.endswith('.'))
+
+    def test_empty_sentence(self):
+        self.assertEqual(sentence(0), '.')
+
+    def test_paragraph_sentences(self):
+        self.assertEqual(paragraph(4).count('.'), 4)
+
+
+class TestSizedText(unittest.TestCase):
+    """Test byte-size targeted streaming"""
+
+    def test_exact_size(self):
+        for size in (1, 100, 70000):
+            with self.subTest(size=size):
+                self.assertEqual(len(text(size)), size)
+
+    def test_chunks_are_bounded(self):
+        chunks = list(iter_text(10000, chunk_size=1024))
+        self.assertTrue(all(len(chunk) <= 1024 for chunk in chunks))
+        self.assertEqual(sum(map(len, chunks)), 10000)
+
+    def test_chunk_boundaries_keep_whole_words(self):
+        for mode in ('sentence', 'paragraph'):
+            with self.subTest(mode=mode):
+                joined = ''.join(iter_text(30000, mode, chunk_size=1000, rng=random.Random(2)))
+                # Only the very end of the text may be cut mid-word
+                tokens = joined.split()[:-1]
+                self.assertTrue(set(t.rstrip('.').lower() for t in tokens) <= set(LOREM_WORDS))
+
+    def test_write_text_streams(self):
+        buffer = io.StringIO()
+        written = write_text(buffer, '8KB', mode='sentence')
+        self.assertEqual(written, 8192)
+        self.assertEqual(len(buffer.getvalue()), 8192)
+        self.assertNotIn('\n', buffer.getvalue())
+
+    def test_paragraph_mode_separates_paragraphs(self):
+        self.assertIn('\n\n', text(5000))
+
+    def test_invalid_mode(self):
+        with self.assertRaises(ValueError):
+            text(10, mode='chapter')
+
+
+class TestTextGenerators(unittest.TestCase):
+    """Test the lorem and paragraph generators"""
+
+    def test_lorem_word_count(self):
+        self.assertEqual(len(random_lorem(12).split()), 12)
+
+    def test_paragraph_generator(self):
+        self.assertEqual(random_paragraph(3).count('.'), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
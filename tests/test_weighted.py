@@ -0,0 +1,127 @@
+import unittest
+import os
+import random
+import tempfile
+from collections import Counter
+import sys
+sys.path.insert(0, 'src')
+
+from weighted import (
+    AliasTable,
+    alias_table,
+    load_weights,
+    weighted_choice,
+    EMAIL_DOMAINS,
+    COUNTRY_CODES,
+)
+from generators import random_email, random_phone_international, random_lorem
+
+
+class TestAliasTable(unittest.TestCase):
+    """Test Vose alias method sampling"""
+
+    def test_single_value(self):
+        table = AliasTable(['only'], [3])
+        self.assertEqual(table.sample_many(10), ['only'] * 10)
+
+    def test_zero_weight_never_sampled(self):
+        table = AliasTable(['a', 'b', 'c'], [1, 0, 1])
+        self.assertNotIn('b', table.sample_many(2000))
+
+    def test_frequencies_follow_weights(self):
+        table = AliasTable(['a', 'b', 'c'], [1, 2, 7])
+        counts = Counter(table.sample_many(50000, random.Random(7)))
+        self.assertAlmostEqual(counts['a'] / 50000, 0.1, delta=0.01)
+        self.assertAlmostEqual(counts['b'] / 50000, 0.2, delta=0.01)
+        self.assertAlmostEqual(counts['c'] / 50000, 0.7, delta=0.01)
+
+    def test_seeded_rng_is_reproducible(self):
+        table = AliasTable(range(10), range(1, 11))
+        first = table.sample_many(20, random.Random(1))
+        second = table.sample_many(20, random.Random(1))
+        self.assertEqual(first, second)
+
+    def test_invalid_weights(self):
+        with self.assertRaises(ValueError):
+            AliasTable([], [])
+        with self.assertRaises(ValueError):
+            AliasTable(['a'], [-1])
+        with self.assertRaises(ValueError):
+            AliasTable(['a', 'b'], [0, 0])
+
+
+class TestWeightTables(unittest.TestCase):
+    """Test weight table sources and caching"""
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp(suffix='.csv')
+        with os.fdopen(handle, 'w') as f:
+            f.write('domain,weight\nfoo.org,1\nbar.net,3\n')
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_load_weights_skips_header(self):
+        self.assertEqual(load_weights(self.path), {'foo.org': 1.0, 'bar.net': 3.0})
+
+    def test_alias_table_is_cached(self):
+        self.assertIs(alias_table(EMAIL_DOMAINS), alias_table(EMAIL_DOMAINS))
+        self.assertIs(alias_table(self.path), alias_table(self.path))
+
+    def test_same_object_skips_rebuilding_items(self):
+        class CountingDict(dict):
+            calls = 0
+
+            def items(self):
+                CountingDict.calls += 1
+                return super().items()
+
+        weights = CountingDict({'x': 1, 'y': 2})
+        for _ in range(50):
+            weighted_choice(weights)
+        self.assertEqual(CountingDict.calls, 1)
+
+    def test_csv_changes_are_picked_up(self):
+        import weighted
+        self.assertEqual(alias_table(self.path).values, ['foo.org', 'bar.net'])
+        with open(self.path, 'w') as f:
+            f.write('baz.io,1\n')
+        os.utime(self.path, ns=(0, 0))
+        weighted._file_tables[self.path] = (0.0,) + weighted._file_tables[self.path][1:]
+        self.assertEqual(alias_table(self.path).values, ['baz.io'])
+
+    def test_pairs_and_dicts_are_equivalent(self):
+        self.assertIs(alias_table({'x': 1, 'y': 2}), alias_table([('x', 1), ('y', 2)]))
+
+    def test_weighted_choice_from_csv(self):
+        self.assertIn(weighted_choice(self.path), ('foo.org', 'bar.net'))
+
+
+class TestWeightedGenerators(unittest.TestCase):
+    """Test generators that accept weight tables"""
+
+    def test_email_with_domains(self):
+        result = random_email(8, domains=EMAIL_DOMAINS)
+        local, domain = result.split('@')
+        self.assertEqual(len(local), 8)
+        self.assertIn(domain, EMAIL_DOMAINS)
+
+    def test_phone_international_with_countries(self):
+        result = random_phone_international(countries=COUNTRY_CODES)
+        self.assertRegex(result, r'^\+\d{1,3}-\d{3}-\d{3}-\d{4}$')
+        self.assertIn(result[1:].split('-')[0], COUNTRY_CODES)
+
+    def test_default_tables(self):
+        self.assertIn(random_email(8, domains='default').split('@')[1], EMAIL_DOMAINS)
+        self.assertIn(random_phone_international(countries='default')[1:].split('-')[0], COUNTRY_CODES)
+
+    def test_lorem_with_word_weights(self):
+        result = random_lorem(5, words={'alpha': 1, 'beta': 1})
+        words = result.rstrip('.').lower().split()
+        self.assertEqual(len(words), 5)
+        self.assertTrue(set(words) <= {'alpha', 'beta'})
+        self.assertTrue(result[0].isupper())
+
+
+if __name__ == '__main__':
+    unittest.main()